@@ -4,35 +4,140 @@ State Resource Discovery - Discover state DOI resources using NAIC/USA.gov
 
 import asyncio
 import aiohttp
-import pandas as pd
+import csv
+import httpx
 from bs4 import BeautifulSoup
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 import time
 
+# Optional C-level multi-keyword matcher
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# HTTP/2 lets the HEAD probes for one DOI share a multiplexed connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+REQUEST_HEADERS = {'User-Agent': 'WyngAI/1.0 Healthcare Research Bot'}
+
+REGISTRY_PATH = "data/registry/wyng_llm_training_sources_expanded.xlsx"
+
+# Column order shared by the Excel registry and its CSV sibling
+REGISTRY_FIELDS = [
+    'Category', 'Source', 'DatasetScope', 'Format', 'HowToDownload',
+    'URL', 'AutomationNotes', 'LicenseNotes'
+]
+
+# Memoized URL helpers; anchors repeat heavily across crawled pages
+_urlparse_cached = lru_cache(maxsize=4096)(urlparse)
+_urljoin_cached = lru_cache(maxsize=4096)(urljoin)
+
+STATE_CODES = [
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+]
+
+# Heuristic resource paths probed under each priority state's DOI home
+STATE_RESOURCE_PATHS = [
+    '/laws-and-regulations',
+    '/legal',
+    '/statutes',
+    '/administrative-code',
+    '/bulletins',
+    '/orders',
+    '/external-appeal',
+    '/external-review',
+    '/independent-review',
+    '/consumer/appeals',
+    '/consumer-services',
+    '/complaints',
+    '/public-records'
+]
+
+# Link-text keyword buckets used when crawling a DOI home page
+DOI_RESOURCE_PATTERNS = {
+    'external_review': ['external review', 'independent review', 'appeals'],
+    'bulletins': ['bulletin', 'order', 'guidance'],
+    'consumer_guides': ['consumer', 'guide', 'help'],
+    'laws': ['law', 'statute', 'regulation'],
+    'filings': ['filing', 'form', 'document']
+}
+
+
+class KeywordMatcher:
+    """Matches many lowercase keywords against a string in a single pass.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and falls
+    back to plain substring tests otherwise.
+    """
+
+    def __init__(self, keywords: List[Tuple[str, object]]):
+        # First occurrence of a keyword wins, mirroring the original loop order
+        self.keywords: Dict[str, object] = {}
+        for keyword, value in keywords:
+            keyword = keyword.lower()
+            if keyword:
+                self.keywords.setdefault(keyword, value)
+
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            self.automaton = ahocorasick.Automaton()
+            for keyword, value in self.keywords.items():
+                self.automaton.add_word(keyword, value)
+            self.automaton.make_automaton()
+
+    def matches(self, haystack: str) -> set:
+        """Return the values of all keywords found in the (lowercase) haystack"""
+        if self.automaton is not None:
+            return {value for _, value in self.automaton.iter(haystack)}
+        return {value for keyword, value in self.keywords.items() if keyword in haystack}
+
+
+DOI_RESOURCE_MATCHER = KeywordMatcher([
+    (term, key) for key, terms in DOI_RESOURCE_PATTERNS.items() for term in terms
+])
+
 class StateResourceDiscovery:
     """Discovers state DOI resources using NAIC directory and USA.gov"""
 
     def __init__(self):
         self.session = None
+        self.probe_client = None
         self.discovered_resources = []
         self.naic_states = {}
         self.usa_gov_states = {}
 
-    async def discover_all_states(self, update_registry: bool = False):
+    async def discover_all_states(self, update_registry: bool = False, write_xlsx: bool = False):
         """Discover resources for all states"""
         logger.info("🔍 Starting comprehensive state resource discovery...")
 
         async with aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'WyngAI/1.0 Healthcare Research Bot'}
-        ) as session:
+            headers=REQUEST_HEADERS
+        ) as session, httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=10.0,
+            headers=REQUEST_HEADERS
+        ) as probe_client:
             self.session = session
+            self.probe_client = probe_client
 
             # Phase 1: Discover base DOI information from NAIC
             await self._discover_naic_directory()
@@ -47,7 +152,7 @@ class StateResourceDiscovery:
             self._generate_registry_entries()
 
             if update_registry:
-                await self._update_registry()
+                await self._update_registry(write_xlsx=write_xlsx)
 
         logger.info(f"✅ Discovery completed for {len(self.discovered_resources)} state resources")
 
@@ -190,27 +295,21 @@ class StateResourceDiscovery:
             doi_resources = await self._crawl_doi_resources(doi_home, state_info.get('search_terms', []))
             discovered['discovered_urls'].update(doi_resources)
 
-            # Search for specific resources using heuristic patterns
-            search_patterns = [
-                '/laws-and-regulations',
-                '/legal',
-                '/statutes',
-                '/administrative-code',
-                '/bulletins',
-                '/orders',
-                '/external-appeal',
-                '/external-review',
-                '/independent-review',
-                '/consumer/appeals',
-                '/consumer-services',
-                '/complaints',
-                '/public-records'
+            # Search for specific resources using heuristic patterns; the
+            # joined URLs only depend on doi_home, so build them once
+            candidate_urls = [
+                (f'resource_{pattern.replace("/", "_")}', urljoin(doi_home, pattern))
+                for pattern in STATE_RESOURCE_PATHS
             ]
 
-            for pattern in search_patterns:
-                test_url = urljoin(doi_home, pattern)
-                if await self._url_exists(test_url):
-                    discovered['discovered_urls'][f'resource_{pattern.replace("/", "_")}'] = test_url
+            # Probe concurrently so the HEADs multiplex over one connection
+            exists = await asyncio.gather(
+                *(self._url_exists(test_url) for _, test_url in candidate_urls)
+            )
+
+            for (resource_key, test_url), found in zip(candidate_urls, exists):
+                if found:
+                    discovered['discovered_urls'][resource_key] = test_url
 
             self.discovered_resources.append(discovered)
 
@@ -232,32 +331,30 @@ class StateResourceDiscovery:
                 # Find all links
                 links = soup.find_all('a', href=True)
 
+                # One matcher per page; value is the term's position so the
+                # earliest listed term still wins
+                term_matcher = KeywordMatcher([
+                    (term, index) for index, term in enumerate(search_terms)
+                ])
+
                 for link in links:
                     href = link.get('href', '')
                     text = link.get_text(strip=True).lower()
 
                     # Make URL absolute
-                    full_url = urljoin(doi_home, href)
+                    full_url = _urljoin_cached(doi_home, href)
 
-                    # Check if link matches search terms
-                    for term in search_terms:
-                        if term.lower() in text or term.lower() in href.lower():
-                            resource_key = f"found_{term.replace(' ', '_')}"
-                            resources[resource_key] = full_url
-                            break
+                    # Check if link matches search terms (newline keeps text
+                    # and href from forming a match across the boundary)
+                    term_hits = term_matcher.matches(f"{text}\n{href.lower()}")
+                    if term_hits:
+                        term = search_terms[min(term_hits)]
+                        resource_key = f"found_{term.replace(' ', '_')}"
+                        resources[resource_key] = full_url
 
                     # Check for common patterns
-                    patterns = {
-                        'external_review': ['external review', 'independent review', 'appeals'],
-                        'bulletins': ['bulletin', 'order', 'guidance'],
-                        'consumer_guides': ['consumer', 'guide', 'help'],
-                        'laws': ['law', 'statute', 'regulation'],
-                        'filings': ['filing', 'form', 'document']
-                    }
-
-                    for key, pattern_terms in patterns.items():
-                        if any(term in text for term in pattern_terms):
-                            resources[key] = full_url
+                    for key in DOI_RESOURCE_MATCHER.matches(text):
+                        resources[key] = full_url
 
         except Exception as e:
             logger.error(f"Error crawling DOI resources for {doi_home}: {e}")
@@ -267,8 +364,8 @@ class StateResourceDiscovery:
     async def _url_exists(self, url: str) -> bool:
         """Check if URL exists with HEAD request"""
         try:
-            async with self.session.head(url) as response:
-                return response.status == 200
+            response = await self.probe_client.head(url)
+            return response.status_code == 200
         except:
             return False
 
@@ -294,24 +391,15 @@ class StateResourceDiscovery:
 
     def _extract_state_code(self, href: str, text: str) -> Optional[str]:
         """Extract state code from URL or text"""
-        # Common state abbreviation patterns
-        state_codes = [
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-        ]
-
         combined = f"{href} {text}".upper()
 
-        for code in state_codes:
+        for code in STATE_CODES:
             if code in combined:
                 return code
 
         # Try to extract from domain
-        domain = urlparse(href).netloc.upper()
-        for code in state_codes:
+        domain = _urlparse_cached(href).netloc.upper()
+        for code in STATE_CODES:
             if code in domain:
                 return code
 
@@ -368,16 +456,42 @@ class StateResourceDiscovery:
         self.registry_entries = registry_entries
         logger.info(f"📊 Generated {len(registry_entries)} state registry entries")
 
-    async def _update_registry(self):
-        """Update the Excel registry with discovered state resources"""
+    async def _update_registry(self, write_xlsx: bool = False):
+        """Update the registry CSV (and optionally the Excel workbook) with discovered state resources"""
         logger.info("📝 Updating registry with discovered resources...")
 
-        registry_path = "data/registry/wyng_llm_training_sources_expanded.xlsx"
+        registry_path = Path(REGISTRY_PATH)
+        csv_path = registry_path.with_suffix('.csv')
 
-        if not Path(registry_path).exists():
-            logger.warning("Registry file not found, creating new one...")
+        if write_xlsx:
+            if registry_path.exists():
+                self._update_registry_xlsx(registry_path)
+            else:
+                logger.warning(f"Registry workbook not found at {registry_path}, skipping Excel update")
+
+        if not csv_path.exists():
+            logger.warning(f"Registry CSV not found at {csv_path}, skipping CSV update")
             return
 
+        # Read existing rows, dropping old state entries
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or REGISTRY_FIELDS
+            rows = [row for row in reader if not row.get('Source', '').startswith('STATE_')]
+
+        # Rewrite with the new state entries appended
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+            writer.writerows(self.registry_entries)
+
+        logger.info(f"✅ Registry updated with {len(self.registry_entries)} state resources")
+
+    def _update_registry_xlsx(self, registry_path: Path):
+        """Rewrite the Excel registry's All Sources and per-state sheets"""
+        import pandas as pd
+
         # Read existing registry
         df_existing = pd.read_excel(registry_path, sheet_name='All Sources')
 
@@ -398,9 +512,3 @@ class StateResourceDiscovery:
                 state_code = entry['Source'].replace('STATE_', '')
                 df_state = pd.DataFrame([entry])
                 df_state.to_excel(writer, sheet_name=f'STATE_{state_code}', index=False)
-
-        # Also update CSV
-        csv_path = registry_path.replace('.xlsx', '.csv')
-        df_updated.to_csv(csv_path, index=False)
-
-        logger.info(f"✅ Registry updated with {len(self.registry_entries)} state resources")
\ No newline at end of file
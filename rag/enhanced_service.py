@@ -6,13 +6,22 @@ Healthcare billing/appeals LLM with authoritative source grounding
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from enum import IntEnum
 import logging
 import asyncio
 import json
+import os
+import re
 from pathlib import Path
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 import hashlib
+import itertools
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from rag.serving import MicroBatcher, ResponseCache
 
 # Vector and search imports
 try:
@@ -24,8 +33,134 @@ except ImportError:
     DEPENDENCIES_AVAILABLE = False
     logging.warning("⚠️ Some dependencies not available. Install: sentence-transformers, rank-bm25")
 
+# Optional C stemmer so "appeals"/"appeal" share a BM25 term
+try:
+    import Stemmer
+    STEMMER = Stemmer.Stemmer('english')
+except ImportError:
+    STEMMER = None
+
+# Approximate nearest-neighbour search for large corpora
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Faster JSON parsing for warehouse loads; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sparse-matrix BM25 with optional numba-JIT scoring; rank_bm25 is the fallback
+try:
+    import bm25s
+    BM25S_AVAILABLE = True
+except ImportError:
+    BM25S_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+EMBEDDER_MODEL = 'BAAI/bge-base-en-v1.5'
+
+# "onnx" runs the embedder on ONNX Runtime (sentence-transformers >= 3.2 with
+# optimum installed); WYNGAI_EMBEDDER_ONNX_FILE selects e.g. a quantized export
+EMBEDDER_BACKEND = os.getenv('WYNGAI_EMBEDDER_BACKEND', 'torch')
+EMBEDDER_ONNX_FILE = os.getenv('WYNGAI_EMBEDDER_ONNX_FILE')
+WAREHOUSE_GOLD_DIR = Path("warehouse/gold")
+INDEX_DIR = Path("rag/index/enhanced")
+
+# Bump when the persisted chunk metadata gains or changes precomputed fields
+INDEX_FORMAT_VERSION = 6
+
+# Sentence boundary: whitespace after terminal punctuation that starts a new
+# sentence, except after abbreviations common in regulatory text
+SENTENCE_SPLIT_RE = re.compile(
+    r'(?<!\bDr\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bNo\.)(?<!\bSec\.)(?<!\bvs\.)'
+    r'(?<!\bInc\.)(?<!\bU\.S\.)(?<!\be\.g\.)(?<!\bi\.e\.)(?<!\bFed\.)(?<!\bReg\.)'
+    r'(?<=[.!?])\s+(?=[A-Z0-9"(\[§])'
+)
+
+# BM25 terms: lowercase alphanumeric runs
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Below this many chunks exact scoring beats the HNSW index
+ANN_MIN_CHUNKS = 10000
+
+# Warehouse loads fan out to worker processes once there are this many files
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Concurrent threaded file reads for smaller warehouse loads
+READ_CONCURRENCY = 32
+
+# Rows of the int8 embedding matrix dequantized per step; small enough that
+# each float32 block stays in cache while it is scored
+EMBEDDING_BLOCK_ROWS = 4096
+
+def _read_json_records(path: Path) -> List[Dict]:
+    """Parse a warehouse JSON file into a list of records"""
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    return data if isinstance(data, list) else [data]
+
+
+async def _load_json_records(paths: List[Path]) -> List[Dict]:
+    """Parse many warehouse JSON files concurrently without blocking the event loop.
+
+    Small sets are read on threads (bounded by a semaphore) so disk latency
+    overlaps; larger sets are parsed in worker processes.
+    """
+    if len(paths) < PARALLEL_LOAD_MIN_FILES:
+        semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+
+        async def read(path: Path) -> List[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(_read_json_records, path)
+
+        batches = await asyncio.gather(*(read(path) for path in paths))
+    else:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            batches = await asyncio.gather(
+                *(loop.run_in_executor(executor, _read_json_records, path) for path in paths)
+            )
+    return [record for batch in batches for record in batch]
+
+
+def _glob_sorted(pattern: str) -> List[Path]:
+    return sorted(WAREHOUSE_GOLD_DIR.glob(pattern)) if WAREHOUSE_GOLD_DIR.exists() else []
+
+
+def _tokenize(text: str) -> List[str]:
+    """BM25 tokens for a chunk or query, stemmed when PyStemmer is installed"""
+    tokens = TOKEN_RE.findall(text.lower())
+    return STEMMER.stemWords(tokens) if STEMMER is not None else tokens
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_query(query: str) -> tuple:
+    """Memoized query tokenization; popular questions repeat"""
+    return tuple(_tokenize(query))
+
+
+@lru_cache(maxsize=8192)
+def _parse_published_date(value: str) -> datetime:
+    """Parse an ISO-8601 date into naive UTC; corpora share many publication dates"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class AuthorityBucket(IntEnum):
+    """Guidance category of a chunk, assigned once at index time"""
+    FEDERAL = 0
+    STATE = 1
+    CLINICAL = 2
+    PROCEDURAL = 3
+
 # API Models
 class QueryRequest(BaseModel):
     question: str
@@ -56,13 +191,21 @@ app = FastAPI(title="WyngAI Enhanced RAG", version="1.0.0")
 class EnhancedRAGService:
     """Enhanced RAG service with citation discipline and authority ranking"""
 
-    def __init__(self):
+    def __init__(self, index_dir: Path = INDEX_DIR):
+        self.index_dir = index_dir
         self.embedder = None
         self.bm25_index = None
         self.document_store = {}
         self.chunk_store = {}
+        self.chunk_ids = []
+        self.embedding_matrix = None
+        self.embedding_scale = 1.0
+        self.ann_index = None
         self.authority_rankings = {}
         self.index_built = False
+        # Index rebuilds clear the cache, so entries need no TTL
+        self.response_cache = ResponseCache(ttl_seconds=None, similarity_threshold=0.97)
+        self.query_batcher = MicroBatcher(self._encode_queries, max_batch_size=32)
 
         # Authority hierarchy (higher = more authoritative)
         self.authority_weights = {
@@ -86,11 +229,13 @@ class EnhancedRAGService:
         try:
             logger.info("🔧 Initializing Enhanced RAG Service...")
 
-            # Load sentence transformer for semantic search
-            self.embedder = SentenceTransformer('BAAI/bge-base-en-v1.5')
+            # Load sentence transformer for semantic search, unless it was
+            # already preloaded in the master process (see below)
+            if self.embedder is None:
+                self.embedder = self._load_embedder()
 
-            # Load existing index if available
-            await self._load_existing_index()
+            # Load existing index if available; a warm start skips build_index
+            self.index_built = self._load_existing_index()
 
             logger.info("✅ Enhanced RAG Service initialized")
             return True
@@ -108,9 +253,11 @@ class EnhancedRAGService:
         logger.info("🏗️ Building hybrid RAG index...")
 
         try:
-            # Load documents from warehouse
-            documents = await self._load_warehouse_documents()
-            chunks = await self._load_warehouse_chunks()
+            # Load documents and chunks from warehouse concurrently
+            documents, chunks = await asyncio.gather(
+                self._load_warehouse_documents(),
+                self._load_warehouse_chunks()
+            )
 
             if not chunks:
                 logger.warning("⚠️ No chunks found - using placeholder data")
@@ -118,29 +265,47 @@ class EnhancedRAGService:
 
             # Build BM25 index
             chunk_texts = [chunk['text'] for chunk in chunks]
-            tokenized_chunks = [text.split() for text in chunk_texts]
-            self.bm25_index = BM25Okapi(tokenized_chunks)
+            bm25_index = self._build_bm25_index(chunk_texts)
+
+            # Build vector embeddings as one contiguous (N, D) matrix with
+            # L2-normalized rows, stored as int8 to cut memory traffic 4x.
+            # Encoding runs on a thread so /health stays responsive.
+            chunk_embeddings = await asyncio.to_thread(self.embedder.encode, chunk_texts)
+            chunk_embeddings = self._normalize_rows(
+                np.ascontiguousarray(chunk_embeddings, dtype=np.float32)
+            )
+            ann_index = await asyncio.to_thread(self._build_ann_index, chunk_embeddings)
+            self.bm25_index = bm25_index
+            self.ann_index = ann_index
+            self.embedding_matrix, self.embedding_scale = self._quantize_int8(chunk_embeddings)
+            self.chunk_ids = [chunk.get('chunk_id', f'chunk_{i}') for i, chunk in enumerate(chunks)]
 
-            # Build vector embeddings
-            chunk_embeddings = self.embedder.encode(chunk_texts)
+            # Store documents first; chunk authority is derived from them
+            for doc in documents:
+                doc_id = doc.get('doc_id', f'doc_{len(self.document_store)}')
+                self.document_store[doc_id] = doc
 
-            # Store chunks with embeddings and metadata
-            for i, chunk in enumerate(chunks):
-                chunk_id = chunk.get('chunk_id', f'chunk_{i}')
+            # Store chunk metadata; row i of embedding_matrix belongs to chunk_ids[i].
+            # Everything derived purely from the chunk/document is computed
+            # here once rather than per query.
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            for chunk_id, chunk in zip(self.chunk_ids, chunks):
+                doc = self.document_store.get(chunk.get('doc_id', ''), {})
                 self.chunk_store[chunk_id] = {
                     **chunk,
-                    'embedding': chunk_embeddings[i],
-                    'authority_rank': self._calculate_authority_rank(chunk)
+                    'authority_rank': self._calculate_authority_rank(chunk, now),
+                    'authority_bucket': self._authority_bucket(doc),
+                    'first_sentences': self._leading_sentences(chunk.get('text', '')),
+                    'excerpt_200': chunk.get('text', '')[:200] + "...",
+                    'excerpt_100': chunk.get('text', '')[:100] + "..."
                 }
 
-            # Store documents
-            for doc in documents:
-                doc_id = doc.get('doc_id', f'doc_{len(self.document_store)}')
-                self.document_store[doc_id] = doc
-
             self.index_built = True
+            self.response_cache.clear()
             logger.info(f"✅ Index built: {len(self.chunk_store)} chunks, {len(self.document_store)} documents")
 
+            self._save_index()
+
         except Exception as e:
             logger.error(f"❌ Error building index: {e}")
             raise
@@ -152,11 +317,23 @@ class EnhancedRAGService:
 
         logger.info(f"🔍 Processing query: {request.question[:100]}...")
 
+        cache_key = (request.question, request.context, request.max_sources, request.authority_threshold)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
+            # Embed once; the embedding serves both the soft cache and retrieval
+            query_embedding = await self.query_batcher.submit(request.question)
+            cached = self.response_cache.get_similar(cache_key, query_embedding)
+            if cached is not None:
+                return cached
+
             # Retrieve relevant chunks
             relevant_chunks = await self._hybrid_retrieve(
                 request.question,
-                max_results=request.max_sources * 3  # Over-retrieve for reranking
+                max_results=request.max_sources * 3,  # Over-retrieve for reranking
+                query_embedding=query_embedding
             )
 
             # Rerank by authority and relevance
@@ -169,52 +346,67 @@ class EnhancedRAGService:
                 request.context
             )
 
+            self.response_cache.put(cache_key, response, query_embedding)
             return response
 
         except Exception as e:
             logger.error(f"❌ Error processing query: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def _hybrid_retrieve(self, query: str, max_results: int = 15) -> List[Dict]:
+    def _load_embedder(self):
+        """Load the sentence embedder on the configured backend"""
+        if EMBEDDER_BACKEND == 'onnx':
+            model_kwargs = {'file_name': EMBEDDER_ONNX_FILE} if EMBEDDER_ONNX_FILE else None
+            return SentenceTransformer(EMBEDDER_MODEL, backend='onnx', model_kwargs=model_kwargs)
+        return SentenceTransformer(EMBEDDER_MODEL)
+
+    def _encode_queries(self, queries: List[str]) -> "np.ndarray":
+        """Encode queries into an (n, D) matrix of L2-normalized float32 rows"""
+        return self._normalize_rows(
+            np.asarray(self.embedder.encode(queries), dtype=np.float32)
+        )
+
+    def _embed_query(self, query: str) -> "np.ndarray":
+        """Encode a single query into an L2-normalized float32 vector"""
+        return self._encode_queries([query])[0]
+
+    async def _hybrid_retrieve(
+        self,
+        query: str,
+        max_results: int = 15,
+        query_embedding: Optional["np.ndarray"] = None
+    ) -> List[Dict]:
         """Hybrid BM25 + semantic retrieval"""
         results = []
 
         try:
             # BM25 retrieval
-            query_tokens = query.split()
-            bm25_scores = self.bm25_index.get_scores(query_tokens)
-            bm25_results = [(i, score) for i, score in enumerate(bm25_scores)]
-            bm25_results.sort(key=lambda x: x[1], reverse=True)
-
-            # Semantic retrieval
-            query_embedding = self.embedder.encode([query])[0]
-            semantic_scores = []
-
-            for chunk_id, chunk_data in self.chunk_store.items():
-                similarity = np.dot(query_embedding, chunk_data['embedding'])
-                semantic_scores.append((chunk_id, similarity))
-
-            semantic_scores.sort(key=lambda x: x[1], reverse=True)
-
-            # Combine results with weighted scoring
-            combined_scores = {}
-
-            # Add BM25 scores (lexical matching)
-            for i, (chunk_idx, bm25_score) in enumerate(bm25_results[:max_results]):
-                chunk_id = list(self.chunk_store.keys())[chunk_idx]
-                combined_scores[chunk_id] = combined_scores.get(chunk_id, 0) + bm25_score * 0.4
-
-            # Add semantic scores
-            for chunk_id, sem_score in semantic_scores[:max_results]:
-                combined_scores[chunk_id] = combined_scores.get(chunk_id, 0) + sem_score * 0.6
-
-            # Sort by combined score
-            ranked_chunks = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
+            bm25_top, bm25_top_scores = self._bm25_top_k(query, max_results)
+
+            # Semantic retrieval: HNSW for large corpora, otherwise exact
+            # cosine similarity against every chunk
+            if query_embedding is None:
+                query_embedding = self._embed_query(query)
+            semantic_top, semantic_top_scores = self._semantic_top_k(query_embedding, max_results)
+
+            # Combine results with weighted scoring over the union of the two
+            # top-k candidate sets (at most 2 * max_results chunks). BM25 is
+            # unbounded, so it is min-max scaled to [0, 1] to sit on the same
+            # footing as cosine similarity.
+            candidates = np.union1d(bm25_top, semantic_top).astype(np.intp)
+            bm25_vec = np.zeros(len(candidates), dtype=np.float32)
+            sem_vec = np.zeros(len(candidates), dtype=np.float32)
+            bm25_vec[np.searchsorted(candidates, bm25_top)] = bm25_top_scores
+            sem_vec[np.searchsorted(candidates, semantic_top)] = semantic_top_scores
+
+            if len(candidates):
+                bm25_vec = (bm25_vec - bm25_vec.min()) / (np.ptp(bm25_vec) + 1e-9)
+            combined = 0.4 * bm25_vec + 0.6 * sem_vec
 
             # Return chunk data with scores
-            for chunk_id, score in ranked_chunks[:max_results]:
-                chunk_data = self.chunk_store[chunk_id].copy()
-                chunk_data['retrieval_score'] = score
+            for i in self._top_k_indices(combined, max_results):
+                chunk_data = self.chunk_store[self.chunk_ids[candidates[i]]].copy()
+                chunk_data['retrieval_score'] = float(combined[i])
                 results.append(chunk_data)
 
             return results
@@ -223,20 +415,128 @@ class EnhancedRAGService:
             logger.error(f"❌ Error in hybrid retrieval: {e}")
             return []
 
+    def _build_bm25_index(self, chunk_texts: List[str]):
+        """Build the lexical index, preferring bm25s over rank_bm25"""
+        tokenized_chunks = [_tokenize(text) for text in chunk_texts]
+        if not BM25S_AVAILABLE:
+            return BM25Okapi(tokenized_chunks)
+
+        bm25_index = bm25s.BM25()
+        bm25_index.index(tokenized_chunks, show_progress=False)
+        try:
+            bm25_index.activate_numba_scorer()
+        except ImportError:
+            logger.info("numba not installed - using bm25s NumPy scorer")
+        return bm25_index
+
+    def _bm25_top_k(self, query: str, k: int):
+        """Return (chunk indices, scores) of the k best BM25 matches, best first"""
+        if not BM25S_AVAILABLE:
+            bm25_scores = np.asarray(self.bm25_index.get_scores(list(_tokenize_query(query))))
+            top = self._top_k_indices(bm25_scores, k)
+            return top, bm25_scores[top]
+
+        k = min(k, len(self.chunk_ids))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        # "auto" selects the numba backend whenever numba is importable
+        indices, scores = self.bm25_index.retrieve(
+            [list(_tokenize_query(query))],
+            k=k,
+            backend_selection="auto",
+            show_progress=False
+        )
+        return indices[0], scores[0]
+
+    @staticmethod
+    def _normalize_rows(vectors: "np.ndarray") -> "np.ndarray":
+        """L2-normalize a vector or the rows of a matrix in place"""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        vectors /= np.maximum(norms, 1e-12)
+        return vectors
+
+    @staticmethod
+    def _build_ann_index(embeddings: "np.ndarray"):
+        """HNSW inner-product index over normalized embeddings, or None when exact is faster"""
+        if not HNSWLIB_AVAILABLE or len(embeddings) < ANN_MIN_CHUNKS:
+            return None
+
+        ann_index = hnswlib.Index(space='ip', dim=embeddings.shape[1])
+        ann_index.init_index(max_elements=len(embeddings), M=32, ef_construction=200)
+        ann_index.add_items(embeddings, np.arange(len(embeddings)))
+        return ann_index
+
+    def _semantic_top_k(self, query_embedding: "np.ndarray", k: int):
+        """Return (chunk indices, cosine scores) of the k nearest chunks, best first"""
+        if self.ann_index is None:
+            semantic_scores = self._semantic_scores(query_embedding)
+            top = self._top_k_indices(semantic_scores, k)
+            return top, semantic_scores[top]
+
+        k = min(k, len(self.chunk_ids))
+        self.ann_index.set_ef(max(64, k))
+        labels, distances = self.ann_index.knn_query(query_embedding, k=k)
+        # hnswlib labels are uint64, which NumPy promotes to float64 when merged
+        # with the int64 BM25 indices; inner-product distance is 1 - <q, x>
+        return labels[0].astype(np.intp), 1.0 - distances[0]
+
+    @staticmethod
+    def _quantize_int8(matrix: "np.ndarray"):
+        """Symmetric int8 quantization with a single per-matrix scale"""
+        max_abs = float(np.abs(matrix).max()) if matrix.size else 0.0
+        scale = 127.0 / max_abs if max_abs > 0 else 1.0
+        return np.round(matrix * scale).astype(np.int8), scale
+
+    def _semantic_scores(self, query_embedding: "np.ndarray") -> "np.ndarray":
+        """Approximate cosine similarity of the query to every chunk.
+
+        NumPy has no SIMD int8 dot product, so int8 rows are widened to
+        float32 a block at a time and scored with BLAS; only one byte per
+        element is read from the (possibly memory-mapped) matrix.
+        """
+        num_rows = len(self.embedding_matrix)
+        scores = np.empty(num_rows, dtype=np.float32)
+        for start in range(0, num_rows, EMBEDDING_BLOCK_ROWS):
+            block = self.embedding_matrix[start:start + EMBEDDING_BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query_embedding
+        scores /= self.embedding_scale
+        return scores
+
+    @staticmethod
+    def _top_k_indices(scores: "np.ndarray", k: int) -> "np.ndarray":
+        """Indices of the k highest scores, best first, via argpartition"""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(scores, -k)[-k:]
+        return top[np.argsort(-scores[top])]
+
     def _rerank_by_authority(self, chunks: List[Dict], threshold: float = 0.5) -> List[Dict]:
         """Rerank chunks by authority and relevance"""
         try:
-            # Calculate final ranking score
-            for chunk in chunks:
-                authority_rank = chunk.get('authority_rank', 0.5)
-                retrieval_score = chunk.get('retrieval_score', 0.0)
+            if not chunks:
+                return []
 
-                # Combined score: authority weight + retrieval relevance
-                chunk['final_score'] = (authority_rank * 0.4) + (retrieval_score * 0.6)
+            authority = np.fromiter(
+                (c.get('authority_rank', 0.5) for c in chunks), dtype=np.float64, count=len(chunks)
+            )
+            retrieval = np.fromiter(
+                (c.get('retrieval_score', 0.0) for c in chunks), dtype=np.float64, count=len(chunks)
+            )
 
-            # Sort by final score and filter by threshold
-            ranked_chunks = [c for c in chunks if c.get('authority_rank', 0) >= threshold]
-            ranked_chunks.sort(key=lambda x: x['final_score'], reverse=True)
+            # Combined score: authority weight + retrieval relevance
+            final_scores = authority * 0.4 + retrieval * 0.6
+
+            # Filter by threshold, then order by final score (stable, best first)
+            kept = np.flatnonzero(authority >= threshold)
+            order = kept[np.argsort(-final_scores[kept], kind='stable')]
+
+            ranked_chunks = []
+            for i in order:
+                chunk = chunks[i]
+                chunk['final_score'] = float(final_scores[i])
+                ranked_chunks.append(chunk)
 
             return ranked_chunks
 
@@ -279,16 +579,15 @@ class EnhancedRAGService:
                     title=doc.get('title', 'Unknown Source'),
                     url=doc.get('url', ''),
                     authority_rank=chunk.get('authority_rank', 0.0),
-                    excerpt=chunk.get('text', '')[:200] + "...",
+                    excerpt=chunk['excerpt_200'],
                     section_path=chunk.get('section_path', [])
                 )
                 citations.append(citation)
 
                 # Categorize sources
-                source_category = doc.get('category', '').lower()
-                if any(term in source_category for term in ['federal', 'cfr', 'cms']):
+                if chunk['authority_bucket'] == AuthorityBucket.FEDERAL:
                     authority_sources.append(doc.get('title', ''))
-                    legal_basis.append(f"{doc.get('citation', '')}: {chunk.get('text', '')[:100]}...")
+                    legal_basis.append(f"{doc.get('citation', '')}: {chunk['excerpt_100']}")
 
             # Generate comprehensive answer
             answer = self._construct_authoritative_answer(question, relevant_chunks, context)
@@ -335,20 +634,15 @@ class EnhancedRAGService:
             clinical_guidance = []
             procedural_guidance = []
 
+            guidance_by_bucket = {
+                AuthorityBucket.FEDERAL: federal_guidance,
+                AuthorityBucket.STATE: state_guidance,
+                AuthorityBucket.CLINICAL: clinical_guidance,
+                AuthorityBucket.PROCEDURAL: procedural_guidance
+            }
+
             for chunk in chunks:
-                doc_id = chunk.get('doc_id', '')
-                doc = self.document_store.get(doc_id, {})
-                category = doc.get('category', '').lower()
-                text = chunk.get('text', '')
-
-                if any(term in category for term in ['federal', 'cfr', 'cms']):
-                    federal_guidance.append(text)
-                elif 'state' in category:
-                    state_guidance.append(text)
-                elif any(term in category for term in ['medical', 'clinical']):
-                    clinical_guidance.append(text)
-                else:
-                    procedural_guidance.append(text)
+                guidance_by_bucket[chunk['authority_bucket']].append(chunk)
 
             # Construct structured answer
             answer_parts = []
@@ -396,22 +690,40 @@ class EnhancedRAGService:
             logger.error(f"❌ Error constructing answer: {e}")
             return "Unable to construct authoritative response due to technical error."
 
-    def _summarize_guidance(self, guidance_texts: List[str]) -> str:
+    def _summarize_guidance(self, chunks: List[Dict]) -> str:
         """Summarize guidance from multiple sources"""
-        if not guidance_texts:
+        if not chunks:
             return "No specific guidance available."
 
-        # Simple extractive summary - take most relevant sentences
-        combined_text = " ".join(guidance_texts)
-        sentences = combined_text.split('.')
+        # Simple extractive summary - the leading sentences of each source,
+        # segmented once at index time
+        relevant_sentences = itertools.islice(
+            (sentence for chunk in chunks for sentence in chunk['first_sentences']), 3
+        )
 
-        # Filter and rank sentences by relevance
-        relevant_sentences = [s.strip() for s in sentences if len(s.strip()) > 20][:3]
+        return " ".join(relevant_sentences)
 
-        return ". ".join(relevant_sentences) + "."
+    @staticmethod
+    def _authority_bucket(doc: Dict) -> AuthorityBucket:
+        """Classify a document as federal, state, clinical or procedural guidance"""
+        category = doc.get('category', '').lower()
 
-    def _calculate_authority_rank(self, chunk: Dict) -> float:
-        """Calculate authority ranking for a chunk"""
+        if any(term in category for term in ['federal', 'cfr', 'cms']):
+            return AuthorityBucket.FEDERAL
+        elif 'state' in category:
+            return AuthorityBucket.STATE
+        elif any(term in category for term in ['medical', 'clinical']):
+            return AuthorityBucket.CLINICAL
+        return AuthorityBucket.PROCEDURAL
+
+    @staticmethod
+    def _leading_sentences(text: str, limit: int = 3) -> List[str]:
+        """First sentences of the text that are long enough to be substantive"""
+        sentences = (s.strip() for s in SENTENCE_SPLIT_RE.split(text))
+        return [s for s in sentences if len(s) > 20][:limit]
+
+    def _calculate_authority_rank(self, chunk: Dict, now: Optional[datetime] = None) -> float:
+        """Calculate authority ranking for a chunk; pass now (naive UTC) when ranking in bulk"""
         doc_id = chunk.get('doc_id', '')
         doc = self.document_store.get(doc_id, {})
 
@@ -438,8 +750,9 @@ class EnhancedRAGService:
         published_date = doc.get('published_date')
         if published_date:
             try:
-                pub_datetime = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-                days_old = (datetime.now() - pub_datetime.replace(tzinfo=None)).days
+                if now is None:
+                    now = datetime.now(timezone.utc).replace(tzinfo=None)
+                days_old = (now - _parse_published_date(published_date)).days
                 recency_factor = max(0.9, 1.0 - (days_old / 3650))  # Decay over 10 years
                 base_authority *= recency_factor
             except:
@@ -452,15 +765,8 @@ class EnhancedRAGService:
         documents = []
 
         try:
-            gold_dir = Path("warehouse/gold")
-            if gold_dir.exists():
-                for doc_file in gold_dir.glob("**/*.json"):
-                    with open(doc_file) as f:
-                        doc_data = json.load(f)
-                        if isinstance(doc_data, list):
-                            documents.extend(doc_data)
-                        else:
-                            documents.append(doc_data)
+            paths = await asyncio.to_thread(_glob_sorted, "**/*.json")
+            documents = await _load_json_records(paths)
 
             logger.info(f"📚 Loaded {len(documents)} documents from warehouse")
 
@@ -474,15 +780,8 @@ class EnhancedRAGService:
         chunks = []
 
         try:
-            gold_dir = Path("warehouse/gold")
-            if gold_dir.exists():
-                for chunk_file in gold_dir.glob("**/*chunks*.json"):
-                    with open(chunk_file) as f:
-                        chunk_data = json.load(f)
-                        if isinstance(chunk_data, list):
-                            chunks.extend(chunk_data)
-                        else:
-                            chunks.append(chunk_data)
+            paths = await asyncio.to_thread(_glob_sorted, "**/*chunks*.json")
+            chunks = await _load_json_records(paths)
 
             logger.info(f"📚 Loaded {len(chunks)} chunks from warehouse")
 
@@ -517,15 +816,126 @@ class EnhancedRAGService:
             }
         ]
 
-    async def _load_existing_index(self):
-        """Load existing index from storage"""
-        # Implementation would load previously built index
-        # For now, we'll build fresh each time
-        pass
+    def _index_fingerprint(self) -> str:
+        """Hash of the warehouse inputs and embedder model the index was built from"""
+        hasher = hashlib.sha256(EMBEDDER_MODEL.encode())
+        if WAREHOUSE_GOLD_DIR.exists():
+            for path in sorted(WAREHOUSE_GOLD_DIR.glob("**/*.json")):
+                stat = path.stat()
+                hasher.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return hasher.hexdigest()
+
+    def _save_index(self):
+        """Persist the built index so later startups can memory-map it"""
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+
+            # Embeddings as a raw .npy so they can be loaded with mmap_mode
+            np.save(self.index_dir / "embeddings.npy", self.embedding_matrix)
+
+            # Chunk and document metadata
+            with open(self.index_dir / "chunks.json", 'w') as f:
+                json.dump({
+                    'chunk_ids': self.chunk_ids,
+                    'chunk_store': self.chunk_store,
+                    'document_store': self.document_store
+                }, f, default=str)
+
+            # HNSW graph, only present for large corpora
+            ann_path = self.index_dir / "ann.bin"
+            if self.ann_index is not None:
+                self.ann_index.save_index(str(ann_path))
+            elif ann_path.exists():
+                ann_path.unlink()
+
+            # BM25 index
+            if BM25S_AVAILABLE:
+                self.bm25_index.save(str(self.index_dir / "bm25"))
+            else:
+                with open(self.index_dir / "bm25_index.pkl", 'wb') as f:
+                    pickle.dump(self.bm25_index, f)
+
+            metadata = {
+                'fingerprint': self._index_fingerprint(),
+                'embedder_model': EMBEDDER_MODEL,
+                'format_version': INDEX_FORMAT_VERSION,
+                'bm25_backend': 'bm25s' if BM25S_AVAILABLE else 'rank_bm25',
+                'bm25_stemmed': STEMMER is not None,
+                'embedding_dtype': 'int8',
+                'embedding_scale': self.embedding_scale,
+                'num_chunks': len(self.chunk_ids)
+            }
+            with open(self.index_dir / "metadata.json", 'w') as f:
+                json.dump(metadata, f, indent=2)
+
+            logger.info(f"💾 Index saved to {self.index_dir}")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Error saving index: {e}")
+
+    def _load_existing_index(self) -> bool:
+        """Load a previously saved index if it matches the current warehouse and model"""
+        metadata_path = self.index_dir / "metadata.json"
+        if not metadata_path.exists():
+            return False
+
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+
+            backend = 'bm25s' if BM25S_AVAILABLE else 'rank_bm25'
+            if (metadata.get('fingerprint') != self._index_fingerprint()
+                    or metadata.get('format_version') != INDEX_FORMAT_VERSION
+                    or metadata.get('bm25_backend') != backend
+                    or metadata.get('bm25_stemmed') != (STEMMER is not None)
+                    or metadata.get('embedding_dtype') != 'int8'):
+                logger.info("📚 Saved index is stale - it will be rebuilt")
+                return False
+
+            # Read-only mmap: worker processes share the pages via the page cache
+            self.embedding_matrix = np.load(self.index_dir / "embeddings.npy", mmap_mode='r')
+            self.embedding_scale = metadata['embedding_scale']
+
+            ann_path = self.index_dir / "ann.bin"
+            self.ann_index = None
+            if HNSWLIB_AVAILABLE and ann_path.exists():
+                self.ann_index = hnswlib.Index(space='ip', dim=self.embedding_matrix.shape[1])
+                self.ann_index.load_index(str(ann_path), max_elements=len(self.embedding_matrix))
+
+            with open(self.index_dir / "chunks.json") as f:
+                stored = json.load(f)
+            self.chunk_ids = stored['chunk_ids']
+            self.chunk_store = stored['chunk_store']
+            self.document_store = stored['document_store']
+
+            if BM25S_AVAILABLE:
+                self.bm25_index = bm25s.BM25.load(str(self.index_dir / "bm25"), mmap=True)
+                try:
+                    self.bm25_index.activate_numba_scorer()
+                except ImportError:
+                    pass
+            else:
+                with open(self.index_dir / "bm25_index.pkl", 'rb') as f:
+                    self.bm25_index = pickle.load(f)
+
+            logger.info(f"📚 Loaded saved index: {len(self.chunk_ids)} chunks")
+            return True
+
+        except Exception as e:
+            logger.warning(f"⚠️ Error loading saved index: {e}")
+            return False
 
 # Initialize service
 rag_service = EnhancedRAGService()
 
+# Under `gunicorn --preload` this module is imported once in the master before
+# workers fork, so loading the embedder here lets every worker share the
+# read-only weights copy-on-write instead of each loading its own copy
+if os.getenv('WYNGAI_PRELOAD_EMBEDDER') == '1' and DEPENDENCIES_AVAILABLE:
+    rag_service.embedder = rag_service._load_embedder()
+    rag_service.embedder.eval()
+    rag_service.embedder.share_memory()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize RAG service on startup"""
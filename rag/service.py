@@ -4,29 +4,61 @@ FastAPI RAG service with /ask endpoint and citation discipline.
 Provides RESTful API for healthcare regulation querying with authoritative citations.
 """
 
+import inspect
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
-from pathlib import Path
-import logging
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent / "src"))
-from wyngai.rag.hybrid_index_lite import HybridIndexLite, CitationExtractor
+from rag.serving import MicroBatcher, ResponseCache
+from wyngai.rag.hybrid_index_lite import CitationExtractor, HybridIndexLite
 from wyngai.schemas import CHUNK
 
+# Optional fast JSON serialization for responses
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Newer FastAPI serializes response models straight to JSON bytes with
+# pydantic-core, but only when no custom response class is configured
+NATIVE_JSON_SERIALIZATION = 'dump_json' in inspect.signature(serialize_response).parameters
+
+
+# Reciprocal Rank Fusion of the dense (TF-IDF) and BM25 rankings
+RRF_K = 60
+DENSE_WEIGHT = 0.7
+BM25_WEIGHT = 0.3
+RRF_CANDIDATES = 50
+# Best possible fused score (rank 1 in both lists), used to scale scores to [0, 1]
+RRF_MAX_SCORE = (DENSE_WEIGHT + BM25_WEIGHT) / (RRF_K + 1)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _sentence_overlaps(text_lower: str, question_words: frozenset) -> np.ndarray:
+    """Number of question words in each '.'-separated sentence of text_lower."""
+    return np.array([len(question_words.intersection(sentence.split())) for sentence in text_lower.split('.')],
+                    dtype=np.int64)
+
+
 class QueryRequest(BaseModel):
     """Request model for /ask endpoint."""
     question: str = Field(..., description="Healthcare regulation question")
     max_results: int = Field(default=5, ge=1, le=20, description="Maximum number of results")
-    min_score: float = Field(default=0.2, ge=0.0, le=1.0, description="Minimum relevance score")
+    min_score: float = Field(default=0.2, ge=0.0, le=1.0,
+                             description="Minimum TF-IDF cosine similarity of a source to the question")
     include_citations: bool = Field(default=True, description="Include detailed citations")
 
 
@@ -55,43 +87,169 @@ class HealthCheck(BaseModel):
     index_stats: Dict[str, Any]
 
 
+class ASGICORS:
+    """Pure ASGI CORS middleware for a fixed origin allow-list.
+
+    Answers preflights directly and adds headers to the response start
+    message, without wrapping requests or responses in Starlette objects.
+    """
+
+    def __init__(self, app,
+                 allow_origins: List[str],
+                 allow_methods: List[str] = ("GET", "POST"),
+                 allow_credentials: bool = True,
+                 max_age: int = 600):
+        self.app = app
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.allow_methods = ", ".join(allow_methods).encode("latin-1")
+        self.allow_credentials = allow_credentials
+        self.max_age = str(max_age).encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = origin in self.allow_origins
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin if allowed else None, request_headers)
+            return
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        if self.allow_credentials:
+            cors_headers.append((b"access-control-allow-credentials", b"true"))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(self, send, origin: Optional[bytes], request_headers: Optional[bytes]):
+        if origin is None:
+            await send({"type": "http.response.start", "status": 400,
+                        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"vary", b"Origin")]})
+            await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+            return
+
+        headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-methods", self.allow_methods),
+            (b"access-control-max-age", self.max_age),
+            (b"vary", b"Origin"),
+        ]
+        if request_headers:
+            # Any request header is allowed, so echo back what was asked for
+            headers.append((b"access-control-allow-headers", request_headers))
+        if self.allow_credentials:
+            headers.append((b"access-control-allow-credentials", b"true"))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
 class RAGService:
     """RAG service implementation."""
 
-    def __init__(self, index_path: Optional[Path] = None):
+    def __init__(self,
+                 index_path: Optional[Path] = None,
+                 semantic_cache_threshold: Optional[float] = None):
         self.index = HybridIndexLite()
         self.citation_extractor = CitationExtractor()
         self.index_path = index_path or Path("rag/index")
+        self.cache = ResponseCache(similarity_threshold=semantic_cache_threshold)
+        self._index_ready = False
 
         if self.index_path.exists():
             try:
-                self.index.load_index(self.index_path)
+                self.load_index()
                 logger.info("RAG index loaded successfully")
             except Exception as e:
                 logger.warning(f"Failed to load index: {e}")
 
-    def search(self, request: QueryRequest) -> QueryResponse:
+    def load_index(self):
+        """(Re)load the index from disk, dropping any cached responses."""
+        self._index_ready = False
+        self.index.load_index(self.index_path)
+        self.cache.clear()
+        self._index_ready = bool(self.index.chunks)
+
+    def search(self, request: QueryRequest, query_vector: Optional[np.ndarray] = None) -> QueryResponse:
         """
         Search for relevant healthcare regulation information.
 
         Args:
             request: Query request
+            query_vector: Question vector from encode_queries, if already computed
 
         Returns:
             Query response with citations
         """
-        if not self.index.chunks:
+        if not self._index_ready:
             raise HTTPException(
                 status_code=503,
                 detail="RAG index not available. Please build index first."
             )
 
+        key = (request.question, request.max_results, request.min_score, request.include_citations)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.cache.similarity_threshold is not None:
+            if query_vector is None:
+                query_vector = self.index.encode_queries([request.question])[0]
+            cached = self.cache.get_similar(key, query_vector)
+            if cached is not None:
+                return cached
+
+        response = self._search(request, query_vector)
+        self.cache.put(key, response, query_vector)
+        return response
+
+    def search_batch(self, requests: List[QueryRequest]) -> List[Any]:
+        """
+        Search several requests, encoding their questions in one call.
+
+        Returns:
+            The response, or the exception raised, for each request
+        """
+        if self._index_ready:
+            query_vectors = self.index.encode_queries([request.question for request in requests])
+        else:
+            query_vectors = [None] * len(requests)
+
+        outcomes = []
+        for request, query_vector in zip(requests, query_vectors):
+            try:
+                outcomes.append(self.search(request, query_vector))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _search(self, request: QueryRequest, query_vector: Optional[np.ndarray] = None) -> QueryResponse:
+        """Run retrieval and build the response for an uncached request."""
         # Perform hybrid search
-        results = self.index.search(
-            query=request.question,
-            top_k=request.max_results,
-            min_score=request.min_score
-        )
+        results = self._fused_search(request.question, request.max_results, request.min_score, query_vector)
 
         if not results:
             return QueryResponse(
@@ -106,7 +264,8 @@ class RAGService:
         chunks, scores = zip(*results)
 
         # Generate answer
-        answer = self._generate_answer(request.question, chunks)
+        question_words = frozenset(request.question.lower().split())
+        answer = self._generate_answer(question_words, chunks)
 
         # Build source information
         sources = []
@@ -117,7 +276,7 @@ class RAGService:
                 section_path=chunk.section_path,
                 citations=chunk.citations,
                 topics=chunk.topics,
-                excerpt=self._create_excerpt(chunk.text, request.question)
+                excerpt=self._create_excerpt(chunk, question_words)
             )
             sources.append(source)
 
@@ -129,7 +288,8 @@ class RAGService:
         # Build metadata
         metadata = {
             "total_results": len(results),
-            "avg_authority_rank": sum(scores) / len(scores),
+            "avg_retrieval_score": sum(scores) / len(scores),
+            "avg_authority_rank": sum(chunk.authority_rank for chunk in chunks) / len(chunks),
             "search_performed": True,
             "top_topics": self._get_top_topics(chunks)
         }
@@ -142,7 +302,38 @@ class RAGService:
             metadata=metadata
         )
 
-    def _generate_answer(self, question: str, chunks: List[CHUNK]) -> str:
+    def _fused_search(self,
+                      question: str,
+                      top_k: int,
+                      min_score: float,
+                      query_vector: Optional[np.ndarray] = None) -> List[Tuple[CHUNK, float]]:
+        """
+        Rank chunks by Reciprocal Rank Fusion of dense and BM25 retrieval.
+
+        min_score is a floor on a chunk's TF-IDF cosine similarity to the
+        question, applied before fusion: RRF scores depend only on rank, so
+        they say nothing about how relevant a chunk is. The BM25 ranking only
+        reorders chunks that clear the floor. Fused scores are scaled so that
+        rank 1 in both lists scores 1.0.
+        """
+        dense = [(i, similarity)
+                 for i, similarity in self.index.search_dense(question, RRF_CANDIDATES, query_vector)
+                 if similarity >= min_score]
+        relevant = {i for i, _ in dense}
+
+        fused: Dict[int, float] = {}
+        for weight, ranking in (
+            (DENSE_WEIGHT, dense),
+            (BM25_WEIGHT, self.index.search_bm25(question, RRF_CANDIDATES)),
+        ):
+            for rank, (i, _) in enumerate(ranking, start=1):
+                if i in relevant:
+                    fused[i] = fused.get(i, 0.0) + weight / (RRF_K + rank)
+
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)
+        return [(self.index.chunks[i], score / RRF_MAX_SCORE) for i, score in ranked[:top_k]]
+
+    def _generate_answer(self, question_words: frozenset, chunks: List[CHUNK]) -> str:
         """
         Generate answer from relevant chunks.
 
@@ -164,7 +355,7 @@ class RAGService:
         ]
 
         # Add excerpt from top chunk
-        excerpt = self._create_excerpt(top_chunk.text, question, max_length=300)
+        excerpt = self._create_excerpt(top_chunk, question_words, max_length=300)
         answer_parts.append(excerpt)
 
         # Add additional context if available
@@ -176,7 +367,7 @@ class RAGService:
 
             for chunk in chunks[1:3]:  # Add up to 2 more chunks
                 if chunk.authority_rank >= 0.5:  # Only high-authority sources
-                    short_excerpt = self._create_excerpt(chunk.text, question, max_length=150)
+                    short_excerpt = self._create_excerpt(chunk, question_words, max_length=150)
                     answer_parts.append(f"- {short_excerpt}")
 
         # Add citation reminder
@@ -187,34 +378,27 @@ class RAGService:
 
         return "\n".join(answer_parts)
 
-    def _create_excerpt(self, text: str, question: str, max_length: int = 200) -> str:
-        """Create a relevant excerpt from text based on question."""
-        # Simple approach: find sentences containing question keywords
-        question_words = set(question.lower().split())
-        sentences = text.split('.')
+    def _create_excerpt(self, chunk: CHUNK, question_words: frozenset, max_length: int = 200) -> str:
+        """Create a relevant excerpt from chunk text based on the (lowercase) question words."""
+        text = chunk.text
 
-        # Score sentences by keyword overlap
-        scored_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 20:  # Skip very short sentences
-                continue
-
-            sentence_words = set(sentence.lower().split())
-            overlap = len(question_words.intersection(sentence_words))
-            scored_sentences.append((overlap, sentence))
+        # Simple approach: find sentences containing question keywords
+        sentences = [sentence.strip() for sentence in text.split('.')]
+        lengths = np.fromiter(map(len, sentences), dtype=np.int64, count=len(sentences))
 
-        # Get best sentences
-        scored_sentences.sort(key=lambda x: x[0], reverse=True)
+        # Score sentences by keyword overlap; very short sentences are skipped
+        scores = _sentence_overlaps(chunk.text_lower, question_words)
+        candidates = np.flatnonzero((scores > 0) & (lengths >= 20) & (lengths <= max_length))
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
 
-        # Build excerpt
+        # Build excerpt from the best sentences that fit the length budget
         excerpt_parts = []
-        current_length = 0
+        remaining = max_length
 
-        for score, sentence in scored_sentences:
-            if score > 0 and current_length + len(sentence) <= max_length:
-                excerpt_parts.append(sentence)
-                current_length += len(sentence)
+        for i, length in zip(candidates.tolist(), lengths[candidates].tolist()):
+            if length <= remaining:
+                excerpt_parts.append(sentences[i])
+                remaining -= length
 
         if not excerpt_parts:
             # Fallback: use beginning of text
@@ -224,18 +408,17 @@ class RAGService:
 
     def _get_top_topics(self, chunks: List[CHUNK]) -> List[str]:
         """Get most common topics from chunks."""
-        topic_counts = {}
+        topic_counts = Counter()
         for chunk in chunks:
-            for topic in chunk.topics:
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
+            topic_counts.update(chunk.topics)
 
         # Return top 5 topics
-        return [topic for topic, _ in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
+        return [topic for topic, _ in topic_counts.most_common(5)]
 
     def get_health_status(self) -> HealthCheck:
         """Get service health status."""
         return HealthCheck(
-            status="healthy" if self.index.chunks else "no_index",
+            status="healthy" if self._index_ready else "no_index",
             index_stats=self.index.get_statistics()
         )
 
@@ -246,20 +429,26 @@ app = FastAPI(
     description="Healthcare regulation query service with authoritative citations",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    **({"default_response_class": ORJSONResponse} if ORJSON_AVAILABLE and not NATIVE_JSON_SERIALIZATION else {})
 )
 
+# Compress verbose answers; added first so it runs inside CORS
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    ASGICORS,
     allow_origins=["https://www.getwyng.co", "https://getwyng.co", "http://localhost:3000"],
-    allow_credentials=True,
     allow_methods=["GET", "POST"],
-    allow_headers=["*"],
 )
 
-# Initialize RAG service
-rag_service = RAGService()
+# Initialize RAG service; the semantic cache tier is opt-in
+_semantic_cache_threshold = os.getenv('WYNGAI_SEMANTIC_CACHE_THRESHOLD')
+rag_service = RAGService(
+    semantic_cache_threshold=float(_semantic_cache_threshold) if _semantic_cache_threshold else None
+)
+query_batcher = MicroBatcher(rag_service.search_batch)
 
 
 @app.get("/", response_model=Dict[str, str])
@@ -293,17 +482,17 @@ async def ask_question(request: QueryRequest):
     - "What are the medical necessity criteria for DME?"
     """
     try:
-        return rag_service.search(request)
+        return await query_batcher.submit(request)
     except Exception as e:
         logger.error(f"Error processing question: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.get("/search")
+@app.get("/search", response_model=QueryResponse)
 async def search_get(
     q: str = Query(..., description="Question to search"),
     max_results: int = Query(5, ge=1, le=20, description="Maximum results"),
-    min_score: float = Query(0.2, ge=0.0, le=1.0, description="Minimum score")
+    min_score: float = Query(0.2, ge=0.0, le=1.0, description="Minimum TF-IDF cosine similarity")
 ):
     """
     GET endpoint for search (for simple integration).
@@ -324,4 +513,12 @@ async def get_statistics():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+
+    try:
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+        server_options = {"loop": "uvloop", "http": "httptools"}
+    except ImportError:
+        server_options = {}
+
+    uvicorn.run(app, host="0.0.0.0", port=8000, **server_options)
\ No newline at end of file
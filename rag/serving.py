@@ -0,0 +1,145 @@
+"""
+Request-serving helpers shared by the RAG services.
+
+Response caching and micro-batching of concurrent requests.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+
+class ResponseCache:
+    """LRU cache of responses with an optional TTL and semantic tier.
+
+    Exact hits match the full request key. When similarity_threshold is set,
+    a request whose question vector has cosine similarity at or above it with
+    a cached question (and identical other key fields) is also a hit. Keys
+    are tuples whose first field is the question.
+    """
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 ttl_seconds: Optional[float] = 3600.0,
+                 similarity_threshold: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.clear()
+
+    def clear(self):
+        self.entries = OrderedDict()  # key -> (slot, stamp, response)
+        self.slot_keys = [None] * self.max_entries
+        self.free_slots = list(range(self.max_entries - 1, -1, -1))
+        self.embeddings = None  # (max_entries, D), allocated on first put
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Exact lookup on the full request key"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and time.monotonic() - entry[1] > self.ttl_seconds:
+            self._evict(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry[2]
+
+    def get_similar(self, key: tuple, query_vector: np.ndarray) -> Optional[Any]:
+        """Soft lookup by question vector among entries with the same other key fields"""
+        if self.similarity_threshold is None or self.embeddings is None or not self.entries:
+            return None
+
+        # Free slots are zero vectors and never clear the threshold
+        similarities = self.embeddings @ query_vector
+        candidates = np.flatnonzero(similarities >= self.similarity_threshold)
+        for slot in candidates[np.argsort(-similarities[candidates])]:
+            cached_key = self.slot_keys[slot]
+            if cached_key is not None and cached_key[1:] == key[1:]:
+                response = self.get(cached_key)
+                if response is not None:
+                    return response
+        return None
+
+    def put(self, key: tuple, response: Any, query_vector: Optional[np.ndarray] = None):
+        if key in self.entries:
+            self._evict(key)
+        elif len(self.entries) >= self.max_entries:
+            self._evict(next(iter(self.entries)))
+
+        slot = self.free_slots.pop()
+        if query_vector is not None:
+            if self.embeddings is None:
+                self.embeddings = np.zeros((self.max_entries, len(query_vector)), dtype=np.float32)
+            self.embeddings[slot] = query_vector
+        self.slot_keys[slot] = key
+        self.entries[key] = (slot, time.monotonic(), response)
+
+    def _evict(self, key: tuple):
+        slot = self.entries.pop(key)[0]
+        self.slot_keys[slot] = None
+        if self.embeddings is not None:
+            self.embeddings[slot] = 0.0
+        self.free_slots.append(slot)
+
+
+class MicroBatcher:
+    """Coalesces concurrent requests into one batched call.
+
+    Items submitted within max_wait seconds of each other (up to
+    max_batch_size) are passed together to process_batch, which runs off the
+    event loop and returns one outcome per item; an outcome that is an
+    exception is raised to that item's caller. Each event loop gets its own
+    queue and worker task.
+    """
+
+    def __init__(self,
+                 process_batch: Callable[[List[Any]], Any],
+                 max_batch_size: int = 16,
+                 max_wait: float = 0.005):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queues = weakref.WeakKeyDictionary()
+        self.workers = weakref.WeakKeyDictionary()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        queue = self.queues.get(loop)
+        if queue is None:
+            queue = self.queues[loop] = asyncio.Queue()
+            self.workers[loop] = loop.create_task(self._run(queue))
+
+        future = loop.create_future()
+        await queue.put((item, future))
+        return await future
+
+    async def _run(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                outcomes = await asyncio.to_thread(self.process_batch, [item for item, _ in batch])
+            except Exception as e:
+                outcomes = [e] * len(batch)
+
+            for (_, future), outcome in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
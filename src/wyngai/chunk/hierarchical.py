@@ -5,11 +5,103 @@ Splits documents into retrieval-optimized chunks while preserving structure.
 """
 
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from uuid import uuid4
 
 from ..schemas import DOC, CHUNK, AuthorityRanking
 
+# Optional C-level multi-keyword matcher for topic tagging
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional faster regex engine for citation scanning
+try:
+    import regex
+    REGEX_AVAILABLE = True
+except ImportError:
+    REGEX_AVAILABLE = False
+
+
+def _union(patterns: List[str], flags: int = 0) -> "re.Pattern":
+    """Compile alternative patterns into one regex."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+# Section starts in regulatory text like "§ 147.136" or "(a)", "(1)", etc.
+REGULATION_SECTION_RE = _union([
+    r'§\s*\d+\.\d+[a-z]*(?:\([^)]+\))*',  # § 147.136(a)(1)
+    r'\([a-z]+\)\s*[A-Z]',                  # (a) Capital letter
+    r'\(\d+\)\s*[A-Z]',                     # (1) Capital letter
+    r'\n[A-Z][^.]*\.\s*\n'                 # Title-like lines
+])
+
+# Numbered sections, headings, etc. in manuals and policies
+MANUAL_HEADING_RE = _union([
+    r'^\d+\.\s+[A-Z]',           # 1. Section Title
+    r'^[A-Z][^.]*:\s*$',         # Title:
+    r'^[A-Z\s]+$',               # ALL CAPS HEADINGS
+])
+
+# Court opinion section markers, matched anywhere in the line
+COURT_SECTION_RE = _union([
+    r'^I+\.\s+[A-Z]',            # I. SECTION
+    r'^[A-Z]\.\s+[A-Z]',         # A. Subsection
+    r'FACTUAL BACKGROUND',
+    r'PROCEDURAL HISTORY',
+    r'LEGAL STANDARD',
+    r'DISCUSSION',
+    r'CONCLUSION'
+], re.IGNORECASE)
+
+# Statute, regulation and policy citations, one named group per kind
+CITATION_PATTERNS = {
+    'cfr': r'\b\d+\s*CFR\s*\d+(?:\.\d+)*',
+    'usc': r'\b\d+\s*U\.?S\.?C\.?\s*§?\s*\d+',
+    'ncd': r'NCD\s*\d+(?:\.\d+)*',
+    'lcd': r'LCD\s*\d+(?:\.\d+)*',
+    'cpb': r'CPB\s*\d+(?:\.\d+)*',
+    'cg': r'CG-\w+-\d+'
+}
+_citation_engine = regex if REGEX_AVAILABLE else re
+CITATION_RE = _citation_engine.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in CITATION_PATTERNS.items()),
+    _citation_engine.IGNORECASE
+)
+
+# Healthcare topic keywords
+TOPIC_KEYWORDS = {
+    'prior_authorization': ['prior authorization', 'preauthorization', 'pre-auth'],
+    'medical_necessity': ['medical necessity', 'medically necessary', 'clinical necessity'],
+    'appeals': ['appeal', 'grievance', 'external review', 'independent review'],
+    'claims': ['claim', 'reimbursement', 'payment', 'billing'],
+    'coverage': ['coverage', 'covered service', 'benefit'],
+    'dme': ['durable medical equipment', 'prosthetic', 'orthotic'],
+    'diagnostic': ['diagnostic', 'laboratory', 'pathology', 'radiology'],
+    'emergency': ['emergency', 'urgent care', 'trauma'],
+    'behavioral_health': ['mental health', 'behavioral health', 'substance abuse'],
+    'pharmacy': ['prescription', 'drug', 'medication', 'pharmaceutical'],
+    'balance_billing': ['balance billing', 'surprise billing', 'out-of-network']
+}
+
+# One automaton finds every topic keyword in a single scan of the text
+TOPIC_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    TOPIC_AUTOMATON = ahocorasick.Automaton()
+    for _topic, _keywords in TOPIC_KEYWORDS.items():
+        for _keyword in _keywords:
+            TOPIC_AUTOMATON.add_word(_keyword, _topic)
+    TOPIC_AUTOMATON.make_automaton()
+
+
+@lru_cache(maxsize=8192)
+def _find_citations(text: str) -> Tuple[str, ...]:
+    """Distinct citations in text, cached for boilerplate repeated across documents."""
+    return tuple({match.group() for match in CITATION_RE.finditer(text)})
+
 
 class HierarchicalChunker:
     """Hierarchical document chunker with structure awareness."""
@@ -33,185 +125,122 @@ class HierarchicalChunker:
         Returns:
             List of CHUNK objects
         """
-        # Extract document structure
-        sections = self._extract_sections(doc.text, doc.doc_type)
+        return list(self.iter_document_chunks(doc))
 
-        chunks = []
-        chunk_ordinal = 0
+    def iter_document_chunks(self, doc: DOC) -> Iterator[CHUNK]:
+        """
+        Yield enriched chunks of a single document in order.
 
-        for section in sections:
-            section_chunks = self._chunk_section(
-                section,
-                doc,
-                chunk_ordinal
-            )
-            chunks.extend(section_chunks)
-            chunk_ordinal += len(section_chunks)
+        Sections are chunked and enriched as soon as they are found, in a
+        single pass over the document.
+        """
+        chunk_ordinal = 0
 
-        # Enrich chunks with metadata
-        enriched_chunks = []
-        for chunk in chunks:
-            enriched_chunk = self._enrich_chunk(chunk, doc)
-            enriched_chunks.append(enriched_chunk)
+        # Authority depends only on the document, not on the chunk
+        authority_rank = self._calculate_authority_rank(doc)
 
-        return enriched_chunks
+        for section in self._iter_sections(doc.text, doc.doc_type):
+            for chunk in self._chunk_section(section, doc, chunk_ordinal, authority_rank):
+                chunk_ordinal += 1
+                yield self._enrich_chunk(chunk, doc)
 
-    def chunk_documents(self, docs: List[DOC]) -> List[CHUNK]:
+    def chunk_documents(self, docs: Iterable[DOC]) -> List[CHUNK]:
         """
         Chunk multiple documents.
 
         Args:
-            docs: List of documents to chunk
+            docs: Documents to chunk
 
         Returns:
             List of all CHUNK objects
         """
-        all_chunks = []
+        return list(self.iter_chunks(docs))
 
-        for doc in docs:
-            doc_chunks = self.chunk_document(doc)
-            all_chunks.extend(doc_chunks)
+    def iter_chunks(self, docs: Iterable[DOC]) -> Iterator[CHUNK]:
+        """
+        Yield chunks of many documents without holding them all in memory.
+
+        Args:
+            docs: Documents to chunk, e.g. a generator reading a JSONL file
 
-        print(f"Created {len(all_chunks)} chunks from {len(docs)} documents")
-        return all_chunks
+        Yields:
+            CHUNK objects in document order
+        """
+        num_docs = 0
+        num_chunks = 0
+
+        for doc in docs:
+            num_docs += 1
+            for chunk in self.iter_document_chunks(doc):
+                num_chunks += 1
+                yield chunk
 
-    def _extract_sections(self, text: str, doc_type: str) -> List[Dict[str, Any]]:
-        """Extract logical sections from document text."""
-        sections = []
+        print(f"Created {num_chunks} chunks from {num_docs} documents")
 
+    def _iter_sections(self, text: str, doc_type: str) -> Iterator[Dict[str, Any]]:
+        """Yield logical sections of document text in order."""
         if doc_type == "reg":  # Regulation
-            sections = self._extract_regulation_sections(text)
+            return self._iter_line_sections(text, REGULATION_SECTION_RE.match)
         elif doc_type == "manual":  # Manual/Policy
-            sections = self._extract_manual_sections(text)
+            return self._iter_line_sections(text, MANUAL_HEADING_RE.match)
         elif doc_type == "court_opinion":
-            sections = self._extract_court_sections(text)
+            return self._iter_line_sections(text, COURT_SECTION_RE.search)
         else:
             # Generic paragraph-based chunking
-            sections = self._extract_generic_sections(text)
-
-        return sections
-
-    def _extract_regulation_sections(self, text: str) -> List[Dict[str, Any]]:
-        """Extract sections from regulatory text (CFR style)."""
-        sections = []
-
-        # Look for section patterns like "§ 147.136" or "(a)", "(1)", etc.
-        section_patterns = [
-            r'§\s*\d+\.\d+[a-z]*(?:\([^)]+\))*',  # § 147.136(a)(1)
-            r'\([a-z]+\)\s*[A-Z]',                  # (a) Capital letter
-            r'\(\d+\)\s*[A-Z]',                     # (1) Capital letter
-            r'\n[A-Z][^.]*\.\s*\n'                 # Title-like lines
-        ]
-
-        current_section = {"text": "", "headings": [], "section_path": []}
-
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check if this line starts a new section
-            is_new_section = any(re.match(pattern, line) for pattern in section_patterns)
-
-            if is_new_section and current_section["text"]:
-                # Save current section
-                sections.append(current_section.copy())
-                current_section = {"text": line, "headings": [line], "section_path": [line]}
-            else:
-                current_section["text"] += f"\n{line}"
+            return self._iter_generic_sections(text)
 
-        # Add final section
-        if current_section["text"]:
-            sections.append(current_section)
-
-        return sections
-
-    def _extract_manual_sections(self, text: str) -> List[Dict[str, Any]]:
-        """Extract sections from manual/policy text."""
-        sections = []
-
-        # Look for numbered sections, headings, etc.
-        heading_patterns = [
-            r'^\d+\.\s+[A-Z]',           # 1. Section Title
-            r'^[A-Z][^.]*:\s*$',         # Title:
-            r'^[A-Z\s]+$',               # ALL CAPS HEADINGS
-        ]
-
-        current_section = {"text": "", "headings": [], "section_path": []}
-
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
+    def _iter_line_sections(self, text: str, starts_section) -> Iterator[Dict[str, Any]]:
+        """
+        Split text into sections at lines that start a new section.
 
-            # Check for headings
-            is_heading = any(re.match(pattern, line) for pattern in heading_patterns)
-
-            if is_heading and current_section["text"]:
-                sections.append(current_section.copy())
-                current_section = {"text": line, "headings": [line], "section_path": [line]}
-            else:
-                current_section["text"] += f"\n{line}"
-
-        if current_section["text"]:
-            sections.append(current_section)
-
-        return sections
-
-    def _extract_court_sections(self, text: str) -> List[Dict[str, Any]]:
-        """Extract sections from court opinions."""
-        sections = []
-
-        # Court opinion patterns
-        court_patterns = [
-            r'^I+\.\s+[A-Z]',            # I. SECTION
-            r'^[A-Z]\.\s+[A-Z]',         # A. Subsection
-            r'FACTUAL BACKGROUND',
-            r'PROCEDURAL HISTORY',
-            r'LEGAL STANDARD',
-            r'DISCUSSION',
-            r'CONCLUSION'
-        ]
+        Args:
+            text: Document text
+            starts_section: Compiled pattern's match/search method, applied to each stripped line
 
-        current_section = {"text": "", "headings": [], "section_path": []}
+        Yields:
+            Section dicts with text, headings and section_path
+        """
+        lines: List[str] = []
+        heading = None
 
         for line in text.split('\n'):
             line = line.strip()
             if not line:
                 continue
 
-            is_new_section = any(re.search(pattern, line, re.IGNORECASE) for pattern in court_patterns)
+            # A section start only splits once the current section has text
+            if lines and starts_section(line) is not None:
+                yield self._make_section(lines, heading)
+                lines = []
+                heading = line
 
-            if is_new_section and current_section["text"]:
-                sections.append(current_section.copy())
-                current_section = {"text": line, "headings": [line], "section_path": [line]}
-            else:
-                current_section["text"] += f"\n{line}"
+            lines.append(line)
 
-        if current_section["text"]:
-            sections.append(current_section)
+        if lines:
+            yield self._make_section(lines, heading)
 
-        return sections
+    def _make_section(self, lines: List[str], heading: Optional[str]) -> Dict[str, Any]:
+        headings = [heading] if heading is not None else []
+        return {"text": "\n".join(lines), "headings": headings, "section_path": list(headings)}
 
-    def _extract_generic_sections(self, text: str) -> List[Dict[str, Any]]:
+    def _iter_generic_sections(self, text: str) -> Iterator[Dict[str, Any]]:
         """Generic paragraph-based sectioning."""
-        paragraphs = text.split('\n\n')
-        sections = []
-
-        for i, para in enumerate(paragraphs):
-            if para.strip():
-                sections.append({
-                    "text": para.strip(),
+        for i, para in enumerate(text.split('\n\n')):
+            para = para.strip()
+            if para:
+                yield {
+                    "text": para,
                     "headings": [],
                     "section_path": [f"Paragraph {i+1}"]
-                })
+                }
 
-        return sections
-
-    def _chunk_section(self, section: Dict[str, Any], doc: DOC, start_ordinal: int) -> List[CHUNK]:
+    def _chunk_section(self,
+                       section: Dict[str, Any],
+                       doc: DOC,
+                       start_ordinal: int,
+                       authority_rank: float) -> Iterator[CHUNK]:
         """Chunk a single section into appropriately-sized pieces."""
         text = section["text"]
-        chunks = []
 
         if len(text) <= self.max_chunk_size:
             # Section fits in one chunk
@@ -224,9 +253,9 @@ class HierarchicalChunker:
                 headings=section.get("headings", []),
                 section_path=section.get("section_path", []),
                 citations=self._extract_citations(text),
-                authority_rank=self._calculate_authority_rank(doc)
+                authority_rank=authority_rank
             )
-            chunks.append(chunk)
+            yield chunk
         else:
             # Split section into multiple chunks with overlap
             chunk_texts = self._split_text_with_overlap(text)
@@ -241,15 +270,12 @@ class HierarchicalChunker:
                     headings=section.get("headings", []),
                     section_path=section.get("section_path", []),
                     citations=self._extract_citations(chunk_text),
-                    authority_rank=self._calculate_authority_rank(doc)
+                    authority_rank=authority_rank
                 )
-                chunks.append(chunk)
-
-        return chunks
+                yield chunk
 
-    def _split_text_with_overlap(self, text: str) -> List[str]:
+    def _split_text_with_overlap(self, text: str) -> Iterator[str]:
         """Split text into overlapping chunks."""
-        chunks = []
         start = 0
 
         while start < len(text):
@@ -265,36 +291,18 @@ class HierarchicalChunker:
 
             chunk_text = text[start:end].strip()
             if len(chunk_text) >= self.min_chunk_size or start == 0:
-                chunks.append(chunk_text)
+                yield chunk_text
 
-            start = end - self.overlap_size
+            # Stepping back by the overlap from the end of the text would
+            # re-emit the same final window forever
+            if end == len(text):
+                break
 
-        return chunks
+            start = end - self.overlap_size
 
     def _extract_citations(self, text: str) -> List[str]:
         """Extract legal citations from text."""
-        citations = []
-
-        # CFR citations
-        cfr_pattern = r'\b\d+\s*CFR\s*\d+(?:\.\d+)*'
-        citations.extend(re.findall(cfr_pattern, text, re.IGNORECASE))
-
-        # USC citations
-        usc_pattern = r'\b\d+\s*U\.?S\.?C\.?\s*§?\s*\d+'
-        citations.extend(re.findall(usc_pattern, text, re.IGNORECASE))
-
-        # Policy citations
-        policy_patterns = [
-            r'NCD\s*\d+(?:\.\d+)*',
-            r'LCD\s*\d+(?:\.\d+)*',
-            r'CPB\s*\d+(?:\.\d+)*',
-            r'CG-\w+-\d+'
-        ]
-
-        for pattern in policy_patterns:
-            citations.extend(re.findall(pattern, text, re.IGNORECASE))
-
-        return list(set(citations))  # Remove duplicates
+        return list(_find_citations(text))
 
     def _calculate_authority_rank(self, doc: DOC) -> float:
         """Calculate authority ranking based on document type and source."""
@@ -317,7 +325,7 @@ class HierarchicalChunker:
     def _enrich_chunk(self, chunk: CHUNK, doc: DOC) -> CHUNK:
         """Enrich chunk with additional metadata and topics."""
         # Extract topics from chunk text
-        topics = self._extract_topics(chunk.text)
+        topics = self._extract_topics(chunk.text_lower)
 
         # Combine with document-level tags
         all_topics = list(set(topics + doc.tags))
@@ -327,28 +335,13 @@ class HierarchicalChunker:
 
         return chunk
 
-    def _extract_topics(self, text: str) -> List[str]:
-        """Extract healthcare topics from text."""
-        topics = []
-        text_lower = text.lower()
-
-        # Healthcare topic keywords
-        topic_keywords = {
-            'prior_authorization': ['prior authorization', 'preauthorization', 'pre-auth'],
-            'medical_necessity': ['medical necessity', 'medically necessary', 'clinical necessity'],
-            'appeals': ['appeal', 'grievance', 'external review', 'independent review'],
-            'claims': ['claim', 'reimbursement', 'payment', 'billing'],
-            'coverage': ['coverage', 'covered service', 'benefit'],
-            'dme': ['durable medical equipment', 'prosthetic', 'orthotic'],
-            'diagnostic': ['diagnostic', 'laboratory', 'pathology', 'radiology'],
-            'emergency': ['emergency', 'urgent care', 'trauma'],
-            'behavioral_health': ['mental health', 'behavioral health', 'substance abuse'],
-            'pharmacy': ['prescription', 'drug', 'medication', 'pharmaceutical'],
-            'balance_billing': ['balance billing', 'surprise billing', 'out-of-network']
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                topics.append(topic)
-
-        return topics
\ No newline at end of file
+    def _extract_topics(self, text_lower: str) -> List[str]:
+        """Extract healthcare topics from lowercased text."""
+        if TOPIC_AUTOMATON is not None:
+            found = {topic for _, topic in TOPIC_AUTOMATON.iter(text_lower)}
+            return [topic for topic in TOPIC_KEYWORDS if topic in found]
+
+        return [
+            topic for topic, keywords in TOPIC_KEYWORDS.items()
+            if any(keyword in text_lower for keyword in keywords)
+        ]
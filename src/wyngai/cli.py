@@ -8,7 +8,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from .registry import RegistryManager
+from .registry import get_registry_manager
 from .utils.config import Config
 
 app = typer.Typer(help="WyngAI - Healthcare billing and appeals LLM training infrastructure")
@@ -36,12 +36,10 @@ def write_excel(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    manager = RegistryManager()
-    manager.write_excel(output_path)
-
-    # Also write CSV
+    manager = get_registry_manager()
+    # Also write CSV, from the same DataFrame
     csv_path = output_path.with_suffix('.csv')
-    manager.write_csv(csv_path)
+    manager.write_both(output_path, csv_path)
 
     console.print(f"✅ Registry exported to {output_path} and {csv_path}")
 
@@ -49,7 +47,7 @@ def write_excel(
 @registry_app.command("list")
 def list_sources():
     """List all sources in the registry."""
-    manager = RegistryManager()
+    manager = get_registry_manager()
 
     table = Table(title="WyngAI Source Registry")
     table.add_column("Category", style="cyan")
@@ -71,7 +69,7 @@ def list_sources():
 @registry_app.command("categories")
 def list_categories():
     """List all source categories."""
-    manager = RegistryManager()
+    manager = get_registry_manager()
     categories = manager.get_categories()
 
     console.print("📁 Source Categories:")
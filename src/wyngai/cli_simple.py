@@ -2,20 +2,41 @@
 Simplified CLI interface for WyngAI.
 """
 
+import io
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, TextIO
 from datetime import date, timedelta
 import typer
 from rich.console import Console
 
-from .registry import RegistryManager
-from .fetch.ecfr import eCFRFetcher
-from .fetch.federal_register import FederalRegisterFetcher
+from .registry import get_registry_manager
+from .schemas import CHUNK, DOC
 
-app = typer.Typer(help="WyngAI - Healthcare billing and appeals LLM training infrastructure")
+# Optional zstandard compression for JSONL files
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+app = typer.Typer(
+    help="WyngAI - Healthcare billing and appeals LLM training infrastructure",
+    add_completion=False
+)
 console = Console()
 
 
+def _count(items: Iterable) -> int:
+    """Consume an iterable, returning how many items it produced."""
+    return sum(1 for _ in items)
+
+
 @app.command()
 def version():
     """Show version information."""
@@ -33,12 +54,10 @@ def write_excel(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    manager = RegistryManager()
-    manager.write_excel(output_path)
-
-    # Also write CSV
+    manager = get_registry_manager()
+    # Also write CSV, from the same DataFrame
     csv_path = output_path.with_suffix('.csv')
-    manager.write_csv(csv_path)
+    manager.write_both(output_path, csv_path)
 
     console.print(f"✅ Registry exported to {output_path} and {csv_path}")
 
@@ -46,7 +65,7 @@ def write_excel(
 @app.command("list-sources")
 def list_sources():
     """List all sources in the registry."""
-    manager = RegistryManager()
+    manager = get_registry_manager()
 
     from rich.table import Table
     table = Table(title="WyngAI Source Registry")
@@ -69,7 +88,7 @@ def list_sources():
 @app.command("list-categories")
 def list_categories():
     """List all source categories."""
-    manager = RegistryManager()
+    manager = get_registry_manager()
     categories = manager.get_categories()
 
     console.print("📁 Source Categories:")
@@ -86,29 +105,31 @@ def fetch_ecfr(
     sections: Optional[str] = typer.Option(
         None,
         help="Comma-separated list of specific sections to fetch"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached API responses and refetch"
     )
 ):
     """Fetch eCFR sections."""
     console.print("🔄 Fetching eCFR sections...")
 
-    fetcher = eCFRFetcher()
+    import asyncio
+    from .fetch.ecfr import eCFRFetcher
+
+    fetcher = eCFRFetcher(refresh_cache=no_cache)
 
     if sections:
         # Fetch specific sections
         section_list = [s.strip() for s in sections.split(',')]
-        saved_paths = []
-
-        for section in section_list:
-            console.print(f"Fetching section: {section}")
-            section_data = fetcher.fetch_section(section)
-            if section_data:
-                saved_path = fetcher.save_section(section_data, output_dir)
-                saved_paths.append(saved_path)
+        console.print(f"Fetching {len(section_list)} sections concurrently")
+        num_saved = len(asyncio.run(fetcher.afetch_sections(section_list, output_dir)))
     else:
         # Fetch key healthcare sections
-        saved_paths = fetcher.fetch_key_sections(output_dir)
+        num_saved = len(asyncio.run(fetcher.afetch_key_sections(output_dir)))
 
-    console.print(f"✅ Fetched {len(saved_paths)} sections to {output_dir}")
+    console.print(f"✅ Fetched {num_saved} sections to {output_dir}")
 
 
 @app.command("fetch-fedreg")
@@ -124,6 +145,11 @@ def fetch_federal_register(
     fetch_content: bool = typer.Option(
         False,
         help="Fetch full HTML content (slower)"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached API responses and refetch"
     )
 ):
     """Fetch Federal Register documents."""
@@ -132,40 +158,59 @@ def fetch_federal_register(
     since_date = date.today() - timedelta(days=since_days)
     console.print(f"Fetching documents since: {since_date}")
 
-    fetcher = FederalRegisterFetcher()
-    saved_paths = fetcher.fetch_healthcare_documents(
+    from .fetch.federal_register import FederalRegisterFetcher
+
+    fetcher = FederalRegisterFetcher(refresh_cache=no_cache)
+    num_saved = _count(fetcher.fetch_healthcare_documents(
         output_dir=output_dir,
         since_date=since_date,
         fetch_content=fetch_content
-    )
+    ))
 
-    console.print(f"✅ Fetched {len(saved_paths)} documents to {output_dir}")
+    console.print(f"✅ Fetched {num_saved} documents to {output_dir}")
 
 
 @app.command("fetch-all")
-def fetch_all():
+def fetch_all(
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached API responses and refetch"
+    )
+):
     """Fetch data from all primary sources."""
     console.print("🔄 Fetching all primary healthcare data sources...")
 
-    # Fetch eCFR
+    import asyncio
+    from .fetch.ecfr import eCFRFetcher
+    from .fetch.federal_register import FederalRegisterFetcher
+
+    # The two sources are independent and network-bound, so fetch them concurrently
     console.print("\n📋 Fetching eCFR sections...")
-    ecfr_fetcher = eCFRFetcher()
-    ecfr_paths = ecfr_fetcher.fetch_key_sections(Path("warehouse/bronze/ecfr"))
+    ecfr_fetcher = eCFRFetcher(refresh_cache=no_cache)
 
-    # Fetch Federal Register
     console.print("\n📰 Fetching Federal Register documents...")
     since_date = date.today() - timedelta(days=180)  # Last 6 months
-    fedreg_fetcher = FederalRegisterFetcher()
-    fedreg_paths = fedreg_fetcher.fetch_healthcare_documents(
-        output_dir=Path("warehouse/bronze/fedreg"),
-        since_date=since_date,
-        fetch_content=False  # Skip content for bulk fetch
-    )
+    fedreg_fetcher = FederalRegisterFetcher(refresh_cache=no_cache)
 
-    total_files = len(ecfr_paths) + len(fedreg_paths)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # eCFR sections are fetched concurrently on their own event loop; the
+        # Federal Register generator runs on its worker thread as it is counted
+        ecfr_future = executor.submit(
+            lambda: len(asyncio.run(ecfr_fetcher.afetch_key_sections(Path("warehouse/bronze/ecfr"))))
+        )
+        fedreg_future = executor.submit(_count, fedreg_fetcher.fetch_healthcare_documents(
+            output_dir=Path("warehouse/bronze/fedreg"),
+            since_date=since_date,
+            fetch_content=False  # Skip content for bulk fetch
+        ))
+        num_ecfr = ecfr_future.result()
+        num_fedreg = fedreg_future.result()
+
+    total_files = num_ecfr + num_fedreg
     console.print(f"\n✅ Completed! Fetched {total_files} total files:")
-    console.print(f"  - eCFR sections: {len(ecfr_paths)}")
-    console.print(f"  - Federal Register documents: {len(fedreg_paths)}")
+    console.print(f"  - eCFR sections: {num_ecfr}")
+    console.print(f"  - Federal Register documents: {num_fedreg}")
 
 
 @app.command("parse-ecfr")
@@ -177,25 +222,35 @@ def parse_ecfr(
     output_dir: Path = typer.Option(
         Path("warehouse/silver/ecfr"),
         help="Output directory for parsed DOCs"
+    ),
+    workers: int = typer.Option(
+        1,
+        help="Parallel worker processes"
+    ),
+    compress: bool = typer.Option(
+        False,
+        help="Write zstandard-compressed JSONL (.jsonl.zst)"
     )
 ):
     """Parse eCFR data to normalized DOC format."""
     console.print("🔄 Parsing eCFR data...")
 
+    if compress and not ZSTD_AVAILABLE:
+        console.print("❌ --compress requires the zstandard package")
+        return
+
     from .parse.ecfr_parser import eCFRParser
-    import json
 
     parser = eCFRParser()
-    docs = parser.parse_directory(input_dir)
+    docs = parser.parse_directory(input_dir, workers=workers)
 
     if docs:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Save as JSONL
-        output_file = output_dir / "ecfr_docs.jsonl"
-        with open(output_file, 'w') as f:
-            for doc in docs:
-                f.write(json.dumps(doc.model_dump(), default=str) + '\n')
+        output_file = output_dir / ("ecfr_docs.jsonl.zst" if compress else "ecfr_docs.jsonl")
+        with _open_jsonl_output(output_file) as f:
+            _write_batched(f, (doc.model_dump_json() + '\n' for doc in docs))
 
         console.print(f"✅ Parsed {len(docs)} documents to {output_file}")
     else:
@@ -211,40 +266,118 @@ def chunk_documents(
     output_dir: Path = typer.Option(
         Path("warehouse/gold/chunks"),
         help="Output directory for chunks"
+    ),
+    workers: int = typer.Option(
+        1,
+        help="Parallel worker processes"
+    ),
+    compress: bool = typer.Option(
+        False,
+        help="Write zstandard-compressed JSONL (.jsonl.zst)"
     )
 ):
     """Chunk documents into retrieval units."""
     console.print("🔄 Chunking documents...")
 
+    if (compress or input_file.suffix == '.zst') and not ZSTD_AVAILABLE:
+        console.print("❌ Compressed JSONL requires the zstandard package")
+        return
+
     from .chunk.hierarchical import HierarchicalChunker
-    from .schemas import DOC
-    import json
 
     if not input_file.exists():
         console.print(f"❌ Input file not found: {input_file}")
         return
 
-    # Load documents
-    docs = []
-    with open(input_file, 'r') as f:
-        for line in f:
-            doc_data = json.loads(line)
-            docs.append(DOC(**doc_data))
+    # Stream documents through the chunker straight to disk
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / ("chunks.jsonl.zst" if compress else "chunks.jsonl")
+    num_chunks = 0
+    lines = _iter_jsonl_lines(input_file)
+
+    with _open_jsonl_output(output_file) as f:
+        if workers > 1:
+            # Fan batches of documents out to worker processes; results come back in order
+            with multiprocessing.Pool(workers, initializer=_init_chunk_worker) as pool:
+                for chunk_lines in pool.imap(_chunk_batch_worker, _batched(lines, CHUNK_BATCH_SIZE)):
+                    f.writelines(chunk_lines)
+                    num_chunks += len(chunk_lines)
+        else:
+            chunker = HierarchicalChunker()
+            docs = (DOC.model_validate_json(line) for line in lines)
+            chunk_lines = (chunk.model_dump_json() + '\n' for chunk in chunker.iter_chunks(docs))
+            num_chunks = _write_batched(f, chunk_lines)
+
+    console.print(f"✅ Created {num_chunks} chunks")
+    console.print(f"📁 Saved to {output_file}")
 
-    # Chunk documents
-    chunker = HierarchicalChunker()
-    chunks = chunker.chunk_documents(docs)
 
-    # Save chunks
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / "chunks.jsonl"
+# JSONL output is serialized in batches of lines behind a 1 MiB file buffer
+WRITE_BATCH_SIZE = 1024
+WRITE_BUFFER_SIZE = 1 << 20
 
-    with open(output_file, 'w') as f:
-        for chunk in chunks:
-            f.write(json.dumps(chunk.model_dump(), default=str) + '\n')
+# Documents sent to a chunk-docs worker process at a time
+CHUNK_BATCH_SIZE = 64
 
-    console.print(f"✅ Created {len(chunks)} chunks from {len(docs)} documents")
-    console.print(f"📁 Saved to {output_file}")
+_worker_chunker = None
+
+
+def _batched(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group lines into lists of at most size."""
+    lines = iter(lines)
+    while batch := list(islice(lines, size)):
+        yield batch
+
+
+def _write_batched(f, lines: Iterable[str]) -> int:
+    """Write lines in batches of WRITE_BATCH_SIZE, returning the number written."""
+    count = 0
+    for batch in _batched(lines, WRITE_BATCH_SIZE):
+        f.writelines(batch)
+        count += len(batch)
+    return count
+
+
+@contextmanager
+def _open_jsonl_output(path: Path) -> Iterator[TextIO]:
+    """Open a JSONL file for writing, zstandard-compressed if it ends in .zst."""
+    if path.suffix == '.zst':
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        with zstandard.open(path, 'wt', cctx=cctx, encoding='utf-8') as f:
+            yield f
+    else:
+        with open(path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+
+
+def _iter_jsonl_lines(path: Path) -> Iterator[bytes]:
+    """Yield the lines of a JSONL file, decompressing .zst files on the fly."""
+    with open(path, 'rb') as f:
+        if path.suffix == '.zst':
+            yield from io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(f))
+            return
+
+        # Plain files are read through a read-only memory map
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+
+def _init_chunk_worker():
+    """Create one chunker per worker process."""
+    global _worker_chunker
+    from .chunk.hierarchical import HierarchicalChunker
+    _worker_chunker = HierarchicalChunker()
+
+
+def _chunk_batch_worker(lines: List[str]) -> List[str]:
+    """Chunk a batch of DOC JSON lines, returning chunk JSON lines."""
+    return [
+        chunk.model_dump_json() + '\n'
+        for line in lines
+        for chunk in _worker_chunker.iter_document_chunks(DOC.model_validate_json(line))
+    ]
 
 
 @app.command("build-index")
@@ -261,27 +394,22 @@ def build_index(
     """Build hybrid RAG index."""
     console.print("🔄 Building RAG index...")
 
-    from .schemas import CHUNK
     from .rag.hybrid_index_lite import HybridIndexLite
-    import json
 
     if not chunks_file.exists():
         console.print(f"❌ Chunks file not found: {chunks_file}")
         console.print("💡 Run 'wyngai chunk-docs' first")
         return
 
-    # Load chunks
-    chunks = []
-    with open(chunks_file, 'r') as f:
-        for line in f:
-            chunk_data = json.loads(line)
-            chunks.append(CHUNK(**chunk_data))
-
-    console.print(f"📥 Loaded {len(chunks)} chunks")
+    if chunks_file.suffix == '.zst' and not ZSTD_AVAILABLE:
+        console.print("❌ Compressed JSONL requires the zstandard package")
+        return
 
-    # Build index
+    # Build index, streaming chunks straight from the (memory-mapped or compressed) file
     index = HybridIndexLite()
-    index.build_index(chunks)
+    index.build_index(CHUNK.model_validate_json(line) for line in _iter_jsonl_lines(chunks_file))
+
+    console.print(f"📥 Loaded {len(index.chunks)} chunks")
 
     # Save index
     index.save_index(index_dir)
@@ -317,14 +445,18 @@ def run_pipeline():
     console.print("\n📋 Step 1: Parsing eCFR data...")
     parse_ecfr(
         input_dir=Path("warehouse/bronze/ecfr"),
-        output_dir=Path("warehouse/silver/docs")
+        output_dir=Path("warehouse/silver/docs"),
+        workers=1,
+        compress=False
     )
 
     # Step 2: Chunk documents
     console.print("\n🔪 Step 2: Chunking documents...")
     chunk_documents(
         input_file=Path("warehouse/silver/docs/ecfr_docs.jsonl"),
-        output_dir=Path("warehouse/gold/chunks")
+        output_dir=Path("warehouse/gold/chunks"),
+        workers=1,
+        compress=False
     )
 
     # Step 3: Build index
@@ -338,6 +470,69 @@ def run_pipeline():
     console.print("\n🚀 Start RAG service with: wyngai serve-rag")
 
 
+@app.command("pipeline-fused")
+def run_pipeline_fused(
+    input_dir: Path = typer.Option(
+        Path("warehouse/bronze/ecfr"),
+        help="Input directory with eCFR JSON files"
+    ),
+    index_dir: Path = typer.Option(
+        Path("rag/index"),
+        help="Output directory for index"
+    ),
+    workers: int = typer.Option(
+        1,
+        help="Parallel parser processes"
+    ),
+    emit_intermediate: bool = typer.Option(
+        False,
+        help="Also write ecfr_docs.jsonl and chunks.jsonl as they stream past"
+    )
+):
+    """Parse, chunk and index eCFR data in one pass without intermediate files."""
+    console.print("🚀 Running fused WyngAI pipeline...")
+
+    from .chunk.hierarchical import HierarchicalChunker
+    from .parse.ecfr_parser import eCFRParser
+    from .rag.hybrid_index_lite import HybridIndexLite
+
+    # Parser and chunker are chained generators; intermediate JSONL is only written on request
+    with ExitStack() as stack:
+        docs = eCFRParser().iter_parse_directory(input_dir, workers=workers)
+        if emit_intermediate:
+            docs_dir = Path("warehouse/silver/docs")
+            docs_dir.mkdir(parents=True, exist_ok=True)
+            docs = _tee_jsonl(docs, stack.enter_context(_open_jsonl_output(docs_dir / "ecfr_docs.jsonl")))
+
+        chunks = HierarchicalChunker().iter_chunks(docs)
+        if emit_intermediate:
+            chunks_dir = Path("warehouse/gold/chunks")
+            chunks_dir.mkdir(parents=True, exist_ok=True)
+            chunks = _tee_jsonl(chunks, stack.enter_context(_open_jsonl_output(chunks_dir / "chunks.jsonl")))
+
+        chunks = list(chunks)
+
+    if not chunks:
+        console.print("⚠️  No chunks produced")
+        return
+
+    index = HybridIndexLite()
+    index.build_index(chunks)
+
+    console.print(f"📥 Indexed {len(index.chunks)} chunks")
+    index.save_index(index_dir)
+
+    console.print(f"\n✅ Pipeline complete! Index saved to {index_dir}")
+    console.print("\n🚀 Start RAG service with: wyngai serve-rag")
+
+
+def _tee_jsonl(records: Iterable, f: TextIO) -> Iterator:
+    """Pass records through unchanged while writing each one to a JSONL file."""
+    for record in records:
+        f.write(record.model_dump_json() + '\n')
+        yield record
+
+
 @app.command("demo")
 def demo():
     """Run a quick demo of the system."""
@@ -345,7 +540,7 @@ def demo():
     console.print()
 
     # Show registry stats
-    manager = RegistryManager()
+    manager = get_registry_manager()
     categories = manager.get_categories()
     console.print(f"📊 Registry: {len(manager.sources)} sources across {len(categories)} categories")
 
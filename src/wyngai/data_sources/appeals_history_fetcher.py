@@ -9,48 +9,234 @@ Fetches appeal decisions, court opinions, and docket entries from:
 - External review organization decisions
 """
 
+import asyncio
+import io
 import json
 import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import PyPDF2
 from urllib.parse import urljoin, urlparse, quote_plus
 import logging
 
 from ..schemas import DOC, DocType, Jurisdiction
 from ..utils.config import config
+from ..utils.http_cache import CachedResponse, HTTPCache, RateLimitedClient, mount_pooled_adapter
+
+# Optional PDFium bindings for faster PDF text extraction
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Optional fast JSON encoder for saved documents
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Brotli is only advertised when responses using it can be decoded
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Optional lexbor-backed parser for search-result link extraction
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Prefer the C-based lxml parser, falling back to the stdlib one
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
 
 logger = logging.getLogger(__name__)
 
+# Citation and decision-date patterns, tried in order
+CITATION_PATTERNS = [re.compile(pattern, re.I) for pattern in (
+    r'(\d+\s+F\.\s*(?:2d|3d|Supp\.?)\s*\d+)',  # Federal reporters
+    r'(\d+\s+[A-Z][a-z]*\.?\s*(?:2d|3d)?\s*\d+)',  # State reporters
+    r'(No\.\s*[A-Z]?\d+(?:-\d+)?)',  # Case numbers
+    r'(\d{4}\s+WL\s+\d+)',  # Westlaw citations
+)]
+DATE_PATTERNS = [re.compile(pattern, re.I) for pattern in (
+    r'decided\s+(\w+\s+\d{1,2},?\s+\d{4})',
+    r'filed\s+(\w+\s+\d{1,2},?\s+\d{4})',
+    r'opinion\s+filed\s+(\w+\s+\d{1,2},?\s+\d{4})',
+    r'(\w+\s+\d{1,2},?\s+\d{4})\s*(?:\n|$)'
+)]
+
+# Search-page link filters
+COURTLISTENER_LINK_RE = re.compile(r'/opinion/\d+/')
+JUSTIA_LINK_RE = re.compile(r'/cases/')
+STATE_COURT_LINK_TEXT_RE = re.compile(r'insurance|medical|health', re.I)
+IRO_LINK_RE = re.compile(r'\.pdf$|decision|appeal', re.I)
+CMS_LINK_RE = re.compile(r'appeal|decision|alj', re.I)
+HEALTHCARE_TITLE_RE = re.compile(r'insurance|medical|health|erisa|appeal', re.I)
+
+SAFE_TITLE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+SEARCH_PAGE_STRAINER = SoupStrainer('a', href=True)
+
+# Page chrome dropped before extracting case text
+CHROME_TAGS = frozenset({"script", "style", "nav", "footer", "header", "aside"})
+CONTENT_ATTR_RE = re.compile(r'content|opinion|decision|case', re.I)
+
+# Without a content container, drop site boilerplate and refuse pages this large
+BOILERPLATE_ATTR_RE = re.compile(
+    r'header|footer|sidebar|menu|navbar|breadcrumb|related|banner|advert|cookie|social|share', re.I
+)
+MAX_FALLBACK_TAGS = 5000
+
+# Retries for throttled or failing requests
+MAX_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 300.0
+
+# Sources fetched by scanning search/listing pages for case links
+SEARCHABLE_SOURCES = ("COURTLISTENER", "JUSTIA", "IRO_DECISIONS", "CMS_APPEALS")
+
+
+def retry_delay(headers, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a throttled request.
+
+    Honours a Retry-After header (seconds or HTTP date), capped at
+    MAX_RETRY_AFTER; without one, backs off exponentially up to a minute.
+    """
+    retry_after = headers.get('Retry-After') if headers else None
+    if retry_after:
+        try:
+            return min(MAX_RETRY_AFTER, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return min(MAX_RETRY_AFTER, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()))
+        except (TypeError, ValueError):
+            pass
+    return min(60.0, 2.0 ** attempt)
+
+
+class CappedRetry(Retry):
+    """urllib3 Retry that waits at most MAX_RETRY_AFTER for a Retry-After header."""
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(MAX_RETRY_AFTER, super().parse_retry_after(retry_after))
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host by a delay, independently of other hosts."""
+
+    def __init__(self, delay: float, host_delays: Optional[Dict[str, float]] = None):
+        self.delay = delay
+        self.host_delays = host_delays or {}
+        self.locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.last_request_time: Dict[str, float] = defaultdict(float)
+
+    async def wait(self, url: str) -> None:
+        """Wait until a request to url's host is allowed."""
+        host = urlparse(url).netloc
+        async with self.locks[host]:
+            delay = (self.host_delays.get(host, self.delay)
+                     - (time.monotonic() - self.last_request_time[host]))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.last_request_time[host] = time.monotonic()
+
+
+class JSONLWriter:
+    """Appends DOCs to one JSON Lines file, one compact line per document."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._file = None
+        # Async fetches save from worker threads
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'JSONLWriter':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'wb')
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._file.close()
+        logger.info(f"Saved {self.count} documents to {self.path}")
+
+    def write(self, doc: DOC) -> None:
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(doc.model_dump(), default=str)
+        else:
+            line = doc.model_dump_json().encode('utf-8')
+        with self._lock:
+            self._file.write(line + b'\n')
+            self.count += 1
+
 
 class AppealsHistoryFetcher:
     """Fetches appeal decisions and legal precedents from various court and administrative systems."""
 
-    def __init__(self):
+    def __init__(self, refresh_cache: bool = False, jsonl_output: bool = False,
+                 cache_dir: Optional[Path] = None):
+        # Court and IRO pages rarely change; keep responses for a week, then revalidate
+        self.cache = HTTPCache(cache_dir, expire_after=timedelta(days=7).total_seconds(), refresh=refresh_cache)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WyngAI/1.0 (Healthcare Training Data Pipeline)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate',
             'Connection': 'keep-alive'
         })
 
+        # Bursts of case documents need a larger pool per host; retry transient
+        # failures with backoff, honouring a 429/503 Retry-After up to MAX_RETRY_AFTER
+        mount_pooled_adapter(
+            self.session,
+            pool_maxsize=32,
+            max_retries=CappedRetry(total=MAX_RETRIES, backoff_factor=1.0, status_forcelist=RETRY_STATUSES,
+                                    respect_retry_after_header=True)
+        )
+        # Google Scholar is probed once and must see its 429 to stop, so it
+        # gets an adapter without retries (requests picks the longest prefix)
+        self.session.mount('https://scholar.google.com/', HTTPAdapter())
+
         # Conservative rate limiting for legal sites
-        self.request_delay = 4.0  # 4 seconds between requests
-        self.last_request_time = 0
+        self.request_delay = 4.0  # 4 seconds between requests to the same host
+        # Hosts that need a longer gap than request_delay
+        self.host_request_delays: Dict[str, float] = {
+            'scholar.google.com': 9.0
+        }
+        self.http = RateLimitedClient(self.session, self.cache, self.request_delay, self.host_request_delays)
+
+        self._appeal_sources = self._build_appeal_sources()
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
-        self.last_request_time = time.time()
+        # Save each source's documents to one appeals_<source>.jsonl instead of a JSON file per document
+        self.jsonl_output = jsonl_output
 
     def get_appeal_sources(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -59,6 +245,10 @@ class AppealsHistoryFetcher:
         Returns:
             Dictionary mapping source codes to source information
         """
+        return self._appeal_sources
+
+    def _build_appeal_sources(self) -> Dict[str, Dict[str, Any]]:
+        """Build the appeal source configuration (once, in __init__)."""
         return {
             "COURTLISTENER": {
                 "name": "CourtListener Federal Courts",
@@ -213,99 +403,140 @@ class AppealsHistoryFetcher:
         logger.info(f"Fetching appeal decisions from {source_info['name']}")
 
         # Different fetching strategies based on source
-        if source_code == "COURTLISTENER":
-            docs = self._fetch_courtlistener_cases(source_info, search_terms, output_dir, date_range)
-        elif source_code == "JUSTIA":
-            docs = self._fetch_justia_cases(source_info, search_terms, output_dir, date_range)
-        elif source_code == "GOOGLE_SCHOLAR":
+        if source_code == "GOOGLE_SCHOLAR":
             docs = self._fetch_google_scholar_cases(source_info, search_terms, output_dir, date_range)
-        elif source_code.startswith("STATE_COURTS_"):
-            docs = self._fetch_state_court_cases(source_info, search_terms, output_dir, date_range)
-        elif source_code == "IRO_DECISIONS":
-            docs = self._fetch_iro_decisions(source_info, search_terms, output_dir, date_range)
-        elif source_code == "CMS_APPEALS":
-            docs = self._fetch_cms_appeals(source_info, search_terms, output_dir, date_range)
+        elif source_code in SEARCHABLE_SOURCES or source_code.startswith("STATE_COURTS_"):
+            # One timestamp for the whole batch of documents
+            fetch_ts = datetime.now(timezone.utc).isoformat()
+            with self._document_writer(source_code, output_dir) as save:
+                docs = self._fetch_search_results(source_code, source_info, search_terms, save, fetch_ts)
         else:
             logger.warning(f"No fetching strategy implemented for {source_code}")
 
         return docs
 
-    def _fetch_courtlistener_cases(self, source_info: Dict[str, Any], search_terms: List[str],
-                                 output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
-        """Fetch cases from CourtListener API."""
+    def _fetch_search_results(self, source_code: str, source_info: Dict[str, Any],
+                              search_terms: List[str], save: Callable[[DOC], Any],
+                              fetch_ts: str) -> List[DOC]:
+        """Fetch a source's search pages, then each distinct case document they link to."""
         docs = []
+        link_lists = []
 
-        # Note: CourtListener API requires authentication for most endpoints
-        # This is a simplified implementation for demonstration
-        logger.info("CourtListener requires API key for full access")
+        for search_url in self._search_urls(source_code, source_info, search_terms):
+            try:
+                response = self.http.get(search_url)
+                link_lists.append(
+                    self._extract_case_links(source_code, source_info, search_url, response.content)
+                )
+            except Exception as e:
+                logger.warning(f"Error fetching from {source_info['name']}: {e}")
 
-        # Example implementation for public search
-        for term in search_terms[:2]:  # Limit searches
+        for case_url, case_title in self._unique_case_links(link_lists):
             try:
-                # Use public search interface
-                search_url = f"{source_info['base_url']}/opinion/?q={quote_plus(term)}"
+                doc = self._fetch_case_document(
+                    case_url, case_title, self._doc_source_code(source_code, source_info), source_info,
+                    fetch_ts=fetch_ts
+                )
+                if doc:
+                    docs.append(doc)
+                    save(doc)
 
-                self._rate_limit()
-                response = self.session.get(search_url, timeout=30)
-                response.raise_for_status()
+            except Exception as e:
+                logger.warning(f"Error fetching from {source_info['name']}: {e}")
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+        return docs
 
-                # Extract case links
-                case_links = soup.find_all('a', href=re.compile(r'/opinion/\d+/'))
+    def _unique_case_links(self, link_lists: List[List[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """Merge case links from several search pages, keeping the first of each URL."""
+        seen = set()
+        unique_links = []
 
-                for link in case_links[:5]:  # Limit results
-                    case_url = urljoin(source_info['base_url'], link.get('href'))
-                    case_title = link.get_text(strip=True)
+        for case_url, case_title in (link for links in link_lists for link in links):
+            # Search terms overlap heavily; compare URLs without fragment and host case
+            parts = urlparse(case_url)
+            key = parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower(), fragment='').geturl()
+            if key not in seen:
+                seen.add(key)
+                unique_links.append((case_url, case_title))
 
-                    doc = self._fetch_case_document(
-                        case_url, case_title, "COURTLISTENER", source_info
-                    )
-                    if doc:
-                        docs.append(doc)
-                        self._save_document(doc, output_dir)
+        return unique_links
 
-            except Exception as e:
-                logger.warning(f"Error fetching from CourtListener: {e}")
+    def _search_urls(self, source_code: str, source_info: Dict[str, Any],
+                     search_terms: List[str]) -> List[str]:
+        """Search or listing pages to scan for case links."""
+        if source_code == "COURTLISTENER":
+            # Note: CourtListener API requires authentication for most endpoints,
+            # so the public search interface is used instead
+            logger.info("CourtListener requires API key for full access")
+            return [f"{source_info['base_url']}/opinion/?q={quote_plus(term)}"
+                    for term in search_terms[:2]]  # Limit searches
 
-        return docs
+        if source_code == "JUSTIA":
+            return [f"{source_info['search_url']}?q={quote_plus(term)}&s=case"
+                    for term in search_terms[:2]]  # Limit searches
 
-    def _fetch_justia_cases(self, source_info: Dict[str, Any], search_terms: List[str],
-                          output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
-        """Fetch cases from Justia."""
-        docs = []
+        # State courts, IRO and CMS publish a single listing page
+        return [source_info.get('search_url', source_info['base_url'])]
 
-        for term in search_terms[:2]:  # Limit searches
-            try:
-                search_url = f"{source_info['search_url']}?q={quote_plus(term)}&s=case"
+    def _extract_case_links(self, source_code: str, source_info: Dict[str, Any],
+                            page_url: str, content: bytes) -> List[Tuple[str, str]]:
+        """
+        Extract (url, title) pairs for case documents from a search page.
 
-                self._rate_limit()
-                response = self.session.get(search_url, timeout=30)
-                response.raise_for_status()
+        Args:
+            source_code: Source identifier
+            source_info: Source configuration
+            page_url: URL the page was fetched from
+            content: Raw page body
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+        Returns:
+            List of (case_url, case_title) tuples
+        """
+        anchors = self._page_anchors(content)
+        case_links = []
 
-                # Extract case links
-                case_links = soup.find_all('a', href=re.compile(r'/cases/'))
+        if source_code == "COURTLISTENER":
+            for href, text in [a for a in anchors if COURTLISTENER_LINK_RE.search(a[0])][:5]:  # Limit results
+                case_links.append((urljoin(source_info['base_url'], href), text))
 
-                for link in case_links[:5]:  # Limit results
-                    case_url = urljoin(source_info['base_url'], link.get('href'))
-                    case_title = link.get_text(strip=True)
+        elif source_code == "JUSTIA":
+            for href, text in [a for a in anchors if JUSTIA_LINK_RE.search(a[0])][:5]:  # Limit results
+                if HEALTHCARE_TITLE_RE.search(text):
+                    case_links.append((urljoin(source_info['base_url'], href), text))
 
-                    if any(healthcare_term in case_title.lower() for healthcare_term in
-                          ['insurance', 'medical', 'health', 'erisa', 'appeal']):
+        elif source_code.startswith("STATE_COURTS_"):
+            # This would need to be customized for each state's interface
+            for href, text in [a for a in anchors if STATE_COURT_LINK_TEXT_RE.search(a[1])][:3]:  # Very limited
+                case_url = urljoin(page_url, href)
+                if case_url and text:
+                    case_links.append((case_url, text))
 
-                        doc = self._fetch_case_document(
-                            case_url, case_title, "JUSTIA", source_info
-                        )
-                        if doc:
-                            docs.append(doc)
-                            self._save_document(doc, output_dir)
+        elif source_code == "IRO_DECISIONS":
+            for href, text in [a for a in anchors if IRO_LINK_RE.search(a[0])][:10]:
+                case_links.append((urljoin(page_url, href), text or "IRO Decision"))
 
-            except Exception as e:
-                logger.warning(f"Error fetching from Justia: {e}")
+        elif source_code == "CMS_APPEALS":
+            # Look for appeals decisions and ALJ rulings
+            for href, text in [a for a in anchors if CMS_LINK_RE.search(a[0])][:8]:
+                case_links.append((urljoin(page_url, href), text or "Medicare Appeals Decision"))
 
-        return docs
+        return case_links
+
+    def _page_anchors(self, content: bytes) -> List[Tuple[str, str]]:
+        """(href, stripped text) of every <a href> on a page, in document order."""
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(content)
+            return [(node.attributes.get('href') or '', node.text(strip=True)) for node in tree.css('a[href]')]
+
+        # Only anchors are ever used, so build nothing else
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=SEARCH_PAGE_STRAINER)
+        return [(link.get('href'), link.get_text(strip=True)) for link in soup.find_all('a')]
+
+    def _doc_source_code(self, source_code: str, source_info: Dict[str, Any]) -> str:
+        """Source code recorded on fetched DOCs (state courts use their jurisdiction)."""
+        if source_code.startswith("STATE_COURTS_"):
+            return source_info.get('jurisdiction', 'STATE')
+        return source_code
 
     def _fetch_google_scholar_cases(self, source_info: Dict[str, Any], search_terms: List[str],
                                   output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
@@ -318,8 +549,7 @@ class AppealsHistoryFetcher:
             try:
                 search_url = f"{source_info['search_url']}?q={quote_plus(term + ' health insurance')}"
 
-                self._rate_limit()
-                time.sleep(5)  # Extra delay for Google
+                self.http.wait(search_url)  # Google has a longer per-host delay
 
                 response = self.session.get(search_url, timeout=30)
 
@@ -335,230 +565,205 @@ class AppealsHistoryFetcher:
 
         return docs
 
-    def _fetch_state_court_cases(self, source_info: Dict[str, Any], search_terms: List[str],
-                               output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
-        """Fetch cases from state court systems."""
-        docs = []
-        logger.info(f"Fetching from {source_info['name']}")
-
-        # State court systems often require specific search interfaces
-        # This is a generalized implementation
-        try:
-            # Many state courts have public search interfaces
-            base_url = source_info.get('search_url', source_info['base_url'])
-
-            self._rate_limit()
-            response = self.session.get(base_url, timeout=30)
-            response.raise_for_status()
-
-            # Look for searchable cases related to healthcare
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # This would need to be customized for each state's interface
-            case_links = soup.find_all('a', text=re.compile(r'insurance|medical|health', re.I))
-
-            for link in case_links[:3]:  # Very limited
-                case_url = urljoin(base_url, link.get('href', ''))
-                case_title = link.get_text(strip=True)
-
-                if case_url and case_title:
-                    doc = self._fetch_case_document(
-                        case_url, case_title, source_info.get('jurisdiction', 'STATE'), source_info
-                    )
-                    if doc:
-                        docs.append(doc)
-                        self._save_document(doc, output_dir)
-
-        except Exception as e:
-            logger.warning(f"Error fetching state court cases: {e}")
-
-        return docs
+    def _fetch_case_document(self, url: str, title: str, source_code: str,
+                           source_info: Dict[str, Any],
+                           fetch_ts: Optional[str] = None) -> Optional[DOC]:
+        """
+        Fetch and parse a specific case document.
 
-    def _fetch_iro_decisions(self, source_info: Dict[str, Any], search_terms: List[str],
-                           output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
-        """Fetch Independent Review Organization decisions."""
-        docs = []
+        Args:
+            url: Document URL
+            title: Document title
+            source_code: Source identifier
+            source_info: Source configuration
+            fetch_ts: Batch fetch timestamp (defaults to now)
 
+        Returns:
+            DOC object or None if failed
+        """
         try:
-            # IRO decisions are often published as summary reports
-            decisions_url = source_info.get('search_url', source_info['base_url'])
-
-            self._rate_limit()
-            response = self.session.get(decisions_url, timeout=30)
-            response.raise_for_status()
+            response = self.http.get(url)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for decision documents
-            decision_links = soup.find_all('a', href=re.compile(r'\.pdf$|decision|appeal', re.I))
-
-            for link in decision_links[:10]:  # Limit results
-                doc_url = urljoin(decisions_url, link.get('href'))
-                doc_title = link.get_text(strip=True) or "IRO Decision"
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch case document {url}: {e}")
+            return None
 
-                doc = self._fetch_case_document(
-                    doc_url, doc_title, "IRO_DECISIONS", source_info
-                )
-                if doc:
-                    docs.append(doc)
-                    self._save_document(doc, output_dir)
+        return self._document_from_response(response, url, title, source_code, source_info, fetch_ts)
+
+    def _document_from_response(self, response: CachedResponse, url: str, title: str,
+                                source_code: str, source_info: Dict[str, Any],
+                                fetch_ts: Optional[str] = None) -> Optional[DOC]:
+        """Parse a case document, reusing the stored DOC if the response is unchanged."""
+        # The same page may be linked under different titles or sources
+        doc_key = [source_code, title]
+
+        if response.from_cache:
+            cached = self.cache.read_derived(response.url, "doc.json")
+            if cached is not None:
+                stored = json.loads(cached)
+                if stored['key'] == doc_key:
+                    return DOC.model_validate(stored['doc'])
+
+        doc = self._parse_case_document(url, title, source_code, source_info, response.content, fetch_ts)
+        if doc:
+            stored = {'key': doc_key, 'doc': doc.model_dump(mode='json')}
+            self.cache.store_derived(response.url, "doc.json", json.dumps(stored).encode('utf-8'))
+        return doc
+
+    def _parse_case_document(self, url: str, title: str, source_code: str,
+                             source_info: Dict[str, Any], content: bytes,
+                             fetch_ts: Optional[str] = None) -> Optional[DOC]:
+        """
+        Parse a fetched case document into a DOC.
 
-        except Exception as e:
-            logger.warning(f"Error fetching IRO decisions: {e}")
+        Args:
+            url: Document URL
+            title: Document title
+            source_code: Source identifier
+            source_info: Source configuration
+            content: Raw document body
+            fetch_ts: Batch fetch timestamp (defaults to now)
 
-        return docs
+        Returns:
+            DOC object or None if the document has too little text
+        """
+        # Sniff the PDF header rather than trusting the URL, which often has a query string
+        is_pdf = b'%PDF-' in content[:1024]
 
-    def _fetch_cms_appeals(self, source_info: Dict[str, Any], search_terms: List[str],
-                         output_dir: Path, date_range: Optional[tuple]) -> List[DOC]:
-        """Fetch CMS Medicare appeals decisions."""
-        docs = []
+        if is_pdf:
+            # Parse PDF content
+            try:
+                text_content = self._extract_pdf_text(content)
 
-        try:
-            appeals_url = source_info.get('search_url', source_info['base_url'])
+            except Exception as e:
+                logger.warning(f"Failed to parse PDF {url}: {e}")
+                return None
+        else:
+            # Parse HTML content
+            soup = BeautifulSoup(content, HTML_PARSER)
 
-            self._rate_limit()
-            response = self.session.get(appeals_url, timeout=30)
-            response.raise_for_status()
+            main_content = self._find_main_content(soup)
+            if main_content is None:
+                logger.warning(f"No main content found in oversized page {url}")
+                return None
+            text_content = main_content.get_text(separator='\n', strip=True)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+        if not text_content.strip() or len(text_content) < 500:
+            return None
 
-            # Look for appeals decisions and ALJ rulings
-            decision_links = soup.find_all('a', href=re.compile(r'appeal|decision|alj', re.I))
+        # Determine document type and jurisdiction
+        doc_type = DocType.COURT_OPINION
+        if "IRO" in source_code or "external review" in title.lower():
+            doc_type = DocType.APPEAL_DECISION
+
+        jurisdiction = Jurisdiction.FEDERAL
+        if source_info.get('jurisdiction'):
+            jurisdiction = Jurisdiction.STATE
+
+        # Extract case information
+        case_citation = self._extract_case_citation(text_content, title)
+        decision_date = self._extract_decision_date(text_content)
+
+        # Create DOC object
+        doc = DOC(
+            category=f"Appeals - {source_code}",
+            title=title,
+            doc_type=doc_type,
+            jurisdiction=jurisdiction,
+            citation=case_citation,
+            published_date=decision_date,
+            version="final",
+            url=url,
+            license="Public domain",
+            text=text_content.strip(),
+            retrieval_priority=source_info.get('authority_rank', 0.70),
+            tags=[
+                "appeal_decision",
+                "legal_precedent",
+                source_code.lower(),
+                "healthcare",
+                "insurance"
+            ] + source_info.get('key_topics', []),
+            metadata={
+                "source_code": source_code,
+                "source_name": source_info['name'],
+                "doc_format": "PDF" if is_pdf else "HTML",
+                "fetch_date": fetch_ts or datetime.now(timezone.utc).isoformat(),
+                "source_type": "appeal_decision",
+                "authority_rank": source_info.get('authority_rank', 0.70),
+                "jurisdiction": source_info.get('jurisdiction', 'federal')
+            }
+        )
 
-            for link in decision_links[:8]:  # Limit results
-                doc_url = urljoin(appeals_url, link.get('href'))
-                doc_title = link.get_text(strip=True) or "Medicare Appeals Decision"
+        return doc
 
-                doc = self._fetch_case_document(
-                    doc_url, doc_title, "CMS_APPEALS", source_info
+    def _extract_pdf_text(self, content: bytes) -> str:
+        """Extract the text of each PDF page, with PDFium when available."""
+        if PDFIUM_AVAILABLE:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                return "".join(
+                    page.get_textpage().get_text_range().replace("\r\n", "\n") + "\n" for page in pdf
                 )
-                if doc:
-                    docs.append(doc)
-                    self._save_document(doc, output_dir)
-
-        except Exception as e:
-            logger.warning(f"Error fetching CMS appeals: {e}")
+            finally:
+                pdf.close()
 
-        return docs
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
 
-    def _fetch_case_document(self, url: str, title: str, source_code: str,
-                           source_info: Dict[str, Any]) -> Optional[DOC]:
+    def _find_main_content(self, soup: BeautifulSoup):
         """
-        Fetch and parse a specific case document.
-
-        Args:
-            url: Document URL
-            title: Document title
-            source_code: Source identifier
-            source_info: Source configuration
+        Strip page chrome and locate the main content in a single tree walk.
 
-        Returns:
-            DOC object or None if failed
+        Preference order is <main>, then <article>, then a div whose class and
+        then id look like content. Otherwise the whole page is used, minus
+        elements whose class or id look like site boilerplate (never <html>,
+        <body> or wrappers holding most of the text); pages too large for that
+        to be a single opinion return None.
         """
-        try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            text_content = ""
-
-            if url.lower().endswith('.pdf'):
-                # Parse PDF content
-                try:
-                    import io
-                    pdf_file = io.BytesIO(response.content)
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-                    for page in pdf_reader.pages:
-                        text_content += page.extract_text() + "\n"
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse PDF {url}: {e}")
-                    return None
-            else:
-                # Parse HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                    script.decompose()
-
-                # Look for main content areas
-                main_content = (
-                    soup.find('main') or
-                    soup.find('article') or
-                    soup.find('div', class_=re.compile(r'content|opinion|decision|case', re.I)) or
-                    soup.find('div', id=re.compile(r'content|opinion|decision|case', re.I)) or
-                    soup
-                )
-
-                text_content = main_content.get_text(separator='\n', strip=True)
+        candidates = {}
+        boilerplate = []
+        tag_count = 0
 
-            if not text_content.strip() or len(text_content) < 500:
-                return None
+        for tag in soup.find_all(True):
+            if tag.decomposed:  # inside chrome removed earlier in the walk
+                continue
+            if tag.name in CHROME_TAGS:
+                tag.decompose()
+                continue
 
-            # Determine document type and jurisdiction
-            doc_type = DocType.COURT_OPINION
-            if "IRO" in source_code or "external review" in title.lower():
-                doc_type = DocType.APPEAL_DECISION
-
-            jurisdiction = Jurisdiction.FEDERAL
-            if source_info.get('jurisdiction'):
-                jurisdiction = Jurisdiction.STATE
-
-            # Extract case information
-            case_citation = self._extract_case_citation(text_content, title)
-            decision_date = self._extract_decision_date(text_content)
-
-            # Create DOC object
-            doc = DOC(
-                category=f"Appeals - {source_code}",
-                title=title,
-                doc_type=doc_type,
-                jurisdiction=jurisdiction,
-                citation=case_citation,
-                published_date=decision_date,
-                version="final",
-                url=url,
-                license="Public domain",
-                text=text_content.strip(),
-                retrieval_priority=source_info.get('authority_rank', 0.70),
-                tags=[
-                    "appeal_decision",
-                    "legal_precedent",
-                    source_code.lower(),
-                    "healthcare",
-                    "insurance"
-                ] + source_info.get('key_topics', []),
-                metadata={
-                    "source_code": source_code,
-                    "source_name": source_info['name'],
-                    "doc_format": "PDF" if url.lower().endswith('.pdf') else "HTML",
-                    "fetch_date": datetime.now(timezone.utc).isoformat(),
-                    "source_type": "appeal_decision",
-                    "authority_rank": source_info.get('authority_rank', 0.70),
-                    "jurisdiction": source_info.get('jurisdiction', 'federal')
-                }
-            )
+            tag_count += 1
+            if tag.name in ('main', 'article'):
+                candidates.setdefault(tag.name, tag)
+            elif tag.name == 'div':
+                if any(CONTENT_ATTR_RE.search(value) for value in tag.get('class', [])):
+                    candidates.setdefault('div_class', tag)
+                if CONTENT_ATTR_RE.search(tag.get('id', '')):
+                    candidates.setdefault('div_id', tag)
+            if tag.name in ('html', 'body'):
+                continue
+            if (any(BOILERPLATE_ATTR_RE.search(value) for value in tag.get('class', []))
+                    or BOILERPLATE_ATTR_RE.search(tag.get('id', ''))):
+                boilerplate.append(tag)
 
-            return doc
+        for kind in ('main', 'article', 'div_class', 'div_id'):
+            if kind in candidates:
+                return candidates[kind]
 
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch case document {url}: {e}")
+        if tag_count > MAX_FALLBACK_TAGS:
             return None
+        page_text_length = len(soup.get_text())
+        for tag in boilerplate:
+            # A wrapper holding most of the page's text is the page, not chrome
+            if not tag.decomposed and len(tag.get_text()) * 2 <= page_text_length:
+                tag.decompose()
+        return soup
 
     def _extract_case_citation(self, text: str, title: str) -> Optional[str]:
         """Extract legal citation from case text."""
         # Look for common citation patterns
-        citation_patterns = [
-            r'(\d+\s+F\.\s*(?:2d|3d|Supp\.?)\s*\d+)',  # Federal reporters
-            r'(\d+\s+[A-Z][a-z]*\.?\s*(?:2d|3d)?\s*\d+)',  # State reporters
-            r'(No\.\s*[A-Z]?\d+(?:-\d+)?)',  # Case numbers
-            r'(\d{4}\s+WL\s+\d+)',  # Westlaw citations
-        ]
-
-        for pattern in citation_patterns:
-            match = re.search(pattern, text, re.I)
+        for pattern in CITATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
@@ -567,25 +772,27 @@ class AppealsHistoryFetcher:
 
     def _extract_decision_date(self, text: str) -> Optional[datetime]:
         """Extract decision date from case text."""
-        date_patterns = [
-            r'decided\s+(\w+\s+\d{1,2},?\s+\d{4})',
-            r'filed\s+(\w+\s+\d{1,2},?\s+\d{4})',
-            r'opinion\s+filed\s+(\w+\s+\d{1,2},?\s+\d{4})',
-            r'(\w+\s+\d{1,2},?\s+\d{4})\s*(?:\n|$)'
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.I)
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_str = match.group(1)
                 try:
-                    from dateutil import parser
-                    return parser.parse(date_str)
-                except:
+                    return date_parser.parse(date_str)
+                except (ValueError, OverflowError):
                     continue
 
         return None
 
+    @contextmanager
+    def _document_writer(self, source_code: str, output_dir: Path) -> Iterator[Callable[[DOC], Any]]:
+        """Yield a function saving one DOC, to the source's JSONL file or its own JSON file."""
+        if not self.jsonl_output:
+            yield lambda doc: self._save_document(doc, output_dir)
+            return
+
+        with JSONLWriter(output_dir / f"appeals_{source_code.lower()}.jsonl") as writer:
+            yield writer.write
+
     def _save_document(self, doc: DOC, output_dir: Path) -> Path:
         """
         Save document to JSON file.
@@ -601,13 +808,16 @@ class AppealsHistoryFetcher:
 
         # Create filename
         source_code = doc.metadata.get('source_code', 'unknown')
-        safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', doc.title)[:50]
+        safe_title = SAFE_TITLE_RE.sub('_', doc.title)[:50]
         filename = f"{source_code}_{safe_title}_{doc.source_id}.json"
 
         output_path = output_dir / filename
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(doc.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(doc.model_dump(), default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(doc.model_dump(), f, indent=2, ensure_ascii=False, default=str)
 
         logger.info(f"Saved {doc.title} to {output_path}")
         return output_path
@@ -616,7 +826,7 @@ class AppealsHistoryFetcher:
                          source_codes: Optional[List[str]] = None,
                          search_terms: Optional[List[str]] = None) -> Dict[str, List[DOC]]:
         """
-        Fetch appeal decisions from multiple sources.
+        Fetch appeal decisions from multiple sources, one thread per source.
 
         Args:
             output_dir: Directory to save documents
@@ -626,26 +836,169 @@ class AppealsHistoryFetcher:
         Returns:
             Dictionary mapping source codes to lists of DOC objects
         """
-        all_sources = self.get_appeal_sources()
-
         if source_codes is None:
             # Start with most reliable sources
             source_codes = ['IRO_DECISIONS', 'CMS_APPEALS', 'JUSTIA']
 
         results = {}
 
-        for source_code in source_codes:
-            logger.info(f"Processing appeals source: {source_code}")
+        # Sources live on different hosts and self.http spaces requests per
+        # host, so sources can be fetched side by side
+        with ThreadPoolExecutor(max_workers=max(1, len(source_codes))) as executor:
+            futures = {}
+            for source_code in source_codes:
+                logger.info(f"Processing appeals source: {source_code}")
+                source_output_dir = output_dir / f"appeals_{source_code.lower()}"
+                future = executor.submit(self.fetch_appeal_decisions, source_code, source_output_dir, search_terms)
+                futures[future] = source_code
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
 
-            source_output_dir = output_dir / f"appeals_{source_code.lower()}"
-            docs = self.fetch_appeal_decisions(source_code, source_output_dir, search_terms)
+        return {source_code: results[source_code] for source_code in source_codes}
 
-            results[source_code] = docs
+    async def afetch_appeal_decisions(self, source_code: str, output_dir: Path,
+                                      search_terms: Optional[List[str]] = None) -> List[DOC]:
+        """
+        Fetch appeal decisions from a specific source with aiohttp.
 
-            # Longer delay between sources to be respectful
-            time.sleep(15.0)
+        Search pages and case documents are requested concurrently; requests to
+        the same host are still spaced request_delay apart.
+
+        Args:
+            source_code: Source identifier (e.g., 'COURTLISTENER', 'JUSTIA')
+            output_dir: Directory to save fetched documents
+            search_terms: Custom search terms (defaults to source's key terms)
+
+        Returns:
+            List of DOC objects for parsed decisions
+        """
+        async with self._aclient_session() as session:
+            return await self._afetch_source(
+                session, HostRateLimiter(self.request_delay, self.host_request_delays),
+                source_code, output_dir, search_terms
+            )
+
+    async def afetch_all_sources(self, output_dir: Path,
+                                 source_codes: Optional[List[str]] = None,
+                                 search_terms: Optional[List[str]] = None) -> Dict[str, List[DOC]]:
+        """
+        Fetch appeal decisions from multiple sources concurrently.
 
-        return results
+        Args:
+            output_dir: Directory to save documents
+            source_codes: List of source codes to fetch (defaults to reliable sources)
+            search_terms: Custom search terms
+
+        Returns:
+            Dictionary mapping source codes to lists of DOC objects
+        """
+        if source_codes is None:
+            # Start with most reliable sources
+            source_codes = ['IRO_DECISIONS', 'CMS_APPEALS', 'JUSTIA']
+
+        limiter = HostRateLimiter(self.request_delay, self.host_request_delays)
+
+        async with self._aclient_session() as session:
+            results = await asyncio.gather(*(
+                self._afetch_source(session, limiter, source_code,
+                                    output_dir / f"appeals_{source_code.lower()}", search_terms)
+                for source_code in source_codes
+            ))
+
+        return dict(zip(source_codes, results))
+
+    def _aclient_session(self) -> aiohttp.ClientSession:
+        """aiohttp session with this fetcher's headers and a bounded connection pool."""
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300)
+        # aiohttp manages keep-alive itself
+        headers = {key: value for key, value in self.session.headers.items() if key != 'Connection'}
+        return aiohttp.ClientSession(connector=connector, headers=headers)
+
+    async def _afetch_source(self, session: aiohttp.ClientSession, limiter: HostRateLimiter,
+                             source_code: str, output_dir: Path,
+                             search_terms: Optional[List[str]]) -> List[DOC]:
+        """Async variant of fetch_appeal_decisions."""
+        appeal_sources = self.get_appeal_sources()
+
+        if source_code not in appeal_sources:
+            logger.warning(f"No source configured for: {source_code}")
+            return []
+
+        source_info = appeal_sources[source_code]
+
+        if search_terms is None:
+            search_terms = source_info.get('search_terms', [])
+
+        logger.info(f"Fetching appeal decisions from {source_info['name']}")
+
+        if source_code == "GOOGLE_SCHOLAR":
+            # Scholar is a single throttled probe; keep it on the sync session
+            return await asyncio.to_thread(
+                self._fetch_google_scholar_cases, source_info, search_terms, output_dir, None
+            )
+        if source_code not in SEARCHABLE_SOURCES and not source_code.startswith("STATE_COURTS_"):
+            logger.warning(f"No fetching strategy implemented for {source_code}")
+            return []
+
+        async def fetch_links(search_url: str) -> List[Tuple[str, str]]:
+            try:
+                response = await self._aget(session, limiter, search_url)
+                return self._extract_case_links(source_code, source_info, search_url, response.content)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Error fetching from {source_info['name']}: {e}")
+                return []
+
+        async def fetch_document(case_url: str, case_title: str) -> Optional[DOC]:
+            try:
+                response = await self._aget(session, limiter, case_url)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Failed to fetch case document {case_url}: {e}")
+                return None
+            try:
+                # PDF and HTML parsing is CPU-bound; keep it off the event loop
+                doc = await asyncio.to_thread(
+                    self._document_from_response, response, case_url, case_title,
+                    self._doc_source_code(source_code, source_info), source_info, fetch_ts
+                )
+                if doc:
+                    await asyncio.to_thread(save, doc)
+                return doc
+            except Exception as e:
+                logger.warning(f"Error fetching from {source_info['name']}: {e}")
+                return None
+
+        fetch_ts = datetime.now(timezone.utc).isoformat()
+        link_lists = await asyncio.gather(
+            *(fetch_links(url) for url in self._search_urls(source_code, source_info, search_terms))
+        )
+        with self._document_writer(source_code, output_dir) as save:
+            docs = await asyncio.gather(
+                *(fetch_document(case_url, case_title) for case_url, case_title in self._unique_case_links(link_lists))
+            )
+
+        return [doc for doc in docs if doc]
+
+    async def _aget(self, session: aiohttp.ClientSession, limiter: HostRateLimiter,
+                    url: str) -> CachedResponse:
+        """
+        GET a URL through the response cache once its host's rate limit allows.
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            entry = self.cache.lookup(url)
+            if entry is None or not self.cache.is_fresh(entry):
+                await limiter.wait(url)
+            try:
+                return await self.cache.aget(session, url, timeout=30)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                delay = retry_delay(e.headers, attempt)
+                logger.info(f"HTTP {e.status} from {url}, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
 
     def search_appeal_precedents(self, query: str,
                                jurisdiction: Optional[str] = None) -> List[Dict[str, Any]]:
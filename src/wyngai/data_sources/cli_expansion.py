@@ -7,16 +7,20 @@ for healthcare regulations, payer policies, and appeal decisions.
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import sys
+from collections import deque
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from .data_expansion_pipeline import DataExpansionPipeline
 from .state_doi_fetcher import StateDOIFetcher
 from .payer_policy_fetcher import PayerPolicyFetcher
 from .appeals_history_fetcher import AppealsHistoryFetcher
+from ..schemas import DOC
 
 # Configure logging
 logging.basicConfig(
@@ -26,9 +30,12 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on states/payers fetched at the same time
+MAX_CONCURRENT_FETCHES = 8
 
-def main():
-    """Main CLI entry point."""
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description='WyngAI Healthcare Data Expansion System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -103,6 +110,38 @@ Examples:
         help='Update RAG index after fetching'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for chunking documents in full mode (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--parallel-stages',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Fetch state DOI, payer and appeals stages concurrently in full mode (default: on)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached responses and refetch pages'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        help='Directory for cached HTTP responses (default: warehouse/.http_cache)'
+    )
+
+    parser.add_argument(
+        '--jsonl',
+        action='store_true',
+        help='Save appeal decisions as one JSONL file per source'
+    )
+
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -115,7 +154,16 @@ Examples:
         help='Enable verbose logging'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built once so repeated main() calls (e.g. batch harnesses) skip parser setup
+_PARSER = _build_parser()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    args = _PARSER.parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -144,12 +192,17 @@ def run_full_expansion(args):
         logger.info(f"  Output directory: {args.output_dir}")
         logger.info(f"  Max docs per source: {args.max_docs}")
         logger.info(f"  Update index: {args.update_index}")
+        logger.info(f"  Parallel fetch stages: {args.parallel_stages}")
+        logger.info(f"  Chunking jobs: {args.jobs}")
         return
 
     # Initialize pipeline
     pipeline = DataExpansionPipeline(
         base_output_dir=args.output_dir,
-        index_dir=args.output_dir / "hybrid_index"
+        index_dir=args.output_dir / "hybrid_index",
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        refresh_cache=args.no_cache
     )
 
     # Configure expansion
@@ -163,24 +216,41 @@ def run_full_expansion(args):
         "appeal_sources": args.sources or ["IRO_DECISIONS", "CMS_APPEALS"],
         "process_documents": True,
         "update_index": args.update_index,
+        "parallel_fetching": args.parallel_stages,
         "max_documents_per_source": args.max_docs
     }
 
-    # Run pipeline
-    results = pipeline.run_full_expansion(expansion_config)
+    # Run pipeline, keeping only running totals of its progress events
+    documents_fetched = 0
+    chunks_created = 0
+    error_count = 0
+    recent_errors = deque(maxlen=3)
+    results = {}
+
+    for event in pipeline.stream_full_expansion(expansion_config):
+        if event["type"] == "docs_fetched":
+            documents_fetched += event["count"]
+            print(f"Fetched {event['count']} documents from {event['source']}")
+        elif event["type"] == "chunks_created":
+            chunks_created += event["count"]
+        elif event["type"] == "error":
+            error_count += 1
+            recent_errors.append(f"[{event['stage']}] {event['error']}")
+        elif event["type"] == "summary":
+            results = event["results"]
 
     # Print summary
     print("\n" + "="*60)
     print("DATA EXPANSION SUMMARY")
     print("="*60)
     print(f"Duration: {results['duration_minutes']:.1f} minutes")
-    print(f"Documents fetched: {results['documents_fetched']}")
-    print(f"Chunks created: {results['chunks_created']}")
+    print(f"Documents fetched: {documents_fetched}")
+    print(f"Chunks created: {chunks_created}")
     print(f"Index updated: {results['index_updated']}")
 
-    if results.get('errors'):
-        print(f"Errors: {len(results['errors'])}")
-        for error in results['errors'][:3]:  # Show first 3 errors
+    if error_count:
+        print(f"Errors: {error_count}")
+        for error in recent_errors:  # Show the last 3 errors
             print(f"  - {error}")
 
     print(f"\nResults saved to: {args.output_dir}")
@@ -198,14 +268,17 @@ def run_state_doi_fetching(args):
         logger.info(f"DRY RUN: Would fetch DOI regulations for states: {args.states}")
         return
 
-    fetcher = StateDOIFetcher()
-
-    for state_code in args.states:
-        logger.info(f"Fetching regulations for {state_code}")
+    fetcher = StateDOIFetcher(cache_dir=args.cache_dir, refresh_cache=args.no_cache)
+    output_dirs = _make_output_dirs(args.output_dir, "state", args.states)
 
-        state_output_dir = args.output_dir / f"state_{state_code.lower()}"
-        docs = fetcher.fetch_state_regulations(state_code, state_output_dir)
+    # Each state's DOI is a separate site, so fetch states concurrently
+    logger.info(f"Fetching regulations for {', '.join(args.states)}")
+    results = asyncio.run(_fetch_concurrently(
+        lambda state_code: fetcher.fetch_state_regulations(state_code, output_dirs[state_code]),
+        args.states
+    ))
 
+    for state_code, docs in results.items():
         print(f"Fetched {len(docs)} documents for {state_code}")
 
     print(f"State DOI data saved to: {args.output_dir}")
@@ -224,16 +297,17 @@ def run_payer_policy_fetching(args):
         logger.info(f"DRY RUN: Policy types: {args.policy_types}")
         return
 
-    fetcher = PayerPolicyFetcher()
+    fetcher = PayerPolicyFetcher(cache_dir=args.cache_dir, refresh_cache=args.no_cache)
+    output_dirs = _make_output_dirs(args.output_dir, "payer", args.payers)
 
-    for payer_code in args.payers:
-        logger.info(f"Fetching policies for {payer_code}")
-
-        payer_output_dir = args.output_dir / f"payer_{payer_code.lower()}"
-        docs = fetcher.fetch_payer_policies(
-            payer_code, payer_output_dir, args.policy_types
-        )
+    # Payers are on separate sites, so fetch them concurrently
+    logger.info(f"Fetching policies for {', '.join(args.payers)}")
+    results = asyncio.run(_fetch_concurrently(
+        lambda payer_code: fetcher.fetch_payer_policies(payer_code, output_dirs[payer_code], args.policy_types),
+        args.payers
+    ))
 
+    for payer_code, docs in results.items():
         print(f"Fetched {len(docs)} policies for {payer_code}")
 
     print(f"Payer policy data saved to: {args.output_dir}")
@@ -251,19 +325,45 @@ def run_appeals_fetching(args):
         logger.info(f"DRY RUN: Would fetch appeals from sources: {args.sources}")
         return
 
-    fetcher = AppealsHistoryFetcher()
-
-    for source_code in args.sources:
-        logger.info(f"Fetching appeals from {source_code}")
+    fetcher = AppealsHistoryFetcher(refresh_cache=args.no_cache, jsonl_output=args.jsonl,
+                                    cache_dir=args.cache_dir)
 
-        source_output_dir = args.output_dir / f"appeals_{source_code.lower()}"
-        docs = fetcher.fetch_appeal_decisions(source_code, source_output_dir)
+    # Sources are on different hosts, so fetch them concurrently
+    logger.info(f"Fetching appeals from {', '.join(args.sources)}")
+    results = asyncio.run(fetcher.afetch_all_sources(args.output_dir, args.sources))
 
+    for source_code, docs in results.items():
         print(f"Fetched {len(docs)} decisions from {source_code}")
 
     print(f"Appeals data saved to: {args.output_dir}")
 
 
+def _make_output_dirs(output_dir: Path, prefix: str, codes: List[str]) -> Dict[str, Path]:
+    """Create each code's <prefix>_<code> directory up front, before fetchers start."""
+    output_dirs = {code: output_dir / f"{prefix}_{code.lower()}" for code in codes}
+    for path in output_dirs.values():
+        path.mkdir(parents=True, exist_ok=True)
+    return output_dirs
+
+
+async def _fetch_concurrently(fetch: Callable[[str], List[DOC]],
+                              codes: List[str]) -> Dict[str, List[DOC]]:
+    """
+    Run a blocking per-code fetch for every code in worker threads.
+
+    At most MAX_CONCURRENT_FETCHES run at once; the fetchers space out
+    requests to each host themselves.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch_one(code: str) -> List[DOC]:
+        async with semaphore:
+            return await asyncio.to_thread(fetch, code)
+
+    results = await asyncio.gather(*(fetch_one(code) for code in codes))
+    return dict(zip(codes, results))
+
+
 def show_expansion_status(args):
     """Show current expansion system status."""
     logger.info("Checking expansion system status")
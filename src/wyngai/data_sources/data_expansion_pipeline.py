@@ -7,10 +7,12 @@ regulations, payer policies, and appeal decisions from multiple sources.
 
 import json
 import logging
+import multiprocessing
+import queue
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Any, Tuple, Union
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
@@ -23,9 +25,63 @@ from ..chunk.hierarchical import HierarchicalChunker
 from rag.hybrid_index_lite import HybridIndexLite as HybridIndex
 from ..utils.config import config
 
+# Optional fast JSON encoder/decoder for documents, chunks and results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Indented UTF-8 JSON, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, via orjson when available."""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Document files sent to a chunking worker process at a time
+CHUNK_TASK_SIZE = 16
+
+_worker_chunker = None
+
+
+def _chunk_document_file(chunker: HierarchicalChunker, doc_file: Path) -> Tuple[int, str]:
+    """Chunk one saved DOC into chunks/<source_id>_chunks.json; returns (chunk count, title)."""
+    doc = DOC(**_read_json(doc_file))
+    chunks = chunker.chunk_document(doc)
+
+    # Apply authority ranking to chunks
+    for chunk in chunks:
+        chunk.authority_rank = doc.retrieval_priority
+
+    chunk_file = doc_file.parent / "chunks" / f"{doc.source_id}_chunks.json"
+    chunk_file.write_bytes(_dumps([chunk.model_dump() for chunk in chunks]))
+    return len(chunks), doc.title
+
+
+def _init_chunk_worker():
+    """Create one chunker per worker process."""
+    global _worker_chunker
+    _worker_chunker = HierarchicalChunker()
+
+
+def _chunk_file_worker(doc_file: Path) -> Tuple[Path, int, Optional[str], Optional[str]]:
+    """Chunk a document file in a worker process; returns (file, count, title, error)."""
+    try:
+        return (doc_file, *_chunk_document_file(_worker_chunker, doc_file), None)
+    except Exception as e:
+        return doc_file, 0, None, str(e)
+
+
 class DataExpansionPipeline:
     """
     Orchestrates the comprehensive data expansion for WyngAI.
@@ -35,14 +91,17 @@ class DataExpansionPipeline:
     authority ranking and provenance tracking.
     """
 
-    def __init__(self, base_output_dir: Path, index_dir: Optional[Path] = None):
+    def __init__(self, base_output_dir: Path, index_dir: Optional[Path] = None, jobs: int = 1,
+                 cache_dir: Optional[Path] = None, refresh_cache: bool = False):
         self.base_output_dir = Path(base_output_dir)
         self.index_dir = index_dir or (self.base_output_dir / "hybrid_index")
+        # Worker processes for chunking (1 chunks in this process)
+        self.jobs = jobs
 
-        # Initialize fetchers
-        self.state_doi_fetcher = StateDOIFetcher()
-        self.payer_policy_fetcher = PayerPolicyFetcher()
-        self.appeals_history_fetcher = AppealsHistoryFetcher()
+        # Initialize fetchers, sharing the HTTP response cache settings
+        self.state_doi_fetcher = StateDOIFetcher(cache_dir=cache_dir, refresh_cache=refresh_cache)
+        self.payer_policy_fetcher = PayerPolicyFetcher(cache_dir=cache_dir, refresh_cache=refresh_cache)
+        self.appeals_history_fetcher = AppealsHistoryFetcher(cache_dir=cache_dir, refresh_cache=refresh_cache)
 
         # Initialize chunker and index
         self.chunker = HierarchicalChunker()
@@ -84,6 +143,23 @@ class DataExpansionPipeline:
         Returns:
             Summary of expansion results
         """
+        for event in self.stream_full_expansion(expansion_config):
+            if event["type"] == "summary":
+                return event["results"]
+
+    def stream_full_expansion(self, expansion_config: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run the complete data expansion pipeline, yielding progress as it happens.
+
+        Events are dicts with a "type" of "docs_fetched" (stage, source,
+        count), "chunks_created" (file, count) or "error" (stage, error).
+        The last event is {"type": "summary", "results": ...}, the counts
+        also saved to pipeline_results_*.json. Fetched documents are never
+        held in memory beyond the fetch that produced them.
+
+        Args:
+            expansion_config: Configuration for what to fetch
+        """
         if expansion_config is None:
             expansion_config = self._get_default_expansion_config()
 
@@ -102,40 +178,16 @@ class DataExpansionPipeline:
         }
 
         try:
-            # Phase 1: Fetch State DOI Regulations
-            if expansion_config.get("fetch_state_doi", True):
-                logger.info("Phase 1: Fetching state DOI regulations")
-                state_results = self._fetch_state_regulations(
-                    expansion_config.get("state_codes"),
-                    expansion_config.get("state_priority_topics")
-                )
-                results["sources_processed"]["state_doi"] = state_results
-                results["documents_fetched"] += state_results.get("documents_count", 0)
-
-            # Phase 2: Fetch Payer Policies
-            if expansion_config.get("fetch_payer_policies", True):
-                logger.info("Phase 2: Fetching payer policies")
-                payer_results = self._fetch_payer_policies(
-                    expansion_config.get("payer_codes"),
-                    expansion_config.get("policy_types")
-                )
-                results["sources_processed"]["payer_policies"] = payer_results
-                results["documents_fetched"] += payer_results.get("documents_count", 0)
-
-            # Phase 3: Fetch Appeal Decisions
-            if expansion_config.get("fetch_appeals", True):
-                logger.info("Phase 3: Fetching appeal decisions")
-                appeals_results = self._fetch_appeal_decisions(
-                    expansion_config.get("appeal_sources"),
-                    expansion_config.get("appeal_search_terms")
-                )
-                results["sources_processed"]["appeals"] = appeals_results
-                results["documents_fetched"] += appeals_results.get("documents_count", 0)
+            # Phases 1-3: Fetch state DOI regulations, payer policies and appeal decisions
+            stage_results = yield from self._iter_fetch_stages(expansion_config)
+            for stage, stage_result in stage_results.items():
+                results["sources_processed"][stage] = stage_result
+                results["documents_fetched"] += stage_result.get("documents_count", 0)
 
             # Phase 4: Process and Chunk Documents
             if expansion_config.get("process_documents", True):
                 logger.info("Phase 4: Processing and chunking documents")
-                chunk_results = self._process_and_chunk_documents()
+                chunk_results = yield from self._iter_process_and_chunk_documents()
                 results["chunks_created"] = chunk_results.get("chunks_count", 0)
 
             # Phase 5: Update RAG Index
@@ -143,6 +195,8 @@ class DataExpansionPipeline:
                 logger.info("Phase 5: Updating RAG index")
                 index_results = self._update_rag_index()
                 results["index_updated"] = index_results.get("success", False)
+                for index_error in index_results["index_errors"]:
+                    yield {"type": "error", "stage": "index", "error": index_error["error"]}
 
             # Phase 6: Generate Provenance Report
             provenance_report = self._generate_provenance_report()
@@ -151,6 +205,7 @@ class DataExpansionPipeline:
         except Exception as e:
             logger.error(f"Pipeline error: {e}")
             results["errors"].append(str(e))
+            yield {"type": "error", "stage": "pipeline", "error": str(e)}
 
         finally:
             end_time = datetime.now(timezone.utc)
@@ -161,7 +216,57 @@ class DataExpansionPipeline:
             self._save_pipeline_results(results)
 
         logger.info(f"Data expansion pipeline completed in {results['duration_minutes']:.2f} minutes")
-        return results
+        yield {"type": "summary", "results": results}
+
+    def _iter_fetch_stages(self, expansion_config: Dict[str, Any]
+                           ) -> Generator[Dict[str, Any], None, Dict[str, Dict[str, Any]]]:
+        """
+        Run the enabled fetch stages, yielding their events; returns each stage's results.
+
+        With parallel_fetching the stages run side by side: they hit unrelated
+        sites and use separate fetchers, so they only compete for threads.
+        """
+        stages = {}
+        if expansion_config.get("fetch_state_doi", True):
+            stages["state_doi"] = (
+                "Phase 1: Fetching state DOI regulations", self._fetch_state_regulations,
+                expansion_config.get("state_codes"), expansion_config.get("state_priority_topics")
+            )
+        if expansion_config.get("fetch_payer_policies", True):
+            stages["payer_policies"] = (
+                "Phase 2: Fetching payer policies", self._fetch_payer_policies,
+                expansion_config.get("payer_codes"), expansion_config.get("policy_types")
+            )
+        if expansion_config.get("fetch_appeals", True):
+            stages["appeals"] = (
+                "Phase 3: Fetching appeal decisions", self._fetch_appeal_decisions,
+                expansion_config.get("appeal_sources"), expansion_config.get("appeal_search_terms")
+            )
+
+        if not stages:
+            return {}
+
+        # Stage threads report events here; None marks a finished stage
+        events: queue.Queue = queue.Queue()
+
+        def run_stage(message: str, fetch: Callable[..., Dict[str, Any]], *fetch_args) -> Dict[str, Any]:
+            logger.info(message)
+            try:
+                return fetch(*fetch_args, emit=events.put)
+            finally:
+                events.put(None)
+
+        max_workers = min(len(stages), self.config["max_workers"]) if expansion_config.get("parallel_fetching", True) else 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {stage: executor.submit(run_stage, *spec) for stage, spec in stages.items()}
+            running = len(futures)
+            while running:
+                event = events.get()
+                if event is None:
+                    running -= 1
+                else:
+                    yield event
+            return {stage: future.result() for stage, future in futures.items()}
 
     def _get_default_expansion_config(self) -> Dict[str, Any]:
         """Get default configuration for data expansion."""
@@ -193,13 +298,13 @@ class DataExpansionPipeline:
         }
 
     def _fetch_state_regulations(self, state_codes: Optional[List[str]],
-                               priority_topics: Optional[List[str]]) -> Dict[str, Any]:
+                               priority_topics: Optional[List[str]],
+                               emit: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
         """Fetch state DOI regulations with error handling and progress tracking."""
         results = {
             "documents_count": 0,
             "states_processed": [],
-            "states_failed": [],
-            "documents": []
+            "states_failed": []
         }
 
         if state_codes is None:
@@ -218,9 +323,9 @@ class DataExpansionPipeline:
                 for doc in docs:
                     doc.retrieval_priority = self._calculate_authority_rank(doc, "state_doi")
 
-                results["documents"].extend(docs)
                 results["documents_count"] += len(docs)
                 results["states_processed"].append(state_code)
+                emit({"type": "docs_fetched", "stage": "state_doi", "source": state_code, "count": len(docs)})
 
                 # Track provenance
                 self._track_provenance(docs, "state_doi", {"state_code": state_code})
@@ -233,17 +338,18 @@ class DataExpansionPipeline:
             except Exception as e:
                 logger.warning(f"Failed to fetch regulations for {state_code}: {e}")
                 results["states_failed"].append({"state": state_code, "error": str(e)})
+                emit({"type": "error", "stage": "state_doi", "error": f"{state_code}: {e}"})
 
         return results
 
     def _fetch_payer_policies(self, payer_codes: Optional[List[str]],
-                            policy_types: Optional[List[str]]) -> Dict[str, Any]:
+                            policy_types: Optional[List[str]],
+                            emit: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
         """Fetch payer policies with error handling and progress tracking."""
         results = {
             "documents_count": 0,
             "payers_processed": [],
-            "payers_failed": [],
-            "documents": []
+            "payers_failed": []
         }
 
         if payer_codes is None:
@@ -267,9 +373,9 @@ class DataExpansionPipeline:
                 for doc in docs:
                     doc.retrieval_priority = self._calculate_authority_rank(doc, "payer_policy")
 
-                results["documents"].extend(docs)
                 results["documents_count"] += len(docs)
                 results["payers_processed"].append(payer_code)
+                emit({"type": "docs_fetched", "stage": "payer_policies", "source": payer_code, "count": len(docs)})
 
                 # Track provenance
                 self._track_provenance(docs, "payer_policy", {"payer_code": payer_code})
@@ -282,17 +388,18 @@ class DataExpansionPipeline:
             except Exception as e:
                 logger.warning(f"Failed to fetch policies for {payer_code}: {e}")
                 results["payers_failed"].append({"payer": payer_code, "error": str(e)})
+                emit({"type": "error", "stage": "payer_policies", "error": f"{payer_code}: {e}"})
 
         return results
 
     def _fetch_appeal_decisions(self, appeal_sources: Optional[List[str]],
-                              search_terms: Optional[List[str]]) -> Dict[str, Any]:
+                              search_terms: Optional[List[str]],
+                              emit: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
         """Fetch appeal decisions with error handling and progress tracking."""
         results = {
             "documents_count": 0,
             "sources_processed": [],
-            "sources_failed": [],
-            "documents": []
+            "sources_failed": []
         }
 
         if appeal_sources is None:
@@ -313,9 +420,9 @@ class DataExpansionPipeline:
                 for doc in docs:
                     doc.retrieval_priority = self._calculate_authority_rank(doc, "appeal_precedent")
 
-                results["documents"].extend(docs)
                 results["documents_count"] += len(docs)
                 results["sources_processed"].append(source_code)
+                emit({"type": "docs_fetched", "stage": "appeals", "source": source_code, "count": len(docs)})
 
                 # Track provenance
                 self._track_provenance(docs, "appeal_precedent", {"source_code": source_code})
@@ -328,6 +435,7 @@ class DataExpansionPipeline:
             except Exception as e:
                 logger.warning(f"Failed to fetch appeals from {source_code}: {e}")
                 results["sources_failed"].append({"source": source_code, "error": str(e)})
+                emit({"type": "error", "stage": "appeals", "error": f"{source_code}: {e}"})
 
         return results
 
@@ -384,55 +492,61 @@ class DataExpansionPipeline:
         final_rank = min(base_rank + adjustments, ranking_range["max"])
         return round(final_rank, 3)
 
-    def _process_and_chunk_documents(self) -> Dict[str, Any]:
-        """Process all fetched documents and create chunks."""
+    def _iter_process_and_chunk_documents(self) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+        """Process all fetched documents and create chunks, yielding an event per file."""
         results = {
             "chunks_count": 0,
             "documents_processed": 0,
             "processing_errors": []
         }
 
-        # Find all document files
-        doc_files = list(self.base_output_dir.rglob("*.json"))
+        # Find all document files, skipping the pipeline's own chunk, provenance and results files
+        doc_files = [
+            f for f in self.base_output_dir.rglob("*.json")
+            if not f.name.endswith("_chunks.json")
+            and f.name != "provenance_db.json"
+            and not f.name.startswith("pipeline_results_")
+        ]
 
         logger.info(f"Processing {len(doc_files)} document files")
 
-        for doc_file in doc_files:
-            try:
-                # Load document
-                with open(doc_file, 'r', encoding='utf-8') as f:
-                    doc_data = json.load(f)
-
-                doc = DOC(**doc_data)
-
-                # Create chunks
-                chunks = self.chunker.chunk_document(doc)
-
-                # Apply authority ranking to chunks
-                for chunk in chunks:
-                    chunk.authority_rank = doc.retrieval_priority
+        for chunks_dir in {doc_file.parent / "chunks" for doc_file in doc_files}:
+            chunks_dir.mkdir(exist_ok=True)
 
-                # Save chunks
-                chunks_dir = doc_file.parent / "chunks"
-                chunks_dir.mkdir(exist_ok=True)
-
-                chunk_file = chunks_dir / f"{doc.source_id}_chunks.json"
-                with open(chunk_file, 'w', encoding='utf-8') as f:
-                    json.dump(
-                        [chunk.model_dump() for chunk in chunks],
-                        f, indent=2, ensure_ascii=False, default=str
-                    )
-
-                results["chunks_count"] += len(chunks)
-                results["documents_processed"] += 1
+        if self.jobs > 1 and len(doc_files) > 1:
+            # Workers read, chunk and write each file themselves; only counts come back
+            with multiprocessing.Pool(min(self.jobs, len(doc_files)), initializer=_init_chunk_worker) as pool:
+                yield from self._iter_chunk_outcomes(
+                    pool.imap_unordered(_chunk_file_worker, doc_files, chunksize=CHUNK_TASK_SIZE), results
+                )
+        else:
+            yield from self._iter_chunk_outcomes(self._chunk_files_serially(doc_files), results)
 
-                logger.info(f"Created {len(chunks)} chunks for {doc.title[:50]}...")
+        return results
 
+    def _chunk_files_serially(self, doc_files: List[Path]
+                              ) -> Iterator[Tuple[Path, int, Optional[str], Optional[str]]]:
+        """Chunk document files in this process, in the same shape as _chunk_file_worker."""
+        for doc_file in doc_files:
+            try:
+                yield (doc_file, *_chunk_document_file(self.chunker, doc_file), None)
             except Exception as e:
-                logger.warning(f"Error processing {doc_file}: {e}")
-                results["processing_errors"].append({"file": str(doc_file), "error": str(e)})
-
-        return results
+                yield doc_file, 0, None, str(e)
+
+    def _iter_chunk_outcomes(self, outcomes: Iterator[Tuple[Path, int, Optional[str], Optional[str]]],
+                             results: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Record per-file chunking outcomes in results, yielding an event for each."""
+        for doc_file, chunk_count, title, error in outcomes:
+            if error is not None:
+                logger.warning(f"Error processing {doc_file}: {error}")
+                results["processing_errors"].append({"file": str(doc_file), "error": error})
+                yield {"type": "error", "stage": "chunking", "error": f"{doc_file}: {error}"}
+                continue
+
+            results["chunks_count"] += chunk_count
+            results["documents_processed"] += 1
+            logger.info(f"Created {chunk_count} chunks for {title[:50]}...")
+            yield {"type": "chunks_created", "file": str(doc_file), "count": chunk_count}
 
     def _update_rag_index(self) -> Dict[str, Any]:
         """Update the RAG index with new chunks."""
@@ -454,8 +568,7 @@ class DataExpansionPipeline:
 
             for chunk_file in chunk_files:
                 try:
-                    with open(chunk_file, 'r', encoding='utf-8') as f:
-                        chunk_data_list = json.load(f)
+                    chunk_data_list = _read_json(chunk_file)
 
                     for chunk_data in chunk_data_list:
                         from ..schemas import CHUNK
@@ -529,8 +642,7 @@ class DataExpansionPipeline:
 
         # Save provenance database
         provenance_file = self.base_output_dir / "provenance_db.json"
-        with open(provenance_file, 'w', encoding='utf-8') as f:
-            json.dump(self.provenance_db, f, indent=2, ensure_ascii=False)
+        provenance_file.write_bytes(_dumps(self.provenance_db))
 
         return report
 
@@ -538,8 +650,7 @@ class DataExpansionPipeline:
         """Save pipeline execution results."""
         results_file = self.base_output_dir / f"pipeline_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        results_file.write_bytes(_dumps(results))
 
         logger.info(f"Pipeline results saved to {results_file}")
 
@@ -584,8 +695,7 @@ class DataExpansionPipeline:
         results_files = list(self.base_output_dir.glob("pipeline_results_*.json"))
         if results_files:
             latest_results = max(results_files, key=lambda f: f.stat().st_mtime)
-            with open(latest_results, 'r') as f:
-                latest_data = json.load(f)
+            latest_data = _read_json(latest_results)
             status["last_full_expansion"] = latest_data.get("end_time")
 
         # Count documents and chunks
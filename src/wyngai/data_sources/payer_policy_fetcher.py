@@ -19,6 +19,7 @@ import logging
 
 from ..schemas import DOC, DocType, Jurisdiction
 from ..utils.config import config
+from ..utils.http_cache import HTTPCache, RateLimitedClient, mount_pooled_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,8 @@ logger = logging.getLogger(__name__)
 class PayerPolicyFetcher:
     """Fetches medical policies and coverage guidelines from major insurance payers."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None, refresh_cache: bool = False):
+        self.cache = HTTPCache(cache_dir, refresh=refresh_cache)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WyngAI/1.0 (Healthcare Training Data Pipeline)',
@@ -36,17 +38,11 @@ class PayerPolicyFetcher:
             'Connection': 'keep-alive'
         })
 
-        # Rate limiting - more conservative for commercial sites
-        self.request_delay = 3.0  # 3 seconds between requests
-        self.last_request_time = 0
+        mount_pooled_adapter(self.session, pool_maxsize=8)
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
-        self.last_request_time = time.time()
+        # Rate limiting - more conservative for commercial sites
+        self.request_delay = 3.0  # 3 seconds between requests to the same host
+        self.http = RateLimitedClient(self.session, self.cache, self.request_delay)
 
     def get_payer_sources(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -248,9 +244,7 @@ class PayerPolicyFetcher:
         docs = []
 
         try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = self.http.get(url)
 
             # Parse HTML to find policy documents
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -345,9 +339,7 @@ class PayerPolicyFetcher:
             DOC object or None if failed
         """
         try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = self.http.get(url)
 
             text_content = ""
 
@@ -18,6 +18,7 @@ import logging
 
 from ..schemas import DOC, DocType, Jurisdiction
 from ..utils.config import config
+from ..utils.http_cache import HTTPCache, RateLimitedClient, mount_pooled_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,8 @@ logger = logging.getLogger(__name__)
 class StateDOIFetcher:
     """Fetches regulations from state Department of Insurance websites."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None, refresh_cache: bool = False):
+        self.cache = HTTPCache(cache_dir, refresh=refresh_cache)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WyngAI/1.0 (Healthcare Training Data Pipeline)',
@@ -36,17 +38,11 @@ class StateDOIFetcher:
             'Upgrade-Insecure-Requests': '1'
         })
 
-        # Rate limiting
-        self.request_delay = 2.0  # 2 seconds between requests
-        self.last_request_time = 0
+        mount_pooled_adapter(self.session, pool_maxsize=8)
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
-        self.last_request_time = time.time()
+        # Rate limiting
+        self.request_delay = 2.0  # 2 seconds between requests to the same host
+        self.http = RateLimitedClient(self.session, self.cache, self.request_delay)
 
     def get_state_doi_sources(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -183,7 +179,6 @@ class StateDOIFetcher:
 
         # Fetch from code sections URL
         if 'code_sections_url' in state_info:
-            self._rate_limit()
             code_docs = self._fetch_from_url(
                 state_info['code_sections_url'],
                 state_code,
@@ -211,9 +206,7 @@ class StateDOIFetcher:
         docs = []
 
         try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = self.http.get(url)
 
             # Parse HTML to find regulation documents
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -297,9 +290,7 @@ class StateDOIFetcher:
             DOC object or None if failed
         """
         try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = self.http.get(url)
 
             text_content = ""
 
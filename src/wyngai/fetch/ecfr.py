@@ -4,25 +4,31 @@ eCFR (Electronic Code of Federal Regulations) fetcher.
 Fetches regulations from the eCFR API for healthcare-related sections.
 """
 
+import asyncio
+import hashlib
 import json
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+import aiohttp
 import requests
 from datetime import datetime
 
 from ..utils.config import config
+from ..utils.http_cache import HTTPCache
 
 
 class eCFRFetcher:
     """Fetches regulations from the eCFR API."""
 
-    def __init__(self):
+    def __init__(self, refresh_cache: bool = False):
         self.base_url = config.ecfr_api_base
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.cache = HTTPCache(refresh=refresh_cache)
+        self.headers = {
             'User-Agent': 'WyngAI/1.0 (Healthcare Training Data Pipeline)'
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def get_key_sections(self) -> List[str]:
         """Get list of key healthcare-related CFR sections."""
@@ -46,27 +52,119 @@ class eCFRFetcher:
         Returns:
             Section data as dict or None if failed
         """
+        return self._fetch_section(section_path)[0]
+
+    async def afetch_section(self,
+                             session: aiohttp.ClientSession,
+                             section_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a specific CFR section on a shared aiohttp session.
+
+        Args:
+            session: Open aiohttp session
+            section_path: Path like "title-45/part-147/section-147.136"
+
+        Returns:
+            Section data as dict or None if failed
+        """
+        return (await self._afetch_section(session, section_path))[0]
+
+    def _fetch_section(self, section_path: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Fetch a section, also reporting whether it was unchanged since it was last cached."""
         url = f"{self.base_url}/render/{section_path}"
 
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
+            response = self.cache.get(self.session, url, timeout=30)
             data = response.json()
 
-            # Add fetch metadata
-            data['_wyngai_metadata'] = {
-                'source': 'eCFR API',
-                'fetched_at': datetime.utcnow().isoformat(),
-                'section_path': section_path,
-                'api_url': url
-            }
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching {section_path}: {e}")
+            return None, False
 
-            return data
+        # Add fetch metadata
+        data['_wyngai_metadata'] = self._section_metadata(section_path, url)
+
+        return data, response.from_cache
+
+    async def _afetch_section(self,
+                              session: aiohttp.ClientSession,
+                              section_path: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Async variant of _fetch_section."""
+        url = f"{self.base_url}/render/{section_path}"
+
+        try:
+            response = await self.cache.aget(session, url, timeout=30)
+            data = response.json()
 
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             print(f"Error fetching {section_path}: {e}")
-            return None
+            return None, False
+
+        # Add fetch metadata
+        data['_wyngai_metadata'] = self._section_metadata(section_path, url)
+
+        return data, response.from_cache
+
+    async def afetch_sections(self,
+                              section_paths: List[str],
+                              output_dir: Path,
+                              concurrency: int = 8) -> List[Path]:
+        """
+        Fetch and save several CFR sections concurrently.
+
+        Args:
+            section_paths: Section paths to fetch
+            output_dir: Directory to save fetched sections
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            List of paths to saved files, in section order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_and_save(session: aiohttp.ClientSession, section_path: str) -> Optional[Path]:
+            async with semaphore:
+                section_data, unchanged = await self._afetch_section(session, section_path)
+            if section_data is None:
+                return None
+            # Keep disk writes off the event loop
+            return await asyncio.to_thread(self._save_if_changed, section_data, unchanged, output_dir)
+
+        connector = aiohttp.TCPConnector(limit=10)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            results = await asyncio.gather(
+                *(fetch_and_save(session, section_path) for section_path in section_paths)
+            )
+
+        return [path for path in results if path is not None]
+
+    async def afetch_key_sections(self, output_dir: Path, concurrency: int = 8) -> List[Path]:
+        """
+        Fetch all key healthcare CFR sections concurrently.
+
+        Args:
+            output_dir: Directory to save fetched sections
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            List of paths to saved files
+        """
+        sections = self.get_key_sections()
+        print(f"Fetching {len(sections)} key CFR sections concurrently...")
+
+        saved_paths = await self.afetch_sections(sections, output_dir, concurrency)
+
+        print(f"Completed fetching {len(saved_paths)}/{len(sections)} sections")
+        return saved_paths
+
+    def _section_metadata(self, section_path: str, url: str) -> Dict[str, Any]:
+        """Fetch metadata stored alongside a section."""
+        return {
+            'source': 'eCFR API',
+            'fetched_at': datetime.utcnow().isoformat(),
+            'section_path': section_path,
+            'api_url': url
+        }
 
     def fetch_title(self, title_number: int) -> Optional[Dict[str, Any]]:
         """
@@ -81,10 +179,7 @@ class eCFRFetcher:
         url = f"{self.base_url}/titles/{title_number}"
 
         try:
-            response = self.session.get(url, timeout=60)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self.cache.get(self.session, url, timeout=60).json()
 
             # Add fetch metadata
             data['_wyngai_metadata'] = {
@@ -96,7 +191,7 @@ class eCFRFetcher:
 
             return data
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching title {title_number}: {e}")
             return None
 
@@ -104,6 +199,9 @@ class eCFRFetcher:
         """
         Save section data to JSON file.
 
+        A .blake2b sidecar records a hash of the section content (excluding
+        fetch metadata); if it matches, the existing file is left as is.
+
         Args:
             section_data: Section data from API
             output_dir: Output directory path
@@ -113,20 +211,41 @@ class eCFRFetcher:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create filename from section path
-        metadata = section_data.get('_wyngai_metadata', {})
-        section_path = metadata.get('section_path', 'unknown')
-        filename = section_path.replace('/', '_') + '.json'
+        section_path = section_data.get('_wyngai_metadata', {}).get('section_path', 'unknown')
+        output_path = self._section_output_path(section_path, output_dir)
+        hash_path = output_path.with_name(output_path.name + '.blake2b')
+
+        content = {key: value for key, value in section_data.items() if key != '_wyngai_metadata'}
+        digest = hashlib.blake2b(
+            json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
 
-        output_path = output_dir / filename
+        if output_path.exists() and hash_path.exists() and hash_path.read_text() == digest:
+            print(f"Unchanged {section_path}, keeping {output_path}")
+            return output_path
 
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(section_data, f, indent=2, ensure_ascii=False)
+        hash_path.write_text(digest)
 
         print(f"Saved {section_path} to {output_path}")
         return output_path
 
-    def fetch_key_sections(self, output_dir: Path, delay: float = 1.0) -> List[Path]:
+    def _section_output_path(self, section_path: str, output_dir: Path) -> Path:
+        """File a section is saved to, named after its section path."""
+        return output_dir / (section_path.replace('/', '_') + '.json')
+
+    def _save_if_changed(self, section_data: Dict[str, Any], unchanged: bool, output_dir: Path) -> Path:
+        """Save a section unless the response was unchanged and is already on disk."""
+        section_path = section_data['_wyngai_metadata']['section_path']
+        output_path = self._section_output_path(section_path, output_dir)
+        if unchanged and output_path.exists():
+            print(f"Unchanged {section_path}, keeping {output_path}")
+            return output_path
+        return self.save_section(section_data, output_dir)
+
+    def fetch_key_sections(self, output_dir: Path, delay: float = 1.0) -> Iterator[Path]:
         """
         Fetch all key healthcare CFR sections.
 
@@ -134,10 +253,10 @@ class eCFRFetcher:
             output_dir: Directory to save fetched sections
             delay: Delay between requests in seconds
 
-        Returns:
-            List of paths to saved files
+        Yields:
+            Paths to saved files
         """
-        saved_paths = []
+        num_saved = 0
         sections = self.get_key_sections()
 
         print(f"Fetching {len(sections)} key CFR sections...")
@@ -145,17 +264,16 @@ class eCFRFetcher:
         for i, section in enumerate(sections, 1):
             print(f"[{i}/{len(sections)}] Fetching {section}")
 
-            section_data = self.fetch_section(section)
+            section_data, unchanged = self._fetch_section(section)
             if section_data:
-                saved_path = self.save_section(section_data, output_dir)
-                saved_paths.append(saved_path)
+                yield self._save_if_changed(section_data, unchanged, output_dir)
+                num_saved += 1
 
             # Rate limiting
             if i < len(sections):
                 time.sleep(delay)
 
-        print(f"Completed fetching {len(saved_paths)}/{len(sections)} sections")
-        return saved_paths
+        print(f"Completed fetching {num_saved}/{len(sections)} sections")
 
     def search_sections(self, query: str) -> List[Dict[str, Any]]:
         """
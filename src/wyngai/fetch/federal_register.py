@@ -7,18 +7,20 @@ Fetches Federal Register documents related to healthcare regulations.
 import json
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 import requests
 from datetime import datetime, date
 
 from ..utils.config import config
+from ..utils.http_cache import HTTPCache
 
 
 class FederalRegisterFetcher:
     """Fetches documents from the Federal Register API."""
 
-    def __init__(self):
+    def __init__(self, refresh_cache: bool = False):
         self.base_url = config.federal_register_api_base
+        self.cache = HTTPCache(refresh=refresh_cache)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WyngAI/1.0 (Healthcare Training Data Pipeline)'
@@ -83,12 +85,12 @@ class FederalRegisterFetcher:
                 params['conditions[publication_date][lte]'] = end_date.strftime('%Y-%m-%d')
 
             try:
-                response = self.session.get(
+                response = self.cache.get(
+                    self.session,
                     f"{self.base_url}/articles.json",
                     params=params,
                     timeout=30
                 )
-                response.raise_for_status()
 
                 data = response.json()
                 page_articles = data.get('results', [])
@@ -112,10 +114,11 @@ class FederalRegisterFetcher:
                 print(f"Fetched page {page}/{min(max_pages, total_pages)} for term '{term}' ({len(page_articles)} articles)")
                 page += 1
 
-                # Rate limiting
-                time.sleep(0.5)
+                # Rate limiting (cached pages cost the API nothing)
+                if not response.from_cache:
+                    time.sleep(0.5)
 
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 print(f"Error searching for '{term}' page {page}: {e}")
                 break
 
@@ -137,9 +140,7 @@ class FederalRegisterFetcher:
             return None
 
         try:
-            response = self.session.get(html_url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            return self.cache.get(self.session, html_url, timeout=30).text
 
         except requests.RequestException as e:
             print(f"Error fetching content for article {article.get('document_number')}: {e}")
@@ -163,47 +164,52 @@ class FederalRegisterFetcher:
             List of paths to saved files
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        saved_paths = []
+        saved_paths = [self._save_article(article, output_dir, fetch_content) for article in articles]
 
-        for article in articles:
-            doc_number = article.get('document_number', 'unknown')
+        print(f"Saved {len(saved_paths)} articles to {output_dir}")
+        return saved_paths
 
-            # Fetch full content if requested
-            if fetch_content:
-                html_content = self.get_article_content(article)
-                if html_content:
-                    article['body_html_content'] = html_content
-                    time.sleep(0.5)  # Rate limiting
+    def _save_article(self, article: Dict[str, Any], output_dir: Path, fetch_content: bool) -> Path:
+        """Save one article, fetching its HTML content first if requested."""
+        doc_number = article.get('document_number', 'unknown')
 
-            filename = f"fedreg_{doc_number}.json"
-            output_path = output_dir / filename
+        # Fetch full content if requested
+        if fetch_content:
+            html_content = self.get_article_content(article)
+            if html_content:
+                article['body_html_content'] = html_content
+                time.sleep(0.5)  # Rate limiting
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(article, f, indent=2, ensure_ascii=False)
+        filename = f"fedreg_{doc_number}.json"
+        output_path = output_dir / filename
 
-            saved_paths.append(output_path)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(article, f, indent=2, ensure_ascii=False)
 
-        print(f"Saved {len(saved_paths)} articles to {output_dir}")
-        return saved_paths
+        return output_path
 
     def fetch_healthcare_documents(
         self,
         output_dir: Path,
         since_date: Optional[date] = None,
         fetch_content: bool = False
-    ) -> List[Path]:
+    ) -> Iterator[Path]:
         """
         Fetch all healthcare-related Federal Register documents.
 
+        Articles are saved as each term's results arrive, so only one term's
+        results are held in memory.
+
         Args:
             output_dir: Output directory
             since_date: Only fetch documents since this date
             fetch_content: Whether to fetch full HTML content
 
-        Returns:
-            List of paths to saved files
+        Yields:
+            Paths to saved files
         """
-        all_articles = []
+        output_dir.mkdir(parents=True, exist_ok=True)
+        seen_doc_numbers = set()
         terms = self.get_key_terms()
 
         print(f"Fetching Federal Register documents for {len(terms)} terms...")
@@ -218,18 +224,13 @@ class FederalRegisterFetcher:
                 max_pages=5  # Limit to avoid overwhelming the API
             )
 
-            all_articles.extend(articles)
-            time.sleep(1)  # Rate limiting between terms
-
-        # Remove duplicates based on document_number
-        unique_articles = {}
-        for article in all_articles:
-            doc_num = article.get('document_number')
-            if doc_num and doc_num not in unique_articles:
-                unique_articles[doc_num] = article
+            # Skip duplicates based on document_number
+            for article in articles:
+                doc_num = article.get('document_number')
+                if doc_num and doc_num not in seen_doc_numbers:
+                    seen_doc_numbers.add(doc_num)
+                    yield self._save_article(article, output_dir, fetch_content)
 
-        articles_list = list(unique_articles.values())
-        print(f"Found {len(articles_list)} unique articles after deduplication")
+            time.sleep(1)  # Rate limiting between terms
 
-        # Save articles
-        return self.save_articles(articles_list, output_dir, fetch_content)
\ No newline at end of file
+        print(f"Saved {len(seen_doc_numbers)} unique articles to {output_dir}")
@@ -6,8 +6,10 @@ Converts raw eCFR API responses to normalized DOC format.
 
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from datetime import datetime
 from uuid import uuid4
 
@@ -237,28 +239,53 @@ class eCFRParser:
             print(f"Error parsing file {file_path}: {e}")
             return None
 
-    def parse_directory(self, input_dir: Path) -> List[DOC]:
+    def parse_directory(self, input_dir: Path, workers: int = 1) -> List[DOC]:
         """
         Parse all eCFR JSON files in a directory.
 
         Args:
             input_dir: Directory containing eCFR JSON files
+            workers: Number of worker processes (1 parses in this process)
 
         Returns:
             List of normalized DOC objects
         """
-        docs = []
+        return list(self.iter_parse_directory(input_dir, workers=workers))
+
+    def iter_parse_directory(self, input_dir: Path, workers: int = 1) -> Iterator[DOC]:
+        """
+        Parse eCFR JSON files in a directory, yielding DOCs as they are parsed.
+
+        Args:
+            input_dir: Directory containing eCFR JSON files
+            workers: Number of worker processes (1 parses in this process)
+
+        Yields:
+            Normalized DOC objects
+        """
+        parsed = 0
         json_files = list(input_dir.glob("*.json"))
 
         print(f"Parsing {len(json_files)} eCFR files from {input_dir}")
 
-        for file_path in json_files:
-            doc = self.parse_file(file_path)
-            if doc:
-                docs.append(doc)
-                print(f"✓ Parsed {file_path.name}")
+        with ExitStack() as stack:
+            if workers > 1 and len(json_files) > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                results = executor.map(_parse_file_worker, json_files, chunksize=8)
             else:
-                print(f"✗ Failed to parse {file_path.name}")
+                results = map(self.parse_file, json_files)
+
+            for file_path, doc in zip(json_files, results):
+                if doc:
+                    parsed += 1
+                    print(f"✓ Parsed {file_path.name}")
+                    yield doc
+                else:
+                    print(f"✗ Failed to parse {file_path.name}")
+
+        print(f"Successfully parsed {parsed}/{len(json_files)} eCFR files")
+
 
-        print(f"Successfully parsed {len(docs)}/{len(json_files)} eCFR files")
-        return docs
\ No newline at end of file
+def _parse_file_worker(file_path: Path) -> Optional[DOC]:
+    """Parse one file in a worker process, which builds its own parser."""
+    return eCFRParser().parse_file(file_path)
@@ -23,11 +23,13 @@ class HybridIndex:
                  embedding_model: str = "BAAI/bge-base-en-v1.5",
                  bm25_weight: float = 0.3,
                  vector_weight: float = 0.4,
-                 authority_weight: float = 0.3):
+                 authority_weight: float = 0.3,
+                 encode_batch_size: int = 64):
         self.embedding_model_name = embedding_model
         self.bm25_weight = bm25_weight
         self.vector_weight = vector_weight
         self.authority_weight = authority_weight
+        self.encode_batch_size = encode_batch_size
 
         # Initialize components
         self.chunks: List[CHUNK] = []
@@ -59,7 +61,7 @@ class HybridIndex:
         print("Generating embeddings...")
         self.embeddings = self.embedding_model.encode(
             texts,
-            batch_size=32,
+            batch_size=self.encode_batch_size,
             show_progress_bar=True,
             convert_to_numpy=True
         )
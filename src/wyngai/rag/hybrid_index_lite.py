@@ -7,16 +7,35 @@ to provide immediate deployment capability without heavy ML dependencies.
 
 import pickle
 import json
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import numpy as np
 from rank_bm25 import BM25Okapi
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ..schemas import CHUNK
 
 
+# CSR components of the TF-IDF matrix, saved as separate .npy files
+TFIDF_ARRAYS = ("data", "indices", "indptr")
+
+
+def quantize_columns(matrix) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Quantize a sparse matrix to int8 with one symmetric scale per column.
+
+    Returns the int8 CSR matrix and the float32 column scales; an entry
+    dequantizes as value * scale[column] / 127.
+    """
+    matrix = sparse.csr_matrix(matrix)
+    scale = np.asarray(abs(matrix).max(axis=0).todense(), dtype=np.float32).ravel()
+    scale[scale == 0] = 1.0
+    data = np.rint(matrix.data / scale[matrix.indices] * 127).astype(np.int8)
+    return sparse.csr_matrix((data, matrix.indices, matrix.indptr), shape=matrix.shape), scale
+
+
 class HybridIndexLite:
     """Lite hybrid search index using BM25 and TF-IDF."""
 
@@ -32,18 +51,20 @@ class HybridIndexLite:
         self.chunks: List[CHUNK] = []
         self.bm25_index: Optional[BM25Okapi] = None
         self.tfidf_vectorizer: Optional[TfidfVectorizer] = None
-        self.tfidf_matrix: Optional[np.ndarray] = None
+        self.tfidf_matrix: Optional[sparse.csr_matrix] = None  # int8, see quantize_columns
+        self.tfidf_scale: Optional[np.ndarray] = None
 
-    def build_index(self, chunks: List[CHUNK]) -> None:
+    def build_index(self, chunks: Iterable[CHUNK]) -> None:
         """
         Build hybrid index from chunks.
 
         Args:
-            chunks: List of CHUNK objects to index
+            chunks: CHUNK objects to index, e.g. a generator reading a JSONL file
         """
+        self.chunks = list(chunks)
+        chunks = self.chunks
         print(f"Building lite hybrid index for {len(chunks)} chunks...")
 
-        self.chunks = chunks
         texts = [chunk.text for chunk in chunks]
 
         # Build BM25 index
@@ -61,7 +82,8 @@ class HybridIndexLite:
             min_df=2
         )
 
-        self.tfidf_matrix = self.tfidf_vectorizer.fit_transform(texts)
+        # Rows are L2-normalized, so a dot product with the query is its cosine
+        self.tfidf_matrix, self.tfidf_scale = quantize_columns(self.tfidf_vectorizer.fit_transform(texts))
 
         print(f"✅ Lite index built: {len(chunks)} chunks, {self.tfidf_matrix.shape[1]} TF-IDF features")
 
@@ -105,6 +127,28 @@ class HybridIndexLite:
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:top_k]
 
+    def search_dense(self,
+                     query: str,
+                     k: int = 50,
+                     query_vector: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """Top-k chunk indices by TF-IDF cosine similarity (positive scores only).
+
+        query_vector may be passed when the query was already encoded with encode_queries.
+        """
+        return self._top_k(self._tfidf_search(query, query_vector), k)
+
+    def search_bm25(self, query: str, k: int = 50) -> List[Tuple[int, float]]:
+        """Top-k chunk indices by normalized BM25 score (positive scores only)."""
+        return self._top_k(self._bm25_search(query), k)
+
+    def _top_k(self, scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """(index, score) pairs of the k best positive scores, best first."""
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(i), float(scores[i])) for i in candidates]
+
     def _bm25_search(self, query: str) -> np.ndarray:
         """Perform BM25 search and return normalized scores."""
         query_tokens = query.lower().split()
@@ -118,15 +162,20 @@ class HybridIndexLite:
 
         return np.array(scores)
 
-    def _tfidf_search(self, query: str) -> np.ndarray:
+    def _tfidf_search(self, query: str, query_vector: Optional[np.ndarray] = None) -> np.ndarray:
         """Perform TF-IDF similarity search and return normalized scores."""
-        query_vector = self.tfidf_vectorizer.transform([query])
+        if query_vector is None:
+            query_vector = self.encode_queries([query])[0]
 
-        # Calculate cosine similarity
-        similarities = cosine_similarity(query_vector, self.tfidf_matrix)[0]
+        # Fold the dequantization scales into the (normalized) query vector
+        weights = query_vector * (self.tfidf_scale / 127)
 
-        # Already normalized [0, 1] for cosine similarity
-        return similarities
+        # Cosine similarity; already normalized [0, 1]
+        return self.tfidf_matrix @ weights
+
+    def encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Encode queries as dense, L2-normalized TF-IDF vectors."""
+        return self.tfidf_vectorizer.transform(queries).toarray().astype(np.float32)
 
     def _get_authority_scores(self) -> np.ndarray:
         """Get authority scores for all chunks."""
@@ -164,15 +213,17 @@ class HybridIndexLite:
         with open(tfidf_vectorizer_path, 'wb') as f:
             pickle.dump(self.tfidf_vectorizer, f)
 
-        tfidf_matrix_path = index_path / "tfidf_matrix.pkl"
-        with open(tfidf_matrix_path, 'wb') as f:
-            pickle.dump(self.tfidf_matrix, f)
+        # Raw CSR arrays so workers can memory-map (and share) the matrix
+        for name in TFIDF_ARRAYS:
+            np.save(index_path / f"tfidf_matrix.{name}.npy", getattr(self.tfidf_matrix, name))
+        np.save(index_path / "tfidf_scale.npy", self.tfidf_scale)
 
         # Save metadata
         metadata = {
             'vectorizer_type': 'tfidf',
             'num_chunks': len(self.chunks),
             'tfidf_features': self.tfidf_matrix.shape[1],
+            'tfidf_shape': list(self.tfidf_matrix.shape),
             'weights': {
                 'bm25': self.bm25_weight,
                 'tfidf': self.tfidf_weight,
@@ -187,7 +238,12 @@ class HybridIndexLite:
         print(f"✅ Lite index saved to {index_path}")
 
     def load_index(self, index_path: Path) -> None:
-        """Load index from disk."""
+        """
+        Load index from disk.
+
+        The TF-IDF matrix arrays are memory-mapped read-only, so processes
+        serving the same index share their pages through the OS page cache.
+        """
         if not index_path.exists():
             raise ValueError(f"Index path does not exist: {index_path}")
 
@@ -212,9 +268,20 @@ class HybridIndexLite:
         with open(tfidf_vectorizer_path, 'rb') as f:
             self.tfidf_vectorizer = pickle.load(f)
 
-        tfidf_matrix_path = index_path / "tfidf_matrix.pkl"
-        with open(tfidf_matrix_path, 'rb') as f:
-            self.tfidf_matrix = pickle.load(f)
+        if (index_path / "tfidf_scale.npy").exists():
+            arrays = [np.load(index_path / f"tfidf_matrix.{name}.npy", mmap_mode='r') for name in TFIDF_ARRAYS]
+            self.tfidf_matrix = sparse.csr_matrix(tuple(arrays), shape=tuple(metadata['tfidf_shape']), copy=False)
+            self.tfidf_scale = np.load(index_path / "tfidf_scale.npy")
+        else:
+            # Indexes saved with a float matrix are quantized on load
+            if (index_path / "tfidf_matrix.data.npy").exists():
+                arrays = [np.load(index_path / f"tfidf_matrix.{name}.npy") for name in TFIDF_ARRAYS]
+                tfidf_matrix = sparse.csr_matrix(tuple(arrays), shape=tuple(metadata['tfidf_shape']))
+            else:
+                tfidf_matrix_path = index_path / "tfidf_matrix.pkl"
+                with open(tfidf_matrix_path, 'rb') as f:
+                    tfidf_matrix = pickle.load(f)
+            self.tfidf_matrix, self.tfidf_scale = quantize_columns(tfidf_matrix)
 
         print(f"✅ Lite index loaded: {len(self.chunks)} chunks, {self.tfidf_matrix.shape[1]} TF-IDF features")
 
@@ -231,13 +298,9 @@ class HybridIndexLite:
             return {"status": "empty"}
 
         # Calculate topic distribution
-        all_topics = []
+        topic_counts = Counter()
         for chunk in self.chunks:
-            all_topics.extend(chunk.topics)
-
-        topic_counts = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+            topic_counts.update(chunk.topics)
 
         # Calculate authority distribution
         authority_scores = [chunk.authority_rank for chunk in self.chunks]
@@ -252,7 +315,7 @@ class HybridIndexLite:
                 "min": np.min(authority_scores),
                 "max": np.max(authority_scores)
             },
-            "top_topics": sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:10],
+            "top_topics": topic_counts.most_common(10),
             "weights": {
                 "bm25": self.bm25_weight,
                 "tfidf": self.tfidf_weight,
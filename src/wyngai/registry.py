@@ -3,11 +3,15 @@ Source registry management and Excel generation.
 """
 
 import json
-import pandas as pd
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from .schemas import SourceRegistry
 
+# pandas is only needed for exports, so it is imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # Source registry data
 SOURCES_JSON = {
@@ -392,8 +396,9 @@ class RegistryManager:
     def __init__(self):
         self.sources = [SourceRegistry(**source) for source in SOURCES_JSON["sources"]]
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """Convert sources to pandas DataFrame."""
+        import pandas as pd
         return pd.DataFrame([source.model_dump() for source in self.sources])
 
     def get_categories(self) -> List[str]:
@@ -406,7 +411,20 @@ class RegistryManager:
 
     def write_excel(self, output_path: Path) -> None:
         """Write registry to Excel file with category sheets."""
+        self._write_excel(self.to_dataframe(), output_path)
+
+    def write_csv(self, output_path: Path) -> None:
+        """Write registry to CSV file."""
+        self._write_csv(self.to_dataframe(), output_path)
+
+    def write_both(self, xlsx_path: Path, csv_path: Path) -> None:
+        """Write registry to Excel and CSV files from one DataFrame."""
         df = self.to_dataframe()
+        self._write_excel(df, xlsx_path)
+        self._write_csv(df, csv_path)
+
+    def _write_excel(self, df: "pd.DataFrame", output_path: Path) -> None:
+        import pandas as pd
 
         # Rename columns for Excel display
         df_display = df.rename(columns={
@@ -425,17 +443,14 @@ class RegistryManager:
             df_display.to_excel(writer, sheet_name='All Sources', index=False)
 
             # Category-specific sheets
-            for category in self.get_categories():
-                category_df = df_display[df_display['Category'] == category]
+            for category, category_df in df_display.groupby('Category', sort=False):
                 # Truncate sheet name if too long (Excel limit is 31 chars)
                 sheet_name = category[:31] if len(category) > 31 else category
                 category_df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         print(f"Excel registry written to {output_path}")
 
-    def write_csv(self, output_path: Path) -> None:
-        """Write registry to CSV file."""
-        df = self.to_dataframe()
+    def _write_csv(self, df: "pd.DataFrame", output_path: Path) -> None:
         df.to_csv(output_path, index=False)
         print(f"CSV registry written to {output_path}")
 
@@ -448,4 +463,10 @@ class RegistryManager:
 
     def get_sources_by_category(self, category: str) -> List[SourceRegistry]:
         """Get sources by category."""
-        return [source for source in self.sources if source.category == category]
\ No newline at end of file
+        return [source for source in self.sources if source.category == category]
+
+
+@lru_cache(maxsize=1)
+def get_registry_manager() -> RegistryManager:
+    """Shared RegistryManager, built once per process."""
+    return RegistryManager()
@@ -4,6 +4,7 @@ Pydantic schemas for DOC and CHUNK models.
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from uuid import UUID, uuid4
 import hashlib
@@ -104,6 +105,11 @@ class CHUNK(BaseModel):
                     data['token_count'] = len(data['text']) // 4
         return data
 
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased chunk text, computed once (text is not modified after construction)."""
+        return self.text.lower()
+
 
 class SourceRegistry(BaseModel):
     """Registry entry for data sources."""
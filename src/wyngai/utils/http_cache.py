@@ -0,0 +1,233 @@
+"""Persistent HTTP response cache for the source fetchers."""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import config
+
+
+@dataclass
+class CachedResponse:
+    """Response body served from the network or the cache."""
+    url: str
+    content: bytes
+    from_cache: bool
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class HTTPCache:
+    """
+    Disk cache of GET responses keyed by URL, revalidated with ETag/Last-Modified.
+
+    Each URL has a body file and a small JSON entry holding its validators.
+    Entries younger than expire_after are served without a request; older
+    ones are revalidated with If-None-Match/If-Modified-Since, and a 304
+    reuses the stored body. With refresh=True stored entries are ignored
+    but fresh responses are still written back.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[Path] = None,
+                 expire_after: float = 86400,
+                 refresh: bool = False):
+        self.cache_dir = cache_dir or config.warehouse_dir / ".http_cache"
+        self.expire_after = expire_after
+        self.refresh = refresh
+
+    def get(self,
+            session: requests.Session,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            timeout: float = 30) -> CachedResponse:
+        """
+        GET a URL through the cache.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status
+        """
+        url = requests.Request('GET', url, params=params).prepare().url
+        entry = self.lookup(url)
+        if entry is not None and self.is_fresh(entry):
+            return CachedResponse(url, self.read_body(url), from_cache=True)
+
+        response = session.get(url, headers=self.conditional_headers(entry), timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self.touch(url, entry)
+            return CachedResponse(url, self.read_body(url), from_cache=True)
+
+        response.raise_for_status()
+        self.store(url, response.content, response.headers)
+        return CachedResponse(url, response.content, from_cache=False)
+
+    async def aget(self,
+                   session: aiohttp.ClientSession,
+                   url: str,
+                   timeout: float = 30) -> CachedResponse:
+        """
+        GET a URL through the cache on an aiohttp session.
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status
+        """
+        entry = self.lookup(url)
+        if entry is not None and self.is_fresh(entry):
+            return CachedResponse(url, await asyncio.to_thread(self.read_body, url), from_cache=True)
+
+        async with session.get(url,
+                               headers=self.conditional_headers(entry),
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 304 and entry is not None:
+                await asyncio.to_thread(self.touch, url, entry)
+                return CachedResponse(url, await asyncio.to_thread(self.read_body, url), from_cache=True)
+
+            response.raise_for_status()
+            content = await response.read()
+
+        await asyncio.to_thread(self.store, url, content, response.headers)
+        return CachedResponse(url, content, from_cache=False)
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for a URL, or None if missing or refreshing."""
+        if self.refresh:
+            return None
+
+        entry_path, body_path = self._paths(url)
+        if not body_path.exists():
+            return None
+        try:
+            return json.loads(entry_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() - entry.get('stored_at', 0) < self.expire_after
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Revalidation headers for a stored entry."""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, url: str) -> bytes:
+        return self._paths(url)[1].read_bytes()
+
+    def store(self, url: str, content: bytes, headers) -> None:
+        """Save a response body and its validators."""
+        entry = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': time.time()
+        }
+        entry_path, body_path = self._paths(url)
+        self._write(body_path, content)
+        self._write(entry_path, json.dumps(entry).encode('utf-8'))
+
+    def touch(self, url: str, entry: Dict[str, Any]) -> None:
+        """Restart the freshness window after a successful revalidation."""
+        entry['stored_at'] = time.time()
+        self._write(self._paths(url)[0], json.dumps(entry).encode('utf-8'))
+
+    def read_derived(self, url: str, kind: str) -> Optional[bytes]:
+        """Data derived from a cached response (e.g. a parsed document), if stored."""
+        try:
+            return self._derived_path(url, kind).read_bytes()
+        except OSError:
+            return None
+
+    def store_derived(self, url: str, kind: str, data: bytes) -> None:
+        """Save data derived from a response, to reuse while the response is unchanged."""
+        self._write(self._derived_path(url, kind), data)
+
+    def _derived_path(self, url: str, kind: str) -> Path:
+        return self._paths(url)[1].with_suffix(f".{kind}")
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        # Write then rename so concurrent fetchers never see a partial file
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+def mount_pooled_adapter(session: requests.Session, pool_maxsize: int, max_retries=0) -> None:
+    """
+    Mount a connection-pooling adapter for http and https on a session.
+
+    Fetchers share one session across concurrent fetches; a pool per site lets
+    each site keep reusing its TCP/TLS connections.
+    """
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+class RateLimitedClient:
+    """
+    Cached GETs on a requests session, spacing out real requests to each host.
+
+    Safe to share between threads: each caller reserves its host's next slot
+    under a lock and waits for it outside the lock. Responses served from the
+    cache without revalidation do not count against the rate limit.
+    """
+
+    def __init__(self,
+                 session: requests.Session,
+                 cache: HTTPCache,
+                 delay: float,
+                 host_delays: Optional[Dict[str, float]] = None):
+        self.session = session
+        self.cache = cache
+        self.delay = delay
+        self.host_delays = host_delays or {}
+        self.last_request_time: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """Block until a request to url's host is allowed."""
+        host = urlparse(url).netloc
+        with self._lock:
+            delay = self.host_delays.get(host, self.delay)
+            slot = max(time.time(), self.last_request_time[host] + delay)
+            self.last_request_time[host] = slot
+        time.sleep(max(0.0, slot - time.time()))
+
+    def get(self, url: str, timeout: float = 30) -> CachedResponse:
+        """
+        GET a URL through the cache, rate limiting only real requests.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status
+        """
+        entry = self.cache.lookup(url)
+        if entry is None or not self.cache.is_fresh(entry):
+            self.wait(url)
+        return self.cache.get(self.session, url, timeout=timeout)
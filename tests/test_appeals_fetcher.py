@@ -0,0 +1,150 @@
+"""Test appeals search-page link extraction."""
+
+import json
+
+import pytest
+
+from src.wyngai.data_sources.appeals_history_fetcher import AppealsHistoryFetcher, JSONLWriter, retry_delay
+from src.wyngai.schemas import DOC, DocType, Jurisdiction
+
+
+class TestExtractCaseLinks:
+    """Test AppealsHistoryFetcher._extract_case_links."""
+
+    @pytest.fixture
+    def fetcher(self):
+        return AppealsHistoryFetcher()
+
+    @pytest.fixture
+    def sources(self, fetcher):
+        return fetcher.get_appeal_sources()
+
+    def test_justia_filters_non_healthcare_titles(self, fetcher, sources):
+        """Test Justia links are kept only for healthcare-related titles."""
+        page = (b'<a href="/cases/federal/1">ERISA benefit appeal</a>'
+                b'<a href="/cases/federal/2">Zoning dispute</a>'
+                b'<a href="/about">Health insurance FAQ</a>')
+        links = fetcher._extract_case_links("JUSTIA", sources["JUSTIA"], sources["JUSTIA"]["search_url"], page)
+
+        assert links == [("https://law.justia.com/cases/federal/1", "ERISA benefit appeal")]
+
+    def test_iro_links_are_limited_and_titled(self, fetcher, sources):
+        """Test IRO links resolve against the page URL and get a default title."""
+        page_url = "https://www.dfs.ny.gov/consumers/health_insurance/external_appeal_decisions"
+        page = b''.join(b'<a href="files/decision%d.pdf"></a>' % i for i in range(12))
+        links = fetcher._extract_case_links("IRO_DECISIONS", sources["IRO_DECISIONS"], page_url, page)
+
+        assert len(links) == 10
+        assert links[0] == ("https://www.dfs.ny.gov/consumers/health_insurance/files/decision0.pdf", "IRO Decision")
+
+
+class TestFindMainContent:
+    """Test AppealsHistoryFetcher._find_main_content."""
+
+    @pytest.fixture
+    def fetcher(self):
+        return AppealsHistoryFetcher()
+
+    def parse(self, html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, "html.parser")
+
+    def test_prefers_main_over_content_div(self, fetcher):
+        """Test <main> wins over a content-like div and chrome is removed."""
+        soup = self.parse('<div class="content">Sidebar</div><main>Opinion<nav>Menu</nav></main>')
+
+        assert fetcher._find_main_content(soup).get_text(strip=True) == "Opinion"
+
+    def test_fallback_drops_boilerplate(self, fetcher):
+        """Test the whole-page fallback strips header/related-case blocks."""
+        soup = self.parse('<div class="site-header">Home</div><p>Opinion text</p><ul id="related-cases"><li>Other</li></ul>')
+
+        assert fetcher._find_main_content(soup).get_text(strip=True) == "Opinion text"
+
+    def test_fallback_keeps_page_wrappers(self, fetcher):
+        """Test boilerplate-like classes on <body> or a page wrapper do not drop the opinion."""
+        for html in ('<body class="page has-header-image"><p>Opinion text</p><div class="menu">Home</div></body>',
+                     '<body class="wp-social-share"><p>Opinion text</p></body>',
+                     '<div id="site-header-wrap"><p>Opinion text</p><div class="navbar">Home</div></div>'):
+            assert fetcher._find_main_content(self.parse(html)).get_text(strip=True) == "Opinion text"
+
+    def test_fallback_rejects_oversized_pages(self, fetcher):
+        """Test pages with no content container and too many tags are skipped."""
+        soup = self.parse("<p>x</p>" * 5001)
+
+        assert fetcher._find_main_content(soup) is None
+
+
+class TestUniqueCaseLinks:
+    """Test AppealsHistoryFetcher._unique_case_links."""
+
+    def test_merges_search_pages(self):
+        """Test case links repeated across search terms are fetched once."""
+        fetcher = AppealsHistoryFetcher()
+        links = fetcher._unique_case_links([
+            [("https://law.justia.com/cases/1", "Case 1"), ("https://law.justia.com/cases/2?page=1", "Case 2")],
+            [("https://LAW.justia.com/cases/1#opinion", "Case 1 again"), ("https://law.justia.com/cases/2?page=2", "Case 2")],
+        ])
+
+        assert links == [
+            ("https://law.justia.com/cases/1", "Case 1"),
+            ("https://law.justia.com/cases/2?page=1", "Case 2"),
+            ("https://law.justia.com/cases/2?page=2", "Case 2"),
+        ]
+
+
+class TestRetryDelay:
+    """Test retry_delay."""
+
+    def test_retry_after_seconds(self):
+        """Test a numeric Retry-After is honoured and capped."""
+        assert retry_delay({'Retry-After': '7'}, attempt=0) == 7.0
+        assert retry_delay({'Retry-After': '99999'}, attempt=0) == 300.0
+
+    def test_backoff_without_header(self):
+        """Test exponential backoff when the server gives no hint."""
+        assert [retry_delay({}, attempt) for attempt in (0, 2, 10)] == [1.0, 4.0, 60.0]
+
+
+class TestSyncRetries:
+    """Test the retry policies mounted on the sync session."""
+
+    @pytest.fixture
+    def session(self):
+        return AppealsHistoryFetcher().session
+
+    def test_throttled_sources_are_retried(self, session):
+        """Test case-document hosts retry a 429, waiting at most MAX_RETRY_AFTER."""
+        retries = session.get_adapter("https://law.justia.com/cases/1").max_retries
+
+        assert retries.is_retry("GET", 429, has_retry_after=True)
+        assert retries.parse_retry_after("99999") == 300.0
+        assert retries.new(total=1).parse_retry_after("99999") == 300.0
+
+    def test_scholar_sees_429(self, session):
+        """Test the Google Scholar probe gets 429s back instead of retrying into them."""
+        retries = session.get_adapter("https://scholar.google.com/scholar_case?q=erisa").max_retries
+
+        assert not retries.is_retry("GET", 429, has_retry_after=True)
+
+
+class TestJSONLWriter:
+    """Test JSONLWriter output."""
+
+    def test_writes_one_line_per_document(self, tmp_path):
+        """Test each DOC is one parseable line and the directory is created."""
+        docs = [
+            DOC(category="Appeals", title=f"Decision {i}", doc_type=DocType.APPEAL_DECISION,
+                jurisdiction=Jurisdiction.STATE, version="1.0", url=f"https://example.com/{i}",
+                license="Public Domain", text=f"Decision text {i}")
+            for i in range(3)
+        ]
+        path = tmp_path / "appeals_iro" / "appeals_iro_decisions.jsonl"
+
+        with JSONLWriter(path) as writer:
+            for doc in docs:
+                writer.write(doc)
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert writer.count == 3
+        assert [DOC(**json.loads(line)).title for line in lines] == ["Decision 0", "Decision 1", "Decision 2"]
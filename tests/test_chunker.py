@@ -0,0 +1,85 @@
+"""Test hierarchical chunking."""
+
+import pytest
+
+from src.wyngai.chunk.hierarchical import HierarchicalChunker
+from src.wyngai.schemas import DOC, DocType, Jurisdiction
+
+
+def make_doc(text: str, doc_type: DocType = DocType.REGULATION, **kwargs) -> DOC:
+    """Build a minimal DOC for chunking."""
+    return DOC(
+        category=kwargs.pop("category", "Federal Regulations & Rulemaking"),
+        title="Test Document",
+        doc_type=doc_type,
+        jurisdiction=kwargs.pop("jurisdiction", Jurisdiction.FEDERAL),
+        version="1.0",
+        url="https://example.com",
+        license="Public Domain",
+        text=text,
+        **kwargs
+    )
+
+
+class TestHierarchicalChunker:
+    """Test HierarchicalChunker functionality."""
+
+    @pytest.fixture
+    def chunker(self):
+        return HierarchicalChunker()
+
+    def test_regulation_sections(self, chunker):
+        """Test CFR-style section boundaries."""
+        text = "Preamble text.\n§ 147.136 Internal claims\nBody one.\n(a) Scope of rule\nBody two."
+        sections = list(chunker._iter_sections(text, "reg"))
+
+        assert [s["section_path"] for s in sections] == [
+            [], ["§ 147.136 Internal claims"], ["(a) Scope of rule"]
+        ]
+        assert sections[0]["text"] == "Preamble text."
+        assert sections[1]["text"] == "§ 147.136 Internal claims\nBody one."
+
+    def test_manual_sections(self, chunker):
+        """Test numbered and all-caps headings in manuals."""
+        text = "Intro line.\n1. Introduction\nSome text.\nCOVERAGE\nMore text."
+        sections = list(chunker._iter_sections(text, "manual"))
+
+        assert [s["headings"] for s in sections] == [[], ["1. Introduction"], ["COVERAGE"]]
+
+    def test_court_sections(self, chunker):
+        """Test court opinion markers are case-insensitive."""
+        text = "Caption.\nI. BACKGROUND\nFacts.\nDiscussion\nAnalysis."
+        sections = list(chunker._iter_sections(text, "court_opinion"))
+
+        assert [s["headings"] for s in sections] == [[], ["I. BACKGROUND"], ["Discussion"]]
+
+    def test_extract_citations(self, chunker):
+        """Test statute, regulation and policy citations."""
+        text = ("See 45 CFR 147.136 and 29 U.S.C. § 1133; NCD 220.6, lcd 33.1, "
+                "CPB 0123 and CG-MED-21. Also 45 CFR 147.136 again.")
+        citations = chunker._extract_citations(text)
+
+        assert sorted(citations) == sorted([
+            "45 CFR 147.136", "29 U.S.C. § 1133", "NCD 220.6", "lcd 33.1", "CPB 0123", "CG-MED-21"
+        ])
+
+    def test_chunk_document(self, chunker):
+        """Test chunk metadata from a short regulation."""
+        doc = make_doc("§ 147.136 Appeals\nA plan must allow an appeal of a prior authorization denial.",
+                       tags=["appeals"])
+        chunks = chunker.chunk_document(doc)
+
+        assert len(chunks) == 1
+        assert chunks[0].doc_id == doc.doc_id
+        assert chunks[0].authority_rank == chunker.authority_ranking.federal_regulation
+        assert sorted(chunks[0].topics) == ["appeals", "prior_authorization"]
+
+    def test_long_section_is_split_with_overlap(self, chunker):
+        """Test sections longer than max_chunk_size are split and terminate."""
+        text = "This is one sentence of a long regulation. " * 150
+        doc = make_doc(text, doc_type=DocType.LAW)
+        chunks = list(chunker.iter_document_chunks(doc))
+
+        assert len(chunks) > 1
+        assert [c.ordinal for c in chunks] == list(range(len(chunks)))
+        assert all(len(c.text) <= chunker.max_chunk_size for c in chunks)
@@ -0,0 +1,59 @@
+"""Test enhanced RAG hybrid retrieval."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("hnswlib")
+
+import numpy as np
+
+from rag import enhanced_service
+from rag.enhanced_service import EnhancedRAGService
+
+
+CHUNK_TEXTS = [
+    "Prior authorization denials may be appealed within 180 days.",
+    "External review is available after internal appeals are exhausted.",
+    "Surprise billing protections limit out-of-network cost sharing.",
+    "Medical necessity criteria follow the plan's clinical policy.",
+    "Claims must be decided within 30 days for post-service requests.",
+    "Network adequacy standards are set by the state insurance department.",
+]
+
+
+class TestHybridRetrieve:
+    """Test EnhancedRAGService._hybrid_retrieve."""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(enhanced_service, "ANN_MIN_CHUNKS", 1)
+
+        service = EnhancedRAGService(index_dir=tmp_path)
+        service.chunk_ids = [f"chunk_{i}" for i in range(len(CHUNK_TEXTS))]
+        service.chunk_store = {
+            chunk_id: {"chunk_id": chunk_id, "text": text}
+            for chunk_id, text in zip(service.chunk_ids, CHUNK_TEXTS)
+        }
+        service.bm25_index = service._build_bm25_index(CHUNK_TEXTS)
+
+        embeddings = service._normalize_rows(
+            np.random.default_rng(0).standard_normal((len(CHUNK_TEXTS), 16)).astype(np.float32)
+        )
+        service.embedding_matrix, service.embedding_scale = service._quantize_int8(embeddings)
+        service.ann_index = service._build_ann_index(embeddings)
+        service.embeddings = embeddings
+        return service
+
+    def test_hnsw_candidates_resolve_to_chunks(self, service):
+        """Test retrieval through the HNSW index returns chunks, not an empty fallback."""
+        assert service.ann_index is not None
+
+        results = asyncio.run(service._hybrid_retrieve(
+            "appeal a prior authorization denial", max_results=3, query_embedding=service.embeddings[0]
+        ))
+
+        assert len(results) == 3
+        assert results[0]["chunk_id"] == "chunk_0"
+        assert all(isinstance(r["retrieval_score"], float) for r in results)
@@ -0,0 +1,73 @@
+"""Test the fetchers' HTTP response cache."""
+
+import pytest
+import requests
+
+from src.wyngai.utils.http_cache import HTTPCache
+
+
+class FakeSession:
+    """Minimal requests session serving one ETag-versioned JSON body."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append(headers or {})
+        response = requests.Response()
+        response.url = url
+        if (headers or {}).get('If-None-Match') == '"v1"':
+            response.status_code = 304
+        else:
+            response.status_code = 200
+            response._content = b'{"section": "147.136"}'
+            response.headers['ETag'] = '"v1"'
+        return response
+
+
+class TestHTTPCache:
+    """Test HTTPCache behavior."""
+
+    @pytest.fixture
+    def session(self):
+        return FakeSession()
+
+    def test_fresh_entry_skips_network(self, tmp_path, session):
+        """Test a fresh entry is served without a request."""
+        cache = HTTPCache(tmp_path)
+
+        first = cache.get(session, "https://example.com/render", params={'q': 'a'})
+        second = cache.get(session, "https://example.com/render", params={'q': 'a'})
+
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.json() == {"section": "147.136"}
+        assert len(session.calls) == 1
+
+    def test_stale_entry_is_revalidated(self, tmp_path, session):
+        """Test a stale entry sends If-None-Match and reuses the body on 304."""
+        cache = HTTPCache(tmp_path, expire_after=0)
+
+        cache.get(session, "https://example.com/render")
+        response = cache.get(session, "https://example.com/render")
+
+        assert session.calls[1] == {'If-None-Match': '"v1"'}
+        assert response.from_cache
+        assert response.json() == {"section": "147.136"}
+
+    def test_refresh_ignores_stored_entries(self, tmp_path, session):
+        """Test refresh=True always refetches."""
+        HTTPCache(tmp_path).get(session, "https://example.com/render")
+        response = HTTPCache(tmp_path, refresh=True).get(session, "https://example.com/render")
+
+        assert not response.from_cache
+        assert session.calls[1] == {}
+
+    def test_derived_data_is_stored_per_url(self, tmp_path):
+        """Test derived data round-trips and is keyed by URL and kind."""
+        cache = HTTPCache(tmp_path)
+        cache.store_derived("https://example.com/a", "doc.json", b'{"title": "A"}')
+
+        assert cache.read_derived("https://example.com/a", "doc.json") == b'{"title": "A"}'
+        assert cache.read_derived("https://example.com/b", "doc.json") is None
+        assert cache.read_derived("https://example.com/a", "other") is None
@@ -0,0 +1,46 @@
+"""Test the lite RAG service's retrieval scoring."""
+
+from uuid import uuid4
+
+import pytest
+
+from rag.service import QueryRequest, RAGService
+from src.wyngai.schemas import CHUNK
+
+
+CHUNK_TEXTS = [
+    "ERISA plans must decide claim appeals within 60 days of the appeal request.",
+    "Group health plans must give claimants 180 days to file an internal appeal.",
+    "Prior authorization requests for MRI imaging are reviewed for medical necessity.",
+    "Medical necessity reviews apply the plan clinical criteria to prior authorization.",
+    "External review by an independent review organization follows a final internal appeal.",
+    "The independent review organization decision is binding on the health plan.",
+]
+
+
+class TestFusedSearch:
+    """Test RAGService retrieval through /ask requests."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        service = RAGService(index_path=tmp_path / "index")
+        doc_id = uuid4()
+        service.index.build_index(
+            CHUNK(doc_id=doc_id, ordinal=i, char_start=0, char_end=len(text), text=text)
+            for i, text in enumerate(CHUNK_TEXTS)
+        )
+        service._index_ready = True
+        return service
+
+    def test_relevant_query_returns_sources(self, service):
+        """Test a question sharing key terms with a chunk returns it first."""
+        response = service.search(QueryRequest(question="prior authorization for MRI imaging"))
+
+        assert response.sources
+        assert response.sources[0].chunk_id == str(service.index.chunks[2].chunk_id)
+
+    def test_unrelated_query_returns_no_sources(self, service):
+        """Test a question overlapping only on common words is not answered from rank alone."""
+        response = service.search(QueryRequest(question="What is the weather on the coast today?"))
+
+        assert response.sources == []
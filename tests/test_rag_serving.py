@@ -0,0 +1,82 @@
+"""Test the RAG services' response cache and request batcher."""
+
+import asyncio
+
+import numpy as np
+
+from rag.serving import MicroBatcher, ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache behavior."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = ResponseCache(max_entries=2)
+        cache.put(("a", 5), "A")
+        cache.put(("b", 5), "B")
+        cache.get(("a", 5))
+        cache.put(("c", 5), "C")
+
+        assert cache.get(("a", 5)) == "A"
+        assert cache.get(("b", 5)) is None
+        assert cache.get(("c", 5)) == "C"
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test entries older than the TTL are dropped, and kept without one."""
+        clock = [100.0]
+        monkeypatch.setattr("rag.serving.time.monotonic", lambda: clock[0])
+        expiring = ResponseCache(ttl_seconds=10.0)
+        lasting = ResponseCache(ttl_seconds=None)
+        for cache in (expiring, lasting):
+            cache.put(("q", 5), "R")
+        clock[0] += 11.0
+
+        assert expiring.get(("q", 5)) is None
+        assert lasting.get(("q", 5)) == "R"
+
+    def test_similar_question_requires_same_parameters(self):
+        """Test soft hits need a close vector and identical non-question fields."""
+        cache = ResponseCache(similarity_threshold=0.95)
+        cache.put(("appeal deadline", 5), "R", np.array([1.0, 0.0], dtype=np.float32))
+        close = np.array([0.99, 0.1], dtype=np.float32)
+
+        assert cache.get_similar(("deadline to appeal", 5), close) == "R"
+        assert cache.get_similar(("deadline to appeal", 3), close) is None
+        assert cache.get_similar(("network adequacy", 5), np.array([0.0, 1.0], dtype=np.float32)) is None
+
+
+class TestMicroBatcher:
+    """Test MicroBatcher behavior."""
+
+    def test_coalesces_concurrent_items(self):
+        """Test concurrent submissions share one batch call and get their own outcome."""
+        batches = []
+
+        def process(items):
+            batches.append(items)
+            return [ValueError(item) if item == "bad" else item.upper() for item in items]
+
+        batcher = MicroBatcher(process, max_wait=0.05)
+
+        async def run():
+            return await asyncio.gather(*(batcher.submit(item) for item in ("a", "bad", "b")),
+                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert batches == [["a", "bad", "b"]]
+        assert results[0] == "A" and results[2] == "B"
+        assert isinstance(results[1], ValueError)
+
+    def test_batch_failure_reaches_every_caller(self):
+        """Test an exception from the batch call is raised to each caller."""
+        def process(items):
+            raise RuntimeError("encoder down")
+
+        batcher = MicroBatcher(process)
+
+        async def run():
+            return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
@@ -5,7 +5,7 @@ from pathlib import Path
 import tempfile
 import pandas as pd
 
-from src.wyngai.registry import RegistryManager
+from src.wyngai.registry import RegistryManager, get_registry_manager
 from src.wyngai.schemas import SourceRegistry
 
 
@@ -18,6 +18,10 @@ class TestRegistryManager:
         assert len(manager.sources) > 0
         assert all(isinstance(source, SourceRegistry) for source in manager.sources)
 
+    def test_shared_manager(self):
+        """Test get_registry_manager returns one instance per process."""
+        assert get_registry_manager() is get_registry_manager()
+
     def test_get_categories(self):
         """Test category extraction."""
         manager = RegistryManager()
@@ -164,6 +164,19 @@ class TestCHUNKSchema:
                 authority_rank=-0.1
             )
 
+    def test_chunk_text_lower(self):
+        """Test cached lowercase text is not serialized."""
+        chunk = CHUNK(
+            doc_id=UUID('12345678-1234-5678-1234-567812345678'),
+            ordinal=1,
+            char_start=0,
+            char_end=50,
+            text="Prior Authorization under ERISA"
+        )
+
+        assert chunk.text_lower == "prior authorization under erisa"
+        assert "text_lower" not in chunk.model_dump()
+
 
 class TestEnums:
     """Test enum values."""
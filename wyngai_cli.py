@@ -49,14 +49,15 @@ def discover():
 
 @discover.command("states")
 @click.option("--update-registry", is_flag=True, help="Update registry with discovered resources")
-def discover_states(update_registry: bool):
+@click.option("--write-xlsx", is_flag=True, help="Also rewrite the Excel registry (CSV is always updated)")
+def discover_states(update_registry: bool, write_xlsx: bool):
     """Discover state DOI resources using NAIC/USA.gov"""
     logger.info("🔍 Discovering state DOI resources...")
 
     from pipelines.state_discovery import StateResourceDiscovery
 
     discoverer = StateResourceDiscovery()
-    asyncio.run(discoverer.discover_all_states(update_registry=update_registry))
+    asyncio.run(discoverer.discover_all_states(update_registry=update_registry, write_xlsx=write_xlsx))
 
     logger.info("✅ State resource discovery completed")
 